@@ -0,0 +1,145 @@
+import heapq
+import math
+
+
+class ArbreDesPlusCourtsChemins:
+    """
+    Arbre des plus courts chemins depuis une source, tenu à jour au fil des modifications d'un DigraphePondere à
+    pondérations positives ou nulles.  L'arbre est abonné au graphe (voir DigraphePondere.abonner) et ne répare que la
+    partie touchée par chaque modification, plutôt que de relancer dijkstra:
+     - un ajout d'arête ou une baisse de pondération qui raccourcit un chemin relance Dijkstra à partir de la seule
+       arrivée de l'arête, sur les sommets dont la distance diminue;
+     - un retrait d'arête ou une hausse de pondération sur une arête de l'arbre invalide le sous-arbre qu'elle porte
+       (à la Ramalingam–Reps): ses sommets sont réamorcés par leurs prédécesseurs hors du sous-arbre, puis Dijkstra
+       est relancé sur ce seul sous-arbre.
+    Les autres modifications n'ont aucun effet sur l'arbre.
+    """
+
+    def __init__(self, graphe, source):
+        """
+        Calcule l'arbre initial avec dijkstra et s'abonne aux modifications du graphe.  Construit au besoin l'index des
+        prédécesseurs du graphe, nécessaire aux réparations.
+        :param graphe: DigraphePondere suivi
+        :param source: Numéro du sommet de départ
+        """
+        assert graphe.sommet_existe(source)
+        self.graphe = graphe
+        self.source = source
+        graphe.indexer_predecesseurs()
+        predecesseurs, distances = graphe.dijkstra(source)
+        self.predecesseurs = list(predecesseurs)
+        self.distances = list(distances)
+        graphe.abonner(self._sur_modification)
+
+    def detacher(self):
+        """Désabonne l'arbre du graphe: il cesse d'être tenu à jour."""
+        self.graphe.desabonner(self._sur_modification)
+
+    def distance(self, sommet):
+        """
+        :param sommet: Numéro du sommet d'arrivée
+        :return: La distance minimale depuis la source, math.inf si le sommet est inaccessible.
+        """
+        return self.distances[sommet]
+
+    def chemin_vers(self, sommet):
+        """
+        :param sommet: Numéro du sommet d'arrivée
+        :return: La liste des sommets d'un plus court chemin depuis la source, None si le sommet est inaccessible.
+        """
+        if self.distances[sommet] == math.inf:
+            return None
+        chemin = [sommet]
+        while chemin[-1] != self.source:
+            chemin.append(self.predecesseurs[chemin[-1]])
+        chemin.reverse()
+        return chemin
+
+    def _sur_modification(self, evenement, *details):
+        getattr(self, "_sur_" + evenement)(*details)
+
+    def _sur_ajout_sommet(self, sommet):
+        self.predecesseurs.append(None)
+        self.distances.append(math.inf)
+
+    def _sur_ajout_arete(self, source, dest, pond):
+        self._diminution(source, dest, pond)
+
+    def _sur_retrait_arete(self, source, dest, pond):
+        if self.predecesseurs[dest] == source:
+            self._reparer_sous_arbre(dest)
+
+    def _sur_ponderation(self, source, dest, ancienne, nouvelle):
+        if nouvelle < ancienne:
+            self._diminution(source, dest, nouvelle)
+        elif nouvelle > ancienne and self.predecesseurs[dest] == source:
+            self._reparer_sous_arbre(dest)
+
+    def _sur_retrait_sommet(self, sommet):
+        if sommet == self.source:
+            self.source = None
+            self.predecesseurs = [None for _ in self.predecesseurs]
+            self.distances = [math.inf for _ in self.distances]
+
+    def _sur_compactage(self, nouveaux):
+        predecesseurs = [None for _ in range(self.graphe.num_vertices)]
+        distances = [math.inf for _ in range(self.graphe.num_vertices)]
+        for ancien, nouveau in enumerate(nouveaux):
+            if nouveau is not None:
+                distances[nouveau] = self.distances[ancien]
+                if self.predecesseurs[ancien] is not None:
+                    predecesseurs[nouveau] = nouveaux[self.predecesseurs[ancien]]
+        if self.source is not None:
+            self.source = nouveaux[self.source]
+        self.predecesseurs, self.distances = predecesseurs, distances
+
+    def _diminution(self, source, dest, pond):
+        """Traite une arête (source, dest) nouvelle ou allégée, qui ne peut que raccourcir des chemins."""
+        if self.distances[source] + pond < self.distances[dest]:
+            self.distances[dest] = self.distances[source] + pond
+            self.predecesseurs[dest] = source
+            self._propager([(self.distances[dest], dest)])
+
+    def _reparer_sous_arbre(self, racine):
+        """
+        Recalcule les distances du sous-arbre enraciné en racine, dont l'arête d'arrivée vient d'être retirée ou
+        alourdie.  Seuls les sommets de ce sous-arbre peuvent voir leur distance augmenter.
+        """
+        touches = {racine}
+        pile = [racine] if self.graphe.sommet_existe(racine) else []
+        while pile:
+            courant = pile.pop()
+            for voisin in self.graphe._liste_adjacence_pour_le_sommet(courant):
+                if self.predecesseurs[voisin] == courant and voisin not in touches:
+                    touches.add(voisin)
+                    pile.append(voisin)
+        for sommet in touches:
+            self.distances[sommet] = math.inf
+            self.predecesseurs[sommet] = None
+        en_attente = []
+        for sommet in touches:
+            if not self.graphe.sommet_existe(sommet):
+                continue
+            for precedent, pond in self.graphe._liste_predecesseurs_du_sommet(sommet).items():
+                if precedent not in touches and self.distances[precedent] + pond < self.distances[sommet]:
+                    self.distances[sommet] = self.distances[precedent] + pond
+                    self.predecesseurs[sommet] = precedent
+            if self.distances[sommet] < math.inf:
+                en_attente.append((self.distances[sommet], sommet))
+        heapq.heapify(en_attente)
+        self._propager(en_attente)
+
+    def _propager(self, en_attente):
+        """
+        Dijkstra à partir d'un tas de sommets dont la distance vient de diminuer, limité aux sommets qu'il améliore.
+        :param en_attente: Tas de paires (distance, sommet)
+        """
+        while en_attente:
+            distance, courant = heapq.heappop(en_attente)
+            if distance > self.distances[courant]:
+                continue
+            for voisin, pond in self.graphe._aretes_ponderees_du_sommet(courant):
+                if distance + pond < self.distances[voisin]:
+                    self.distances[voisin] = distance + pond
+                    self.predecesseurs[voisin] = courant
+                    heapq.heappush(en_attente, (self.distances[voisin], voisin))
@@ -0,0 +1,95 @@
+import sys
+from collections import OrderedDict
+
+
+class CacheChemins:
+    """
+    Cache LRU des résultats (pred, dist) des recherches de chemins d'un graphe, borné en nombre d'entrées et,
+    facultativement, en octets.  Chaque résultat est associé à la version du graphe qui l'a produit: dès que le graphe
+    est modifié, sa version change et tout le cache est périmé, donc vidé à la consultation suivante.
+    """
+
+    def __init__(self, max_entrees=1024, max_octets=None):
+        """
+        :param max_entrees: Nombre maximal de résultats conservés
+        :param max_octets: Taille totale maximale estimée des résultats conservés, sans limite si None
+        """
+        assert max_entrees > 0
+        self.max_entrees = max_entrees
+        self.max_octets = max_octets
+        self._entrees = OrderedDict()
+        self._version = None
+        self.octets = 0
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _taille(resultat):
+        """
+        Estimation de la taille en mémoire d'un résultat (pred, dist): les deux listes et les flottants des distances,
+        les entiers et None étant en général partagés.
+        """
+        return sum(sys.getsizeof(liste) for liste in resultat) + \
+            sum(sys.getsizeof(valeur) for valeur in resultat[-1] if isinstance(valeur, float))
+
+    def _synchroniser(self, version):
+        """Vide le cache si la version du graphe a changé depuis le dernier accès."""
+        if version != self._version:
+            self.vider()
+            self._version = version
+
+    def obtenir(self, version, cle):
+        """
+        Cherche un résultat et le marque comme le plus récemment utilisé.
+        :param version: Version courante du graphe
+        :param cle: Clé identifiant l'algorithme et ses paramètres
+        :return: Le résultat, ou None s'il est absent ou périmé.
+        """
+        self._synchroniser(version)
+        resultat = self._entrees.get(cle)
+        if resultat is None:
+            self.echecs += 1
+            return None
+        self.succes += 1
+        self._entrees.move_to_end(cle)
+        return resultat[0]
+
+    def ranger(self, version, cle, resultat):
+        """
+        Conserve un résultat, en évinçant les moins récemment utilisés au besoin.  Un résultat plus gros que la limite
+        d'octets n'est pas conservé.
+        :param version: Version du graphe ayant produit le résultat
+        :param cle: Clé identifiant l'algorithme et ses paramètres
+        :param resultat: Le résultat à conserver
+        :return: None
+        """
+        self._synchroniser(version)
+        taille = self._taille(resultat)
+        if self.max_octets is not None and taille > self.max_octets:
+            return
+        ancien = self._entrees.pop(cle, None)
+        if ancien is not None:
+            self.octets -= ancien[1]
+        self._entrees[cle] = (resultat, taille)
+        self.octets += taille
+        while len(self._entrees) > self.max_entrees or \
+                (self.max_octets is not None and self.octets > self.max_octets):
+            _, (_, taille_evincee) = self._entrees.popitem(last=False)
+            self.octets -= taille_evincee
+            self.evictions += 1
+
+    def vider(self):
+        """Retire tous les résultats, sans toucher aux statistiques."""
+        self._entrees.clear()
+        self.octets = 0
+
+    def __len__(self):
+        return len(self._entrees)
+
+    def statistiques(self):
+        """
+        :return: Un dictionnaire des compteurs: succes, echecs, evictions, entrees et octets.
+        """
+        return {"succes": self.succes, "echecs": self.echecs, "evictions": self.evictions,
+                "entrees": len(self._entrees), "octets": self.octets}
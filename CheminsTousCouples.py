@@ -0,0 +1,147 @@
+"""
+Plus courts chemins entre tous les couples de sommets (algorithme de Johnson), répartis sur un groupe de processus.
+
+Les pondérations sont d'abord rendues positives une fois pour toutes à l'aide de potentiels calculés par SPFA depuis
+un sommet virtuel relié à tous les autres.  Le graphe repondéré est ensuite copié, en format CSR, dans un bloc de
+mémoire partagée (multiprocessing.shared_memory) que chaque processus projette sans copie ni sérialisation, puis les
+Dijkstra par source y sont distribués par lots.  Les rangées de la matrice des distances sont rendues une à une, dans
+l'ordre des sources, et au plus quelques lots par processus sont en attente à la fois.
+"""
+import math
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from DigraphePondereFige import DigraphePondereFige
+
+_graphe_partage = None
+_potentiels_partages = None
+_memoire_partagee = None
+
+
+def _potentiels(fige):
+    """
+    Potentiels de Johnson: h[v] est la distance depuis un sommet virtuel relié à chaque sommet par une arête de poids
+    nul.  Toutes les pondérations w(u, v) + h[u] - h[v] sont alors positives ou nulles.
+    :param fige: Graphe pondéré figé
+    :return: array('d') des potentiels, nuls si aucune pondération n'est négative.
+    :raises: CycleNegatif si le graphe contient un cycle de poids négatif.
+    """
+    if all(pond >= 0 for pond in fige.weights):
+        return array('d', bytes(8 * fige.num_vertices))
+    virtuel = fige.num_vertices
+    vivants = array('q', fige.sommets())
+    offsets = array('q', fige.offsets)
+    offsets.append(offsets[-1] + len(vivants))
+    targets = array('q', fige.targets)
+    targets.extend(vivants)
+    weights = array('d', fige.weights)
+    weights.extend(0.0 for _ in vivants)
+    augmente = DigraphePondereFige(offsets, targets, weights, bytearray(fige._retires) + bytearray(1))
+    _, distances = augmente.spfa(virtuel)
+    return array('d', distances[:virtuel])
+
+
+def _repondere(fige, potentiels):
+    """
+    Pondérations de Johnson w(u, v) + h[u] - h[v], ramenées à zéro si l'arrondi les rend très légèrement négatives.
+    :return: array('d') parallèle à fige.targets
+    """
+    repondere = array('d', fige.weights)
+    for source in fige.sommets():
+        for position in range(fige.offsets[source], fige.offsets[source + 1]):
+            pond = repondere[position] + potentiels[source] - potentiels[fige.targets[position]]
+            repondere[position] = max(pond, 0.0)
+    return repondere
+
+
+def _vers_memoire_partagee(fige, repondere, potentiels):
+    """
+    Copie le graphe repondéré et ses potentiels dans un nouveau bloc de mémoire partagée.  Disposition: offsets (q),
+    targets (q), weights (d), potentiels (d), puis une marque de retrait par sommet (octets).
+    :return: Le bloc créé, à libérer par l'appelant.
+    """
+    nb_sommets, nb_aretes = fige.num_vertices, len(fige.targets)
+    memoire = SharedMemory(create=True, size=max(1, 8 * (2 * nb_sommets + 1 + 2 * nb_aretes) + nb_sommets))
+    for vue, contenu in zip(_vues(memoire.buf, nb_sommets, nb_aretes),
+                            (fige.offsets, fige.targets, repondere, potentiels, fige._retires)):
+        vue[:] = memoryview(contenu).cast('B').cast(vue.format)
+        vue.release()
+    return memoire
+
+
+def _vues(tampon, nb_sommets, nb_aretes):
+    """Découpe un tampon selon la disposition de _vers_memoire_partagee."""
+    bornes = [0, 8 * (nb_sommets + 1), 8 * nb_aretes, 8 * nb_aretes, 8 * nb_sommets, nb_sommets]
+    for i in range(1, len(bornes)):
+        bornes[i] += bornes[i - 1]
+    formats = ['q', 'q', 'd', 'd', 'B']
+    return [tampon[bornes[i]:bornes[i + 1]].cast(formats[i]) for i in range(len(formats))]
+
+
+def _attacher(nom, nb_sommets, nb_aretes):
+    """Initialisation d'un processus: projette le graphe partagé, sans le copier."""
+    global _graphe_partage, _potentiels_partages, _memoire_partagee
+    _memoire_partagee = SharedMemory(name=nom)
+    offsets, targets, weights, potentiels, retires = _vues(_memoire_partagee.buf, nb_sommets, nb_aretes)
+    _graphe_partage = DigraphePondereFige(offsets, targets, weights, bytearray(retires))
+    _potentiels_partages = potentiels
+
+
+def _rangees(graphe, potentiels, sources):
+    """
+    Dijkstra sur le graphe repondéré pour chaque source, puis correction des distances par les potentiels.
+    :return: Liste de paires (source, array('d') des distances)
+    """
+    resultats = []
+    for source in sources:
+        _, distances = graphe.dijkstra(source)
+        correction = potentiels[source]
+        resultats.append((source, array('d', (d - correction + potentiels[v] if d != math.inf else math.inf
+                                              for v, d in enumerate(distances)))))
+    return resultats
+
+
+def _rangees_partagees(sources):
+    return _rangees(_graphe_partage, _potentiels_partages, sources)
+
+
+def plus_courts_chemins_tous_couples(graphe, sources=None, processus=None, taille_lot=16):
+    """
+    Voir DigraphePondere.plus_courts_chemins_tous_couples.
+    """
+    fige = graphe.figer()
+    sources = list(fige.sommets() if sources is None else sources)
+    assert all(fige.sommet_existe(source) for source in sources)
+    potentiels = _potentiels(fige)
+    repondere = _repondere(fige, potentiels)
+    lots = [sources[i:i + taille_lot] for i in range(0, len(sources), taille_lot)]
+    if processus is None:
+        processus = os.cpu_count() or 1
+    if processus <= 1 or len(lots) <= 1:
+        local = DigraphePondereFige(fige.offsets, fige.targets, repondere, fige._retires)
+        for lot in lots:
+            yield from _rangees(local, potentiels, lot)
+        return
+    memoire = _vers_memoire_partagee(fige, repondere, potentiels)
+    del repondere
+    try:
+        with ProcessPoolExecutor(max_workers=processus, initializer=_attacher,
+                                 initargs=(memoire.name, fige.num_vertices, len(fige.targets))) as executeur:
+            en_attente = deque()
+            lots_restants = iter(lots)
+            for lot in lots_restants:
+                en_attente.append(executeur.submit(_rangees_partagees, lot))
+                if len(en_attente) >= 2 * processus:
+                    break
+            while en_attente:
+                resultat = en_attente.popleft().result()
+                prochain = next(lots_restants, None)
+                if prochain is not None:
+                    en_attente.append(executeur.submit(_rangees_partagees, prochain))
+                yield from resultat
+    finally:
+        memoire.close()
+        memoire.unlink()
@@ -0,0 +1,194 @@
+from array import array
+
+from DigrapheNonPondere import DigrapheNonPondere
+
+
+class DigrapheFige(DigrapheNonPondere):
+    """
+    Digraphe non-pondéré en lecture seule, stocké en format CSR (compressed sparse row): les voisins du sommet s sont
+    targets[offsets[s]:offsets[s + 1]].  Les deux tableaux sont des array('q') contigus, ce qui évite une liste Python
+    et un entier boxé par arête.  Toutes les méthodes de consultation et tous les algorithmes du digraphe mutable sont
+    disponibles; les méthodes de modification lèvent TypeError.
+    """
+
+    _ARITE_INDEXEE = 64
+
+    @staticmethod
+    def tableaux_csr(graphe):
+        """
+        Construit les tableaux CSR d'un digraphe quelconque.
+        :param graphe: Digraphe source
+        :return: (offsets, targets) deux array('q'), de longueurs respectives num_vertices + 1 et nombre d'arêtes.
+        """
+        offsets = array('q', [0])
+        targets = array('q')
+        for sommet in range(graphe.num_vertices):
+            if graphe.sommet_existe(sommet):
+                targets.extend(graphe._liste_adjacence_pour_le_sommet(sommet))
+            offsets.append(len(targets))
+        return offsets, targets
+
+    @staticmethod
+    def depuis_matrice_creuse(matrice):
+        """
+        Construit un digraphe figé d'après une matrice creuse SciPy carrée: une arête s -> d par élément (s, d) stocké.
+        :param matrice: Matrice creuse
+        :return: Le digraphe figé
+        :raises: ImportError si SciPy n'est pas installé.
+        """
+        from MatriceCreuse import tableaux_depuis_matrice_creuse
+        return DigrapheFige(*tableaux_depuis_matrice_creuse(matrice, False))
+
+    def __init__(self, offsets, targets, retires=None):
+        """
+        Construit un digraphe figé à partir de ses tableaux CSR.
+        :param offsets: Tableau de num_vertices + 1 entiers croissants, débutant à 0 et finissant à len(targets).
+        :param targets: Tableau des destinations, rangées par sommet source.
+        :param retires: Marques facultatives (bytearray) des sommets retirés en différé, sans arête.
+        """
+        self.num_vertices = len(offsets) - 1
+        self._retires = bytearray(self.num_vertices) if retires is None else retires
+        self._nb_retires = self._retires.count(1)
+        self.offsets = offsets
+        self.targets = targets
+        self._vue_targets = memoryview(targets)
+        self._positions = {}
+        self._inverse = None
+        self._version = 0
+        self._cache = None
+        self._abonnes = []
+        self._statistiques = None
+        assert(self._invariant())
+
+    def _invariant(self):
+        """
+        Vérifie la validité des tableaux CSR: offsets croissants bornés par le nombre d'arêtes, destinations valides et
+        uniques pour chaque sommet.
+        :return: True si le digraphe est valide.
+        """
+        if self.num_vertices < 0 or self.offsets[0] != 0 or self.offsets[-1] != len(self.targets):
+            return False
+        if len(self._retires) != self.num_vertices:
+            return False
+        for sommet in range(self.num_vertices):
+            debut, fin = self.offsets[sommet], self.offsets[sommet + 1]
+            if debut > fin:
+                return False
+            voisins = self._vue_targets[debut:fin]
+            if len(set(voisins)) != fin - debut:
+                return False
+            if not all(self._numero_de_sommet_est_valide(voisin) for voisin in voisins):
+                return False
+        return True
+
+    def _liste_adjacence_pour_le_sommet(self, sommet):
+        assert(self._numero_de_sommet_est_valide(sommet))
+        return self._vue_targets[self.offsets[sommet]:self.offsets[sommet + 1]]
+
+    def _position_de_l_arete(self, source, dest):
+        """
+        Indice de l'arête (source, dest) dans targets, sans copier la ligne du sommet source.  Une ligne de plus de
+        _ARITE_INDEXEE voisins est consultée par un dictionnaire des positions construit au premier besoin, comme pour
+        le digraphe mutable; une ligne courte est parcourue par array.index, ou directement si targets est une
+        memoryview sur de la mémoire partagée ou projetée.
+        :return: L'indice, ou -1 si l'arête n'existe pas.
+        """
+        debut, fin = self.offsets[source], self.offsets[source + 1]
+        if fin - debut > self._ARITE_INDEXEE:
+            positions = self._positions.get(source)
+            if positions is None:
+                positions = {voisin: position for position, voisin in enumerate(self._vue_targets[debut:fin], debut)}
+                self._positions[source] = positions
+            return positions.get(dest, -1)
+        if isinstance(self.targets, array):
+            try:
+                return self.targets.index(dest, debut, fin)
+            except ValueError:
+                return -1
+        for position, voisin in enumerate(self._vue_targets[debut:fin], debut):
+            if voisin == dest:
+                return position
+        return -1
+
+    def arete_existe(self, source, dest):
+        assert(self._numero_de_sommet_est_valide(source) and self._numero_de_sommet_est_valide(dest))
+        return self._position_de_l_arete(source, dest) >= 0
+
+    def arite_entree_du_sommet(self, sommet):
+        """
+        Retourne l'arité d'entrée du sommet demandé: en O(1) si le graphe inverse a déjà été construit pour une
+        recherche des prédécesseurs, sinon par un décompte de targets en O(E), sans construire ni conserver d'inverse.
+        """
+        assert(self._numero_de_sommet_est_valide(sommet))
+        if self._inverse is not None:
+            return self._inverse.arite_sortie_du_sommet(sommet)
+        if isinstance(self.targets, array):
+            return self.targets.count(sommet)
+        return sum(1 for voisin in self._vue_targets if voisin == sommet)
+
+    def arite_sortie_du_sommet(self, sommet):
+        assert(self._numero_de_sommet_est_valide(sommet))
+        return self.offsets[sommet + 1] - self.offsets[sommet]
+
+    def _modification_interdite(self, *args, **kwargs):
+        raise TypeError(f"Un {type(self).__name__} est en lecture seule et ne peut pas être modifié.")
+
+    ajouter_sommet = _modification_interdite
+    ajouter_arete = _modification_interdite
+    retirer_arete = _modification_interdite
+    retirer_sommet = _modification_interdite
+    compacter = _modification_interdite
+    modifier_ponderation = _modification_interdite
+    ajouter_aretes = _modification_interdite
+    retirer_aretes = _modification_interdite
+    modifications = _modification_interdite
+    indexer_predecesseurs = _modification_interdite
+    maintenir_ordre_topologique = _modification_interdite
+
+    def ordre_topologique(self):
+        return self.tri_topologique_kahn()
+
+    def _sources_inverses(self):
+        """
+        Tri par dénombrement des arêtes selon leur destination, base du graphe inverse.
+        :return: (offsets, sources, positions) où sources[offsets[d]:offsets[d + 1]] sont les sources des arêtes
+        arrivant en d, en ordre croissant de source, et positions les indices correspondants dans targets.
+        """
+        offsets = array('q', bytes(8 * (self.num_vertices + 1)))
+        for dest in self.targets:
+            offsets[dest + 1] += 1
+        for sommet in range(self.num_vertices):
+            offsets[sommet + 1] += offsets[sommet]
+        prochains = array('q', offsets[:-1])
+        sources = array('q', bytes(8 * len(self.targets)))
+        positions = array('q', bytes(8 * len(self.targets)))
+        for source in range(self.num_vertices):
+            for position in range(self.offsets[source], self.offsets[source + 1]):
+                dest = self.targets[position]
+                sources[prochains[dest]] = source
+                positions[prochains[dest]] = position
+                prochains[dest] += 1
+        return offsets, sources, positions
+
+    def graphe_inverse(self):
+        """
+        Retourne le graphe inverse, lui aussi figé, construit en O(V+E) sans passer par une liste d'arêtes.
+        :return: Le graphe inverse
+        """
+        offsets, sources, _ = self._sources_inverses()
+        return DigrapheFige(offsets, sources, self._retires)
+
+    def _predecesseurs_pour_requete(self):
+        return self._liste_predecesseurs_du_sommet
+
+    def _liste_predecesseurs_du_sommet(self, sommet):
+        assert(self._numero_de_sommet_est_valide(sommet))
+        if self._inverse is None:
+            self._inverse = self.graphe_inverse()
+        return self._inverse._liste_adjacence_pour_le_sommet(sommet)
+
+    def figer(self):
+        return self
+
+    def instantane(self):
+        return self
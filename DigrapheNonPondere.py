@@ -1,11 +1,15 @@
 import sys
-from typing import List
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set
 
 
 class DigrapheNonPondere:
     """
     Modélise un digraphe non-pondéré, soit un ensemble de sommets, représentés par des numéros consécutifs, reliés
-    entre eux par des arêtes.
+    entre eux par des arêtes.  La liste d'adjacence de chaque sommet est un dictionnaire {voisin: valeur}: l'ordre
+    d'insertion des arêtes est conservé, et l'appartenance comme le retrait d'une arête se font en O(1).  La valeur
+    est None pour un digraphe non-pondéré, et la pondération de l'arête pour un digraphe pondéré.
     """
 
     @staticmethod
@@ -17,66 +21,349 @@ class DigrapheNonPondere:
         Construit un digraphe non-pondéré avec le nombre de sommets désirés et une liste de tuples représentant des
         arêtes selon le schéma (source, destination).
         :param vertices: Nombre de sommets demandés, peut être nul.  Les sommets seront numérotés consécutivement de
-        0 à vertices-1.
-        :param edges: Listes des tuples (source, destination) signalant une arête.  Chaque arête doit être unique et
-        constituée de numéros d'arête valides (< vertices)
+        0 à vertices-1.  Si None, le nombre de sommets est déduit des arêtes: le plus grand numéro rencontré plus un.
+        :param edges: Itérable des tuples (source, destination) signalant une arête, parcouru une seule fois et sans
+        être copié: un générateur convient.  Chaque arête doit être unique et constituée de numéros d'arête valides
+        (< vertices)
         """
         if vertices is None:
             self.num_vertices = 0
         else:
             self.num_vertices = vertices
-        self.lists: List[List[int]] = [[] for _ in range(self.num_vertices)]
+        self.lists: List[Dict[int, object]] = [{} for _ in range(self.num_vertices)]
+        self._retires = bytearray(self.num_vertices)
         if edges is not None:
-            for edge in edges:
-                self.lists[edge[0]].append(edge[1])
+            self._remplir(edges, vertices is None)
+        self._modifies: Optional[Set[int]] = None
+        self._inverses: Optional[List[Dict[int, object]]] = None
+        self._ordre: Optional[List[int]] = None
+        self._rangs: Optional[List[int]] = None
+        self._nb_retires = 0
+        self._version = 0
+        self._cache = None
+        self._abonnes = []
+        self._statistiques = None
+        self._partages: Optional[bytearray] = None
 
         assert(self._invariant())
 
+    @staticmethod
+    def depuis_fichier_aretes(fichier, vertices=None, separateur=None, entete=False):
+        """
+        Construit un digraphe d'après un fichier de liste d'arêtes, une arête "source destination" par ligne, lu au fil
+        de l'eau sans conserver la liste des arêtes.  Voir le module FichierAretes pour le format.
+        :param fichier: Chemin du fichier, éventuellement compressé par gzip
+        :param vertices: Nombre de sommets, déduit des arêtes si None
+        :param separateur: Séparateur des colonnes; par défaut, espaces, tabulations ou virgules
+        :param entete: True pour sauter une ligne d'entête
+        :return: Le digraphe
+        :raises: ValueError si une ligne n'est pas une arête.
+        """
+        from FichierAretes import lire_aretes
+        return DigrapheNonPondere(vertices, lire_aretes(fichier, separateur, entete, False))
+
+    def _valeur_de_l_arete(self, arete):
+        """Valeur rangée dans la liste d'adjacence pour une arête (source, destination, ...) fournie en entrée."""
+        return None
+
+    def _remplir(self, aretes, grandir):
+        """
+        Range des arêtes dans les listes d'adjacence, sans validation ni notification: réservé à la construction.
+        :param aretes: Itérable des arêtes, parcouru une seule fois
+        :param grandir: True pour ajouter les sommets manquants au fil des numéros rencontrés
+        :return: None
+        """
+        lists = self.lists
+        for arete in aretes:
+            source, dest = arete[0], arete[1]
+            assert(source >= 0 and dest >= 0)
+            if grandir and max(source, dest) >= self.num_vertices:
+                manquants = max(source, dest) + 1 - self.num_vertices
+                lists.extend({} for _ in range(manquants))
+                self._retires.extend(bytes(manquants))
+                self.num_vertices += manquants
+            assert(dest not in lists[source])
+            lists[source][dest] = self._valeur_de_l_arete(arete)
+
     def __str__(self):
-        resultat = ""
-        for i in range(self.num_vertices):
-            resultat += f"{i} -->"
-            for j in range(len(self.lists[i])):
-                resultat += f" {self.lists[i][j]}"
-                if j < len(self.lists[i]) - 1:
-                    resultat += " - "
-            if i < self.num_vertices - 1:
-                resultat += "\n"
-        return resultat
+        return "\n".join(f"{i} -->" + " - ".join(f" {voisin}" for voisin in self._liste_adjacence_pour_le_sommet(i))
+                         for i in self.sommets())
 
     def _numero_de_sommet_est_valide(self, n):
-        """Retourne True si le paramètre n est un numéro de sommet valide."""
-        return n < self.num_vertices
+        """Retourne True si le paramètre n est un numéro de sommet valide, et que ce sommet n'a pas été retiré."""
+        return 0 <= n < self.num_vertices and not self._retires[n]
+
+    def sommets(self):
+        """
+        Énumère les sommets existants.  Les numéros des sommets retirés en différé sont sautés jusqu'au prochain
+        compacter().
+        :return: Un itérable croissant des numéros de sommet valides.
+        """
+        if not self._nb_retires:
+            return range(self.num_vertices)
+        return (sommet for sommet in range(self.num_vertices) if not self._retires[sommet])
+
+    def nombre_de_sommets(self):
+        """Retourne le nombre de sommets existants, soit num_vertices moins les sommets retirés en différé."""
+        return self.num_vertices - self._nb_retires
 
     def _invariant(self):
         """
         Vérifie les conditions de validité du digraphe: pour chaque liste d'adjacence, chaque élément est un numéro de
-        sommet valide, et est unique.
+        sommet valide, et est unique (ce que garantit le dictionnaire).
         :return: True si le digraphe est valide.
         """
-        if self.num_vertices != len(self.lists):
+        return self._invariant_des_sommets(range(self.num_vertices))
+
+    def _invariant_des_sommets(self, sommets):
+        """
+        Version locale de l'invariant, limitée aux listes d'adjacence des sommets donnés.  Les numéros devenus invalides
+        (sommets retirés depuis) sont ignorés.
+        :param sommets: Itérable des sommets à vérifier
+        :return: True si les listes de ces sommets sont valides.
+        """
+        if self.num_vertices != len(self.lists) or self.num_vertices != len(self._retires):
             return False
-        for liste in self.lists:
-            x = set()
-            for sommet in liste:
-                if self._numero_de_sommet_est_valide(sommet) and sommet not in x:
-                    x.add(sommet)
-                else:
+        for sommet in sommets:
+            if self._numero_de_sommet_est_valide(sommet):
+                if not all(self._numero_de_sommet_est_valide(dest) for dest in self.lists[sommet]):
                     return False
+        if self._inverses is not None:
+            if len(self._inverses) != self.num_vertices:
+                return False
+            for sommet in sommets:
+                if self._numero_de_sommet_est_valide(sommet):
+                    for dest, valeur in self.lists[sommet].items():
+                        if sommet not in self._inverses[dest] or self._inverses[dest][sommet] != valeur:
+                            return False
+                    for source in self._inverses[sommet]:
+                        if sommet not in self.lists[source]:
+                            return False
+        if self._ordre is not None:
+            if len(self._ordre) != self.num_vertices or len(self._rangs) != self.num_vertices:
+                return False
+            for sommet in sommets:
+                if self._numero_de_sommet_est_valide(sommet):
+                    if self._ordre[self._rangs[sommet]] != sommet:
+                        return False
+                    if any(self._rangs[dest] <= self._rangs[sommet] for dest in self.lists[sommet]):
+                        return False
         return True
 
+    def _verifier_modification(self, *sommets):
+        """
+        Appelée à la fin de chaque modification.  Hors d'un bloc modifications(), vérifie l'invariant complet; dans un
+        bloc, retient seulement les sommets touchés pour une vérification unique à la sortie du bloc.
+        :param sommets: Sommets dont la liste d'adjacence a été modifiée
+        :return: None
+        """
+        self._version += 1
+        if self._modifies is None:
+            if self._statistiques is None:
+                assert(self._invariant())
+            else:
+                assert(self._statistiques.chronometrer_invariant(self._invariant))
+        else:
+            self._modifies.update(sommets)
+
+    def abonner(self, rappel):
+        """
+        Inscrit un observateur des modifications du graphe.  Après chaque modification, rappel(evenement, *details)
+        est appelé avec l'un des événements suivants:
+        ("ajout_sommet", sommet), ("ajout_arete", source, dest, valeur), ("retrait_arete", source, dest, valeur),
+        ("ponderation", source, dest, ancienne, nouvelle), ("retrait_sommet", sommet) et ("compactage", nouveaux).
+        Le retrait d'un sommet émet d'abord un retrait_arete pour chacune de ses arêtes.
+        :param rappel: Fonction à appeler
+        :return: None
+        """
+        self._abonnes.append(rappel)
+
+    def desabonner(self, rappel):
+        """Retire un observateur inscrit par abonner()."""
+        self._abonnes.remove(rappel)
+
+    def _notifier(self, *evenement):
+        """Transmet un événement de modification aux observateurs."""
+        for rappel in self._abonnes:
+            rappel(*evenement)
+
+    def version(self):
+        """
+        Compteur de versions, incrémenté par chaque modification du graphe (y compris dans un bloc modifications()).
+        :return: La version courante
+        """
+        return self._version
+
+    def activer_cache(self, max_entrees=1024, max_octets=None):
+        """
+        Mémorise les résultats (pred, dist) des recherches de chemins par algorithme et par source, dans un cache LRU
+        invalidé par toute modification du graphe.  Les résultats rendus depuis le cache sont partagés entre les
+        appelants et ne doivent pas être modifiés.
+        :param max_entrees: Nombre maximal de résultats conservés
+        :param max_octets: Taille totale maximale estimée des résultats conservés, sans limite si None
+        :return: Le CacheChemins, qui expose ses statistiques.
+        """
+        from CacheChemins import CacheChemins
+        self._cache = CacheChemins(max_entrees, max_octets)
+        return self._cache
+
+    def desactiver_cache(self):
+        """Abandonne le cache des recherches de chemins."""
+        self._cache = None
+
+    def _avec_cache(self, cle, calcul):
+        """
+        Rend le résultat mémorisé pour cle à la version courante s'il existe, sinon l'obtient par calcul() et le
+        mémorise.  Sans cache, appelle simplement calcul().
+        """
+        if self._cache is None:
+            return calcul()
+        resultat = self._cache.obtenir(self._version, cle)
+        if resultat is None:
+            resultat = calcul()
+            self._cache.ranger(self._version, cle, resultat)
+        return resultat
+
+    @contextmanager
+    def instrumenter(self, statistiques=None):
+        """
+        Gestionnaire de contexte activant l'instrumentation des algorithmes et des vérifications d'invariant du graphe
+        pendant le bloc.  Voir le module Statistiques pour les compteurs.
+        Exemple: with g.instrumenter() as stats: g.kosaraju()
+        :param statistiques: Collecteur à alimenter, un nouveau Statistiques si None
+        :return: Le collecteur
+        """
+        if statistiques is None:
+            from Statistiques import Statistiques
+            statistiques = Statistiques()
+        precedentes = self._statistiques
+        self._statistiques = statistiques
+        try:
+            yield statistiques
+        finally:
+            self._statistiques = precedentes
+
+    def _mesurer(self, nom, statistiques, calcul):
+        """
+        Appelle calcul() en l'instrumentant sous le nom donné si un collecteur est fourni ou actif, et simplement sinon.
+        """
+        if statistiques is None:
+            if self._statistiques is None:
+                return calcul()
+            return self._statistiques.mesurer(nom, calcul)
+        with self.instrumenter(statistiques):
+            return statistiques.mesurer(nom, calcul)
+
+    def rechauffer_cache(self, sources, algorithme="explorer_en_largeur_en_partant_du_sommet"):
+        """
+        Précalcule et met en cache les résultats d'un algorithme pour une liste de sources.
+        :param sources: Itérable des sommets de départ
+        :param algorithme: Nom de la méthode à appeler pour chaque source, par exemple "dijkstra"
+        :return: None
+        """
+        assert(self._cache is not None)
+        for source in sources:
+            getattr(self, algorithme)(source)
+
+    @contextmanager
+    def modifications(self):
+        """
+        Gestionnaire de contexte regroupant des modifications: l'invariant n'est vérifié qu'une fois, à la sortie du
+        bloc, et seulement sur les sommets touchés.  Les blocs peuvent être imbriqués, seul le plus externe vérifie.
+        Exemple: with g.modifications(): g.ajouter_arete(0, 1); g.ajouter_arete(1, 2)
+        :return: Le digraphe lui-même
+        """
+        if self._modifies is not None:
+            yield self
+            return
+        self._modifies = set()
+        try:
+            yield self
+        finally:
+            touches = self._modifies
+            self._modifies = None
+        if self._statistiques is None:
+            assert(self._invariant_des_sommets(touches))
+        else:
+            assert(self._statistiques.chronometrer_invariant(lambda: self._invariant_des_sommets(touches)))
+
     def _liste_adjacence_pour_le_sommet(self, sommet):
+        """
+        Point d'accès unique des algorithmes à la liste d'adjacence d'un sommet.  Les représentations dérivées (par
+        exemple figées) le redéfinissent sans avoir à réécrire les algorithmes.
+        :param sommet: Numéro du sommet
+        :return: Un itérable des voisins du sommet, dans l'ordre d'insertion des arêtes, supportant in et len en O(1).
+        """
         assert(self._numero_de_sommet_est_valide(sommet))
         return self.lists[sommet]
 
+    def _liste_modifiable(self, sommet):
+        """
+        Liste d'adjacence d'un sommet, prête à être modifiée: si elle est partagée avec un instantané, elle est d'abord
+        remplacée par une copie (copie sur écriture).
+        :param sommet: Numéro du sommet
+        :return: Le dictionnaire d'adjacence propre au graphe
+        """
+        if self._partages is not None and self._partages[sommet]:
+            self.lists[sommet] = dict(self.lists[sommet])
+            self._partages[sommet] = 0
+        return self.lists[sommet]
+
+    def instantane(self):
+        """
+        Instantané en lecture seule de l'état courant du graphe, pour des lectures concurrentes pendant que le graphe
+        continue d'être modifié.  La création ne copie que la liste des références aux listes d'adjacence, en O(V):
+        les listes sont partagées, puis copiées par le graphe à sa première modification de chacune (copie sur
+        écriture).  L'instantané ne voit donc jamais les modifications ultérieures.  Voir le module Instantane.
+        NB: à appeler entre deux modifications, depuis le fil qui modifie le graphe.
+        :return: Un Instantane, ou un InstantanePondere pour un digraphe pondéré.
+        """
+        from Instantane import prendre_instantane
+        return prendre_instantane(self)
+
+    def indexer_predecesseurs(self):
+        """
+        Construit l'index inverse (listes de prédécesseurs), maintenu ensuite par toutes les modifications.  L'arité
+        d'entrée devient O(1) et graphe_inverse() une vue sans copie.  Chaque prédécesseur porte la même valeur que
+        l'arête correspondante (sa pondération pour un digraphe pondéré).
+        :return: Le digraphe lui-même
+        """
+        if self._inverses is None:
+            self._inverses = [{} for _ in range(self.num_vertices)]
+            for source in range(self.num_vertices):
+                for dest, valeur in self.lists[source].items():
+                    self._inverses[dest][source] = valeur
+        return self
+
+    def _inserer_arete(self, source, dest, valeur):
+        """
+        Range l'arête et sa valeur dans la liste d'adjacence et, s'il existe, dans l'index inverse.  Si l'ordre
+        topologique est maintenu, il est d'abord réparé, ce qui lève ValueError sans rien modifier si l'arête fermerait
+        un cycle.
+        """
+        if self._rangs is not None and self._rangs[dest] <= self._rangs[source]:
+            self._reordonner_pour_arete(source, dest)
+        self._liste_modifiable(source)[dest] = valeur
+        if self._inverses is not None:
+            self._inverses[dest][source] = valeur
+
     def ajouter_sommet(self):
         """
         Ajouter un sommet au graphe.
         :return:  None
         """
-        self.lists.append([])
+        self.lists.append({})
+        self._retires.append(0)
+        if self._partages is not None:
+            self._partages.append(0)
+        if self._inverses is not None:
+            self._inverses.append({})
+        if self._ordre is not None:
+            self._rangs.append(len(self._ordre))
+            self._ordre.append(self.num_vertices)
         self.num_vertices += 1
-        assert(self._invariant())
+        self._verifier_modification(self.num_vertices - 1)
+        self._notifier("ajout_sommet", self.num_vertices - 1)
 
     def sommet_existe(self, n):
         """
@@ -94,7 +381,7 @@ class DigrapheNonPondere:
         :return: True si une arête existe entre source et dest
         """
         assert(self._numero_de_sommet_est_valide(source) and self._numero_de_sommet_est_valide(dest))
-        return dest in self.lists[source]
+        return dest in self._liste_adjacence_pour_le_sommet(source)
 
     def ajouter_arete(self, source, dest, *args):
         """
@@ -104,8 +391,9 @@ class DigrapheNonPondere:
         :return: None
         """
         assert(not self.arete_existe(source, dest))
-        self.lists[source].append(dest)
-        assert(self._invariant())
+        self._inserer_arete(source, dest, None)
+        self._verifier_modification(source, dest)
+        self._notifier("ajout_arete", source, dest, None)
 
     def retirer_arete(self, source, dest):
         """
@@ -115,55 +403,155 @@ class DigrapheNonPondere:
         :return: None
         """
         assert(self.arete_existe(source, dest))
-        self.lists[source].remove(dest)
-        assert(self._invariant())
+        valeur = self._liste_modifiable(source).pop(dest)
+        if self._inverses is not None:
+            del self._inverses[dest][source]
+        self._verifier_modification(source, dest)
+        self._notifier("retrait_arete", source, dest, valeur)
 
-    def retirer_sommet(self, sommet):
+    def retirer_sommet(self, sommet, differer=False):
         """
-        Enlève un sommet du digraphe
+        Enlève un sommet du digraphe, ainsi que toutes ses arêtes entrantes et sortantes.
         :param sommet: Numéro du sommet à retirer
+        :param differer: Si False, les sommets suivants sont aussitôt renumérotés (compacter(), en O(V+E)).  Si True,
+        le sommet est seulement marqué comme retiré: tous les algorithmes le sautent et les autres numéros restent
+        inchangés jusqu'au prochain compacter().  Le retrait différé coûte O(degré) si l'index des prédécesseurs
+        existe, O(V) sinon.
         :return: None
         """
         assert(self._numero_de_sommet_est_valide(sommet))
-        for liste in self.lists:
-            if sommet in liste:
-                liste.remove(sommet)
-            for dest in liste:
-                if dest > sommet:
-                    dest -= 1
-        self.lists.pop(sommet)
-        self.num_vertices -= 1
-        assert(self._invariant())
+        retirees = []
+        if self._inverses is not None:
+            for source in self._inverses[sommet]:
+                retirees.append((source, sommet, self._liste_modifiable(source).pop(sommet)))
+            self._inverses[sommet] = {}
+        else:
+            for source in self.sommets():
+                if sommet in self.lists[source]:
+                    retirees.append((source, sommet, self._liste_modifiable(source).pop(sommet)))
+        for dest, valeur in self.lists[sommet].items():
+            if self._inverses is not None:
+                del self._inverses[dest][sommet]
+            retirees.append((sommet, dest, valeur))
+        self.lists[sommet] = {}
+        self._retires[sommet] = 1
+        self._nb_retires += 1
+        self._verifier_modification(sommet, *(extremite for arete in retirees for extremite in arete[:2]))
+        for source, dest, valeur in retirees:
+            self._notifier("retrait_arete", source, dest, valeur)
+        self._notifier("retrait_sommet", sommet)
+        if not differer:
+            self.compacter()
+
+    def compacter(self):
+        """
+        Renumérote consécutivement les sommets restants après des retraits différés, en une passe O(V+E).  L'ordre
+        relatif des sommets, des listes d'adjacence et de l'ordre topologique maintenu est conservé.
+        :return: La table de correspondance: nouveaux[ancien] est le nouveau numéro du sommet, ou None s'il a été
+        retiré.
+        """
+        nouveaux = [None for _ in range(self.num_vertices)]
+        compteur = 0
+        for sommet in self.sommets():
+            nouveaux[sommet] = compteur
+            compteur += 1
+        if self._nb_retires:
+            self.lists = [{nouveaux[dest]: valeur for dest, valeur in self.lists[sommet].items()}
+                          for sommet in self.sommets()]
+            self._partages = None
+            if self._inverses is not None:
+                self._inverses = [{nouveaux[source]: valeur for source, valeur in self._inverses[sommet].items()}
+                                  for sommet in self.sommets()]
+            if self._ordre is not None:
+                self._ordre = [nouveaux[sommet] for sommet in self._ordre if nouveaux[sommet] is not None]
+                self._rangs = self._rangs_selon(self._ordre)
+            self.num_vertices = compteur
+            self._retires = bytearray(compteur)
+            self._nb_retires = 0
+            self._verifier_modification(*range(self.num_vertices))
+            self._notifier("compactage", nouveaux)
+        return nouveaux
+
+    def ajouter_aretes(self, aretes):
+        """
+        Ajoute un lot d'arêtes en une seule modification, l'invariant n'étant vérifié qu'à la fin.
+        :param aretes: Itérable de tuples (source, destination, ...), chacun passé tel quel à ajouter_arete
+        :return: None
+        """
+        with self.modifications():
+            for arete in aretes:
+                self.ajouter_arete(*arete)
+
+    def retirer_aretes(self, aretes):
+        """
+        Retire un lot d'arêtes en une seule modification, l'invariant n'étant vérifié qu'à la fin.
+        :param aretes: Itérable de tuples (source, destination, ...), les éléments suivants étant ignorés
+        :return: None
+        """
+        with self.modifications():
+            for source, dest, *_ in aretes:
+                self.retirer_arete(source, dest)
 
     def arite_entree_du_sommet(self, sommet):
         """Retourne l'arité d'entrée du sommet demandé"""
         assert(self._numero_de_sommet_est_valide(sommet))
+        if self._inverses is not None:
+            return len(self._inverses[sommet])
         arite = 0
-        for liste in self.lists:
-            if sommet in liste:
+        for source in self.sommets():
+            if sommet in self._liste_adjacence_pour_le_sommet(source):
                 arite += 1
         return arite
 
     def arite_sortie_du_sommet(self, sommet):
         """Retourne l'arité de sortie du sommet demandé"""
         assert(self._numero_de_sommet_est_valide(sommet))
-        return len(self.lists[sommet])
+        return len(self._liste_adjacence_pour_le_sommet(sommet))
 
-    def _aux_explorer_en_profondeur_le_sommet(self, sommet, visites, abandons):
+    def _explorer_en_profondeur_depuis(self, racine, visites, abandons, en_cours=None):
         """
-        Exploration en profondeur du digraphe à partir d'un sommet de départ. Méthode récursive.
-        :param sommet: Numéro du sommet de départ
-        :param visites: Liste de booléens marquant les noeuds visités, devrait être initialement une liste de False
-        :param abandons: Liste des noeuds abandonnés, devrait être initialement []
+        Moteur itératif d'exploration en profondeur, partagé par les explorations, le tri topologique et Kosaraju.  La
+        récursion est remplacée par une pile explicite d'itérateurs sur les listes d'adjacence: l'ordre de visite et
+        d'abandon est celui de la version récursive, sans limite de profondeur.
+        :param racine: Numéro du sommet de départ, non encore visité
+        :param visites: Liste de booléens marquant les noeuds visités, mise à jour
+        :param abandons: Liste à laquelle les noeuds sont ajoutés dans l'ordre de leur abandon
+        :param en_cours: Liste facultative de booléens marquant les noeuds visités mais non encore abandonnés.  Si elle
+        est fournie, rencontrer un tel noeud est un cycle et lève ValueError.
         :return: None
         """
-        assert(self._numero_de_sommet_est_valide(sommet))
-        visites[sommet] = True
-        for voisin in self.lists[sommet]:
-            if not visites[voisin]:
-                self._aux_explorer_en_profondeur_le_sommet(voisin, visites, abandons)
-        assert(sommet not in abandons)
-        abandons.append(sommet)
+        assert(self._numero_de_sommet_est_valide(racine))
+        statistiques = self._statistiques
+        visites[racine] = True
+        if en_cours is not None:
+            en_cours[racine] = True
+        pile = [(racine, iter(self._liste_adjacence_pour_le_sommet(racine)))]
+        if statistiques is not None:
+            statistiques.insertions_file += 1
+            statistiques.profondeur_pile_max = max(statistiques.profondeur_pile_max, 1)
+        while pile:
+            sommet, voisins = pile[-1]
+            for voisin in voisins:
+                if not visites[voisin]:
+                    visites[voisin] = True
+                    if en_cours is not None:
+                        en_cours[voisin] = True
+                    pile.append((voisin, iter(self._liste_adjacence_pour_le_sommet(voisin))))
+                    if statistiques is not None:
+                        statistiques.insertions_file += 1
+                        statistiques.profondeur_pile_max = max(statistiques.profondeur_pile_max, len(pile))
+                    break
+                if en_cours is not None and en_cours[voisin]:
+                    raise ValueError(f"Sommet {voisin} déjà en cours de visite.  Cycle détecté, pas de tri topologique possible.")
+            else:
+                pile.pop()
+                if en_cours is not None:
+                    en_cours[sommet] = False
+                abandons.append(sommet)
+                if statistiques is not None:
+                    statistiques.extractions_file += 1
+                    statistiques.sommets_resolus += 1
+                    statistiques.aretes_relaxees += len(self._liste_adjacence_pour_le_sommet(sommet))
 
     def explorer_en_profondeur_le_graphe(self):
         """
@@ -173,10 +561,10 @@ class DigrapheNonPondere:
         """
         visites = [False for _ in range(self.num_vertices)]
         abandons = []
-        for sommet in range(self.num_vertices):
+        for sommet in self.sommets():
             if not visites[sommet]:
-                self._aux_explorer_en_profondeur_le_sommet(sommet, visites, abandons)
-        assert(len(abandons) == self.num_vertices)
+                self._explorer_en_profondeur_depuis(sommet, visites, abandons)
+        assert(len(abandons) == self.nombre_de_sommets())
         return abandons
 
     def explorer_le_graphe_en_profondeur_en_partant_du_sommet(self, sommet, visites):
@@ -188,62 +576,234 @@ class DigrapheNonPondere:
         """
         assert(self._numero_de_sommet_est_valide(sommet))
         abandons = []
-        self._aux_explorer_en_profondeur_le_sommet(sommet, visites, abandons)
+        self._explorer_en_profondeur_depuis(sommet, visites, abandons)
         assert(len(abandons) <= self.num_vertices)
         return abandons
 
-    def _aux_tri_topologique_dfs(self, sommet, abandonnes, en_cours, abandons):
+    def _iter_profondeur(self, depart, prefixe):
         """
-        Fonction auxiliaire récursive pour le tri topologique utilisant dfs.
-        :param sommet: Sommet de départ
-        :param abandonnes: Liste de bool indiquant quels sommets ont été abandonnés
-        :param en_cours: Liste des noeuds visités mais non encore abandonnés
-        :param abandons: Liste des noeuds abandonnés en ordre d'abandon
-        :return: None
+        Exploration en profondeur paresseuse, dans l'ordre de _explorer_en_profondeur_depuis.  L'état des visites est
+        un ensemble qui ne grandit qu'avec les sommets atteints.
+        :param depart: Sommet de départ, ou None pour parcourir tout le graphe, racine après racine
+        :param prefixe: True pour produire les sommets à leur visite, False à leur abandon
+        :return: Un générateur de triplets (sommet, prédécesseur, profondeur)
         """
-        assert(self._numero_de_sommet_est_valide(sommet))
-        en_cours[sommet] = True
-        for voisin in self.lists[sommet]:
-            if not abandonnes[voisin]:
-                if not en_cours[voisin]:
-                    self._aux_tri_topologique_dfs(voisin, abandonnes, en_cours, abandons)
+        visites = set()
+        racines = self.sommets() if depart is None else (depart,)
+        for racine in racines:
+            if racine in visites:
+                continue
+            assert(self._numero_de_sommet_est_valide(racine))
+            visites.add(racine)
+            if prefixe:
+                yield racine, None, 0
+            pile = [(racine, iter(self._liste_adjacence_pour_le_sommet(racine)))]
+            while pile:
+                sommet, voisins = pile[-1]
+                for voisin in voisins:
+                    if voisin not in visites:
+                        visites.add(voisin)
+                        if prefixe:
+                            yield voisin, sommet, len(pile)
+                        pile.append((voisin, iter(self._liste_adjacence_pour_le_sommet(voisin))))
+                        break
                 else:
-                    raise ValueError(f"Sommet {voisin} déjà en cours de visite.  Cycle détecté, pas de tri topologique possible.")
-        assert(sommet not in abandons)
-        abandons.append(sommet)
-        abandonnes[sommet] = True
+                    pile.pop()
+                    if not prefixe:
+                        yield sommet, pile[-1][0] if pile else None, len(pile)
+
+    def iter_profondeur(self, depart=None):
+        """
+        Pendant paresseux de explorer_le_graphe_en_profondeur_en_partant_du_sommet: chaque sommet est produit dès sa
+        visite (préordre), et l'appelant peut interrompre le parcours à tout moment.
+        :param depart: Sommet de départ, ou None pour parcourir tout le graphe
+        :return: Un générateur de triplets (sommet, prédécesseur, profondeur), le prédécesseur d'une racine étant None.
+        """
+        return self._iter_profondeur(depart, True)
+
+    def iter_postordre(self, depart=None):
+        """
+        Pendant paresseux de explorer_en_profondeur_le_graphe: chaque sommet est produit à son abandon (postordre), dans
+        le même ordre que la liste des abandons.
+        :param depart: Sommet de départ, ou None pour parcourir tout le graphe
+        :return: Un générateur de triplets (sommet, prédécesseur, profondeur), le prédécesseur d'une racine étant None.
+        """
+        return self._iter_profondeur(depart, False)
 
-    def tri_topologique_dfs(self):
+    def tri_topologique_dfs(self, statistiques=None):
         """
         Tri topologique par exploration en profondeur.
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
         :return: La liste des sommets visités en ordre d'abandon.
         :raises: ValueError si un cycle est détecté.
         """
+        return self._mesurer("tri_topologique_dfs", statistiques, self._tri_topologique_dfs)
+
+    def _tri_topologique_dfs(self):
+        """Calcul de tri_topologique_dfs, sans instrumentation."""
         abandonnes = [False for _ in range(self.num_vertices)]
+        en_cours = [False for _ in range(self.num_vertices)]
         abandons = []
-        for sommet in range(self.num_vertices):
+        for sommet in self.sommets():
             if not abandonnes[sommet]:
-                en_cours = [False for _ in range(self.num_vertices)]
-                self._aux_tri_topologique_dfs(sommet, abandonnes, en_cours, abandons)
-        assert(len(abandons) == self.num_vertices)
+                self._explorer_en_profondeur_depuis(sommet, abandonnes, abandons, en_cours)
+        assert(len(abandons) == self.nombre_de_sommets())
         return abandons
 
+    def tri_topologique_kahn(self, statistiques=None):
+        """
+        Tri topologique de Kahn, en O(V+E): les sommets sans prédécesseur restant sont retirés un à un, dans l'ordre
+        où ils le deviennent (file FIFO, sources initiales en ordre de numéro).
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
+        :return: La liste des sommets en ordre topologique (chaque sommet précède ses successeurs), soit l'inverse de
+        l'ordre d'abandon retourné par tri_topologique_dfs.
+        :raises: ValueError si un cycle est détecté.
+        """
+        return self._mesurer("tri_topologique_kahn", statistiques, self._tri_topologique_kahn)
+
+    def _tri_topologique_kahn(self):
+        """Calcul de tri_topologique_kahn, sans instrumentation."""
+        statistiques = self._statistiques
+        arites = [0 for _ in range(self.num_vertices)]
+        for sommet in self.sommets():
+            for voisin in self._liste_adjacence_pour_le_sommet(sommet):
+                arites[voisin] += 1
+        prets = deque(sommet for sommet in self.sommets() if arites[sommet] == 0)
+        if statistiques is not None:
+            statistiques.insertions_file += len(prets)
+        ordre = []
+        while prets:
+            courant = prets.popleft()
+            ordre.append(courant)
+            if statistiques is not None:
+                statistiques.extractions_file += 1
+                statistiques.sommets_resolus += 1
+                statistiques.aretes_relaxees += len(self._liste_adjacence_pour_le_sommet(courant))
+            for voisin in self._liste_adjacence_pour_le_sommet(courant):
+                arites[voisin] -= 1
+                if arites[voisin] == 0:
+                    prets.append(voisin)
+                    if statistiques is not None:
+                        statistiques.insertions_file += 1
+        if len(ordre) != self.nombre_de_sommets():
+            raise ValueError("Cycle détecté, pas de tri topologique possible.")
+        return ordre
+
+    @staticmethod
+    def _rangs_selon(ordre):
+        """Inverse d'une permutation: rangs[sommet] est la position du sommet dans ordre."""
+        rangs = [0 for _ in range(len(ordre))]
+        for rang, sommet in enumerate(ordre):
+            rangs[sommet] = rang
+        return rangs
+
+    def maintenir_ordre_topologique(self):
+        """
+        Active le maintien incrémental d'un ordre topologique (algorithme de Pearce-Kelly).  Chaque ajout d'arête ne
+        réordonne que la région comprise entre les rangs de ses extrémités, et un ajout qui créerait un cycle lève
+        ValueError sans modifier le graphe.  Active aussi l'index des prédécesseurs, utilisé par la réparation.
+        :return: Le digraphe lui-même
+        :raises: ValueError si le graphe contient déjà un cycle.
+        """
+        if self._ordre is None:
+            self._ordre = self.tri_topologique_kahn()
+            self._rangs = self._rangs_selon(self._ordre)
+            self.indexer_predecesseurs()
+        return self
+
+    def ordre_topologique(self):
+        """
+        Ordre topologique courant, en O(1) si maintenir_ordre_topologique() a été appelé, sinon calculé par Kahn.
+        :return: La liste des sommets en ordre topologique.  La liste maintenue est partagée et ne doit pas être modifiée;
+        elle conserve les sommets retirés en différé jusqu'au prochain compacter().
+        """
+        if self._ordre is None:
+            return self.tri_topologique_kahn()
+        return self._ordre
+
+    def _region_affectee(self, depart, voisins, admissible, interdit=None):
+        """
+        Parcours en profondeur itératif borné de Pearce-Kelly.
+        :param depart: Sommet de départ
+        :param voisins: Fonction donnant les voisins à suivre (successeurs ou prédécesseurs)
+        :param admissible: Prédicat sur les rangs des sommets à inclure
+        :param interdit: Sommet dont l'atteinte signale un cycle
+        :return: La liste des sommets atteints
+        :raises: ValueError si interdit est atteint.
+        """
+        atteints = [depart]
+        vus = {depart}
+        pile = [depart]
+        while pile:
+            courant = pile.pop()
+            for voisin in voisins(courant):
+                if voisin == interdit:
+                    raise ValueError(f"L'arête vers {depart} fermerait un cycle, l'ordre topologique est impossible.")
+                if voisin not in vus and admissible(self._rangs[voisin]):
+                    vus.add(voisin)
+                    atteints.append(voisin)
+                    pile.append(voisin)
+        return atteints
+
+    def _reordonner_pour_arete(self, source, dest):
+        """
+        Réparation de Pearce-Kelly avant l'ajout de l'arête (source, dest) lorsque rang(dest) < rang(source): les
+        descendants de dest de rang inférieur à celui de source et les ancêtres de source de rang supérieur à celui de
+        dest se partagent leurs propres positions, les ancêtres d'abord.
+        :raises: ValueError si source est atteignable depuis dest.
+        """
+        if source == dest:
+            raise ValueError(f"Une boucle sur {source} est un cycle, l'ordre topologique est impossible.")
+        borne_inf, borne_sup = self._rangs[dest], self._rangs[source]
+        avant = self._region_affectee(dest, self._liste_adjacence_pour_le_sommet,
+                                      lambda rang: rang < borne_sup, interdit=source)
+        apres = self._region_affectee(source, self._liste_predecesseurs_du_sommet, lambda rang: rang > borne_inf)
+        avant.sort(key=self._rangs.__getitem__)
+        apres.sort(key=self._rangs.__getitem__)
+        positions = sorted(self._rangs[sommet] for sommet in avant + apres)
+        for rang, sommet in zip(positions, apres + avant):
+            self._ordre[rang] = sommet
+            self._rangs[sommet] = rang
+
     def graphe_inverse(self):
         """
-        Retourne un graphe inverse, donc contenant les mêmes sommets, mais toutes les arêtes sont inversées.
+        Retourne un graphe inverse, donc contenant les mêmes sommets, mais toutes les arêtes sont inversées.  Si l'index
+        des prédécesseurs existe, le graphe inverse est une vue sans copie qui partage les listes du graphe courant
+        en permutant les deux index; elle est en lecture seule (voir VueInverse).
         :return: Le graphe inverse
         """
+        if self._inverses is not None:
+            return self._vue_inverse()
         inv = DigrapheNonPondere(self.num_vertices,
-                                  [(dest, depart) for depart in range(self.num_vertices) for dest in self.lists[depart]])
+                                  [(dest, depart) for depart in self.sommets()
+                                   for dest in self._liste_adjacence_pour_le_sommet(depart)])
+        inv._marquer_retires(self._retires)
         return inv
 
-    def kosaraju(self):
+    def _marquer_retires(self, retires):
+        """Reporte sur ce graphe, de mêmes numéros et sans arête touchant ces sommets, les retraits différés d'un autre."""
+        self._retires = bytearray(retires)
+        self._nb_retires = self._retires.count(1)
+
+    def _vue_inverse(self):
+        """Vue du graphe inverse partageant les listes d'adjacence et l'index des prédécesseurs, permutés."""
+        from VueInverse import vue_inverse
+        return vue_inverse(self)
+
+    def kosaraju(self, statistiques=None):
         """
         Trouve les composantes fortement connexes du graphe courant.
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
         :return: La liste des composantes fortement connexes.  Chaque composante est elle-même une liste de sommets.
         """
+        return self._mesurer("kosaraju", statistiques, self._kosaraju)
+
+    def _kosaraju(self):
+        """Calcul de kosaraju, sans instrumentation."""
         cfc = []
-        ordre = self.graphe_inverse().explorer_en_profondeur_le_graphe()
+        inverse = self.graphe_inverse()
+        inverse._statistiques = self._statistiques
+        ordre = inverse.explorer_en_profondeur_le_graphe()
         visites = [False for _ in range(self.num_vertices)]
         while ordre:
             courant = ordre.pop()
@@ -251,35 +811,325 @@ class DigrapheNonPondere:
                 cfc.append(self.explorer_le_graphe_en_profondeur_en_partant_du_sommet(courant, visites))
         return cfc
 
-    def explorer_en_largeur_en_partant_du_sommet(self, depart=0):
+    def tarjan(self, statistiques=None):
+        """
+        Trouve les composantes fortement connexes par l'algorithme de Tarjan: une seule exploration en profondeur,
+        itérative, sans construire le graphe inverse.
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
+        :return: La liste des composantes fortement connexes, chacune étant une liste de sommets.  Une composante
+        apparaît toujours avant les composantes qui l'atteignent, comme pour kosaraju().
         """
-        Exploration en largeur (BFS)
+        return self._mesurer("tarjan", statistiques, self._tarjan)
+
+    def _tarjan(self):
+        """Calcul de tarjan, sans instrumentation."""
+        statistiques = self._statistiques
+        indices = [-1 for _ in range(self.num_vertices)]
+        bas = [0 for _ in range(self.num_vertices)]
+        sur_pile = [False for _ in range(self.num_vertices)]
+        pile = []
+        cfc = []
+        compteur = 0
+        for racine in self.sommets():
+            if indices[racine] != -1:
+                continue
+            indices[racine] = bas[racine] = compteur
+            compteur += 1
+            pile.append(racine)
+            sur_pile[racine] = True
+            appels = [(racine, iter(self._liste_adjacence_pour_le_sommet(racine)))]
+            if statistiques is not None:
+                statistiques.insertions_file += 1
+                statistiques.profondeur_pile_max = max(statistiques.profondeur_pile_max, 1)
+            while appels:
+                sommet, voisins = appels[-1]
+                for voisin in voisins:
+                    if indices[voisin] == -1:
+                        indices[voisin] = bas[voisin] = compteur
+                        compteur += 1
+                        pile.append(voisin)
+                        sur_pile[voisin] = True
+                        appels.append((voisin, iter(self._liste_adjacence_pour_le_sommet(voisin))))
+                        if statistiques is not None:
+                            statistiques.insertions_file += 1
+                            statistiques.profondeur_pile_max = max(statistiques.profondeur_pile_max, len(appels))
+                        break
+                    if sur_pile[voisin] and indices[voisin] < bas[sommet]:
+                        bas[sommet] = indices[voisin]
+                else:
+                    appels.pop()
+                    if statistiques is not None:
+                        statistiques.extractions_file += 1
+                        statistiques.sommets_resolus += 1
+                        statistiques.aretes_relaxees += len(self._liste_adjacence_pour_le_sommet(sommet))
+                    if appels:
+                        parent = appels[-1][0]
+                        if bas[sommet] < bas[parent]:
+                            bas[parent] = bas[sommet]
+                    if bas[sommet] == indices[sommet]:
+                        composante = []
+                        while True:
+                            membre = pile.pop()
+                            sur_pile[membre] = False
+                            composante.append(membre)
+                            if membre == sommet:
+                                break
+                        cfc.append(composante)
+        return cfc
+
+    def explorer_en_largeur_en_partant_du_sommet(self, depart=0, cible=None, statistiques=None):
+        """
+        Exploration en largeur (BFS).  Le résultat est mémorisé si le cache est activé (voir activer_cache).
         :param depart: Numéro du sommet de départ
+        :param cible: Sommet d'arrivée facultatif.  Si fourni, l'exploration s'arrête dès qu'il est atteint.
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
         :return: Liste des prédécesseurs, et longueur du chemin pour chaque sommet.  Si un sommet est inaccessible,
-        le prédécesseur sera None, et la distance sera sys.maxsize
+        le prédécesseur sera None, et la distance sera sys.maxsize.  Après un arrêt sur la cible, les sommets non
+        encore atteints sont traités comme inaccessibles.
+        """
+        return self._mesurer("explorer_en_largeur", statistiques, lambda: self._avec_cache(
+            ("largeur", depart, cible), lambda: self.explorer_en_largeur_en_partant_des_sommets([depart], cible)))
+
+    def explorer_en_largeur_en_partant_des_sommets(self, departs, cible=None):
         """
+        Exploration en largeur à sources multiples: tous les départs sont à distance 0 et explorés en un seul
+        balayage, ce qui donne pour chaque sommet la distance au départ le plus proche.  La file est une deque, chaque
+        défilement est donc en O(1).
+        :param departs: Itérable des sommets de départ
+        :param cible: Sommet d'arrivée facultatif.  Si fourni, l'exploration s'arrête dès qu'il est atteint.
+        :return: (pred, dist) comme explorer_en_largeur_en_partant_du_sommet.  En remontant les prédécesseurs d'un
+        sommet, on aboutit au départ le plus proche.
+        """
+        statistiques = self._statistiques
         predecesseurs = [None for _ in range(self.num_vertices)]
         distances = [sys.maxsize for _ in range(self.num_vertices)]
-        distances[depart] = 0
-        visites = [False for _ in range(self.num_vertices)]
-        visites[depart] = True
-        en_attente = [depart]
+        en_attente = deque()
+        for depart in departs:
+            assert(self._numero_de_sommet_est_valide(depart))
+            if distances[depart] != 0:
+                distances[depart] = 0
+                en_attente.append(depart)
+                if statistiques is not None:
+                    statistiques.insertions_file += 1
+        if cible is not None and distances[cible] == 0:
+            return predecesseurs, distances
         while en_attente:
-            courant = en_attente.pop(0)
+            courant = en_attente.popleft()
             distance = distances[courant] + 1
-            for voisin in self.lists[courant]:
-                if not visites[voisin]:
+            if statistiques is not None:
+                statistiques.extractions_file += 1
+                statistiques.sommets_resolus += 1
+                statistiques.aretes_relaxees += len(self._liste_adjacence_pour_le_sommet(courant))
+            for voisin in self._liste_adjacence_pour_le_sommet(courant):
+                if distances[voisin] == sys.maxsize:
+                    if statistiques is not None:
+                        statistiques.insertions_file += 1
                     en_attente.append(voisin)
-                    visites[voisin] = True
                     predecesseurs[voisin] = courant
                     distances[voisin] = distance
+                    if voisin == cible:
+                        return predecesseurs, distances
         return predecesseurs, distances
 
+    def iter_largeur(self, depart=0, profondeur_max=None):
+        """
+        Pendant paresseux de explorer_en_largeur_en_partant_du_sommet: les sommets sont produits dans l'ordre de leur
+        découverte, et l'appelant peut interrompre le parcours à tout moment, par exemple dès qu'un sommet recherché est
+        atteint.  L'état des visites ne grandit qu'avec les sommets atteints.
+        :param depart: Numéro du sommet de départ
+        :param profondeur_max: Profondeur facultative au-delà de laquelle l'exploration s'arrête
+        :return: Un générateur de triplets (sommet, prédécesseur, profondeur), en profondeurs croissantes, en commençant
+        par (depart, None, 0).
+        """
+        assert(self._numero_de_sommet_est_valide(depart))
+        visites = {depart}
+        yield depart, None, 0
+        en_attente = deque([(depart, 0)])
+        while en_attente:
+            courant, profondeur = en_attente.popleft()
+            if profondeur == profondeur_max:
+                continue
+            for voisin in self._liste_adjacence_pour_le_sommet(courant):
+                if voisin not in visites:
+                    visites.add(voisin)
+                    yield voisin, courant, profondeur + 1
+                    en_attente.append((voisin, profondeur + 1))
 
+    def _liste_predecesseurs_du_sommet(self, sommet):
+        """
+        Pendant de _liste_adjacence_pour_le_sommet pour les arêtes entrantes.  Exige l'index des prédécesseurs (voir
+        indexer_predecesseurs); une requête qui s'en passe utilise _predecesseurs_pour_requete.
+        :param sommet: Numéro du sommet
+        :return: Un itérable des prédécesseurs du sommet.
+        """
+        assert(self._numero_de_sommet_est_valide(sommet) and self._inverses is not None)
+        return self._inverses[sommet]
 
+    def _predecesseurs_pour_requete(self):
+        """
+        Prédécesseurs pour une requête de consultation: l'index des prédécesseurs s'il existe, sinon des listes
+        inverses propres à l'appel, construites en O(V + E) sans changer le stockage du graphe.
+        :return: Une fonction donnant un itérable des prédécesseurs d'un sommet.
+        """
+        if self._inverses is not None:
+            return self._liste_predecesseurs_du_sommet
+        inverses = [[] for _ in range(self.num_vertices)]
+        for source in self.sommets():
+            for dest in self._liste_adjacence_pour_le_sommet(source):
+                inverses[dest].append(source)
+        return inverses.__getitem__
 
+    @staticmethod
+    def _etendre_niveau(frontiere, parents, profondeurs, parents_opposes, profondeurs_opposees, voisins):
+        """
+        Étend d'un niveau complet l'une des deux recherches d'une exploration en largeur bidirectionnelle.
+        :return: (nouvelle frontière, sommet de rencontre donnant le plus court chemin, ou None)
+        """
+        prochaine = []
+        rencontre, longueur = None, sys.maxsize
+        for courant in frontiere:
+            for voisin in voisins(courant):
+                if voisin not in parents:
+                    parents[voisin] = courant
+                    profondeurs[voisin] = profondeurs[courant] + 1
+                    prochaine.append(voisin)
+                    if voisin in parents_opposes and profondeurs[voisin] + profondeurs_opposees[voisin] < longueur:
+                        rencontre, longueur = voisin, profondeurs[voisin] + profondeurs_opposees[voisin]
+        return prochaine, rencontre
 
+    def plus_court_chemin_en_largeur(self, depart, arrivee):
+        """
+        Exploration en largeur bidirectionnelle: une recherche avance depuis depart sur les successeurs, l'autre recule
+        depuis arrivee sur les prédécesseurs, en étendant toujours la plus petite frontière d'un niveau complet.  Seule
+        une fraction des sommets est visitée, et l'état de visite est alloué au besoin.  Sans index des prédécesseurs
+        (voir indexer_predecesseurs), les prédécesseurs sont d'abord calculés pour l'appel, en O(V + E).
+        :param depart: Numéro du sommet de départ
+        :param arrivee: Numéro du sommet d'arrivée
+        :return: La liste des sommets d'un plus court chemin (en nombre d'arêtes) de depart à arrivee inclusivement, ou
+        None si arrivee est inaccessible.
+        """
+        assert(self._numero_de_sommet_est_valide(depart) and self._numero_de_sommet_est_valide(arrivee))
+        avant, profondeurs_avant = {depart: None}, {depart: 0}
+        arriere, profondeurs_arriere = {arrivee: None}, {arrivee: 0}
+        frontiere_avant, frontiere_arriere = [depart], [arrivee]
+        rencontre = depart if depart == arrivee else None
+        predecesseurs = None if rencontre is not None else self._predecesseurs_pour_requete()
+        while rencontre is None and frontiere_avant and frontiere_arriere:
+            if len(frontiere_avant) <= len(frontiere_arriere):
+                frontiere_avant, rencontre = self._etendre_niveau(frontiere_avant, avant, profondeurs_avant,
+                                                                  arriere, profondeurs_arriere,
+                                                                  self._liste_adjacence_pour_le_sommet)
+            else:
+                frontiere_arriere, rencontre = self._etendre_niveau(frontiere_arriere, arriere, profondeurs_arriere,
+                                                                    avant, profondeurs_avant, predecesseurs)
+        if rencontre is None:
+            return None
+        chemin = []
+        sommet = rencontre
+        while sommet is not None:
+            chemin.append(sommet)
+            sommet = avant[sommet]
+        chemin.reverse()
+        sommet = arriere[rencontre]
+        while sommet is not None:
+            chemin.append(sommet)
+            sommet = arriere[sommet]
+        return chemin
 
+    def vers_matrice_creuse(self):
+        """
+        Exporte le digraphe en scipy.sparse.csr_matrix, d'éléments 1 (pondérations pour un digraphe pondéré) aux
+        positions (source, arrivée) des arêtes.  Un digraphe figé est exporté sans copie de ses tableaux.  Voir le
+        module MatriceCreuse.
+        :return: La matrice creuse, num_vertices x num_vertices
+        :raises: ImportError si NumPy ou SciPy n'est pas installé.
+        """
+        from MatriceCreuse import vers_matrice_creuse
+        return vers_matrice_creuse(self)
 
+    def degres_sortants(self):
+        """
+        Arités de sortie de tous les sommets, calculées d'un bloc avec NumPy s'il est installé.
+        :return: array('q') indexé par sommet, 0 pour les sommets retirés.
+        """
+        from MatriceCreuse import degres_sortants
+        return degres_sortants(self)
 
+    def degres_entrants(self):
+        """
+        Arités d'entrée de tous les sommets, calculées d'un bloc avec NumPy s'il est installé.
+        :return: array('q') indexé par sommet, 0 pour les sommets retirés.
+        """
+        from MatriceCreuse import degres_entrants
+        return degres_entrants(self)
+
+    def niveaux_en_largeur(self, departs):
+        """
+        Distances de explorer_en_largeur_en_partant_des_sommets, calculées niveau par niveau en produits matrice
+        creuse - vecteur si NumPy et SciPy sont installés, en Python pur sinon.
+        :param departs: Itérable des sommets de départ
+        :return: array('q') des distances au départ le plus proche, sys.maxsize pour les sommets inaccessibles.
+        """
+        from MatriceCreuse import niveaux_en_largeur
+        return niveaux_en_largeur(self, departs)
 
+    def atteignables(self, departs):
+        """
+        Ensemble des sommets accessibles depuis les départs, vectorisé comme niveaux_en_largeur.
+        :param departs: Itérable des sommets de départ
+        :return: bytearray indexé par sommet: 1 si le sommet est accessible, départs compris, 0 sinon.
+        """
+        from MatriceCreuse import atteignables
+        return atteignables(self, departs)
+
+    def sauvegarder(self, fichier, somme_de_controle=True):
+        """
+        Écrit le digraphe dans un fichier binaire versionné: entête, puis tableaux CSR offsets, targets et, pour un
+        digraphe pondéré, weights.  Voir le module FichierGraphe.
+        :param fichier: Chemin du fichier
+        :param somme_de_controle: True pour inscrire une somme de contrôle CRC-32 du contenu
+        :return: None
+        """
+        from FichierGraphe import sauvegarder
+        sauvegarder(self, fichier, somme_de_controle)
+
+    @staticmethod
+    def charger(fichier, projeter=True, verifier=False):
+        """
+        Relit un digraphe écrit par sauvegarder, sous forme figée.  Par défaut, le fichier est projeté en mémoire
+        (mmap) et les tableaux du digraphe sont des memoryview sur cette projection: rien n'est analysé ni copié, et
+        les processus qui chargent le même fichier en partagent les pages.  NB: l'invariant du digraphe figé parcourt
+        toutes les arêtes tant que les assertions sont actives (python sans -O).
+        :param fichier: Chemin du fichier
+        :param projeter: False pour lire le fichier en mémoire plutôt que le projeter
+        :param verifier: True pour contrôler la somme de contrôle, si le fichier en a une, ce qui lit tout le fichier.
+        :return: Un DigrapheFige, ou un DigraphePondereFige si le fichier contient des pondérations.
+        :raises: ValueError si le fichier n'est pas un digraphe, est d'une autre version du format, est tronqué ou ne
+        correspond pas à sa somme de contrôle.
+        """
+        from FichierGraphe import charger
+        return charger(fichier, projeter, verifier)
+
+    def index_accessibilite(self, max_octets=None, nombre_d_intervalles=3, graine=0):
+        """
+        Construit un index répondant en lot aux requêtes « source atteint-il dest ? »: condensation en composantes
+        fortement connexes, puis fermeture transitive en bits, ou étiquetage par intervalles si elle dépasserait
+        max_octets.  Voir le module IndexAccessibilite.
+        :param max_octets: Taille maximale de la fermeture transitive, 64 Mio si None
+        :param nombre_d_intervalles: Nombre de parcours de l'étiquetage par intervalles
+        :param graine: Graine des ordres aléatoires de ces parcours
+        :return: Un IndexAccessibilite, valide tant que le graphe n'est pas modifié.
+        """
+        from IndexAccessibilite import IndexAccessibilite, MAX_OCTETS
+        return IndexAccessibilite(self, MAX_OCTETS if max_octets is None else max_octets, nombre_d_intervalles,
+                                  graine)
+
+    def figer(self):
+        """
+        Construit une copie en lecture seule du digraphe, stockée en format CSR (compressed sparse row) dans des
+        tableaux typés contigus.  Les sommets conservent leurs numéros et les voisins leur ordre.
+        :return: Un DigrapheFige offrant la même interface de consultation.
+        """
+        from DigrapheFige import DigrapheFige
+        offsets, targets = DigrapheFige.tableaux_csr(self)
+        return DigrapheFige(offsets, targets, bytearray(self._retires))
@@ -1,22 +1,44 @@
 from DigrapheNonPondere import DigrapheNonPondere
+from collections import deque
+import heapq
 import math
 
 
-def _min_index(queue, distances):
+class CycleNegatif(ValueError):
     """
-    Fonction auxiliaire utilisée dans Dijkstra.
-    :param queue: Liste des sommets non-résolus
-    :param distances: Liste des distances en fonction des sommets
-    :return: L'élément de queue ayant une distance minimale.
+    Levée lorsqu'un cycle de poids négatif rend les plus courts chemins indéfinis.  L'attribut cycle contient les
+    sommets du cycle dans l'ordre de parcours (chaque sommet a une arête vers le suivant, le dernier vers le premier),
+    ou None s'il n'a pas pu être isolé.
     """
-    assert len(queue) <= len(distances)
-    min_index = 0
-    min_distance = distances[queue[0]]
-    for i in range(1, len(queue)):
-        if distances[queue[i]] < min_distance:
-            min_distance = distances[queue[i]]
-            min_index = i
-    return min_index
+    def __init__(self, cycle=None):
+        super().__init__("Cycle de poids négatif détecté" + (f": {cycle}" if cycle else ""))
+        self.cycle = cycle
+
+
+def _cycle_dans_predecesseurs(predecesseurs, depuis=None):
+    """
+    Fonction auxiliaire utilisée par Bellman-Ford et SPFA: cherche un cycle dans le graphe des prédécesseurs, qui ne
+    peut être qu'un cycle de poids négatif.
+    :param predecesseurs: Liste des prédécesseurs
+    :param depuis: Sommet dont la chaîne de prédécesseurs est remontée en premier, si connu
+    :return: La liste des sommets du cycle en ordre de parcours, ou None si le graphe des prédécesseurs est acyclique.
+    """
+    etats = [0 for _ in range(len(predecesseurs))]
+    departs = range(len(predecesseurs)) if depuis is None else [depuis, *range(len(predecesseurs))]
+    for depart in departs:
+        chaine = []
+        sommet = depart
+        while sommet is not None and etats[sommet] == 0:
+            etats[sommet] = 1
+            chaine.append(sommet)
+            sommet = predecesseurs[sommet]
+        if sommet is not None and etats[sommet] == 1:
+            cycle = chaine[chaine.index(sommet):]
+            cycle.reverse()
+            return cycle
+        for membre in chaine:
+            etats[membre] = 2
+    return None
 
 
 class DigraphePondere(DigrapheNonPondere):
@@ -26,32 +48,40 @@ class DigraphePondere(DigrapheNonPondere):
     def __init__(self, vertices=None, aretes_generalisees=None):
         """
         Construit un graphe ayant un nombre défini de sommets et des arêtes pondérées.
-        :param vertices: Nombre de sommets demandés.
-        :param aretes_generalisees: Liste des arêtes pondérées.  Chaque arête est un triplet (source: int, arrivée: int, pondération: float)
+        :param vertices: Nombre de sommets demandés, déduit des arêtes si None.
+        :param aretes_generalisees: Itérable des arêtes pondérées, parcouru une seule fois.  Chaque arête est un triplet (source: int, arrivée: int, pondération: float)
         représentant un arc entre le sommet source et le sommet arrivée, de poids pondération.  Les paramètres source et arrivée
         doivent donc être des numéros de sommet valide!
         """
-        if aretes_generalisees is not None:
-            self.ponderations = {(s, d): p for (s, d, p) in aretes_generalisees}
-            super().__init__(vertices, self.ponderations.keys())
-        else:
-            self.ponderations = None
-            super().__init__(vertices, None)
+        super().__init__(vertices, aretes_generalisees)
+
+    @staticmethod
+    def depuis_fichier_aretes(fichier, vertices=None, separateur=None, entete=False):
+        """
+        Construit un digraphe pondéré d'après un fichier de liste d'arêtes, une arête "source destination pondération"
+        par ligne, lu au fil de l'eau.  Une ligne sans pondération donne une arête de poids 1.0.  Voir
+        DigrapheNonPondere.depuis_fichier_aretes.
+        :return: Le digraphe pondéré
+        :raises: ValueError si une ligne n'est pas une arête.
+        """
+        from FichierAretes import lire_aretes
+        return DigraphePondere(vertices, lire_aretes(fichier, separateur, entete, True))
 
-    def _invariant(self):
+    def _valeur_de_l_arete(self, arete):
+        return arete[2] if len(arete) > 2 else 1.0
+
+    def _invariant_des_sommets(self, sommets):
         """
-        Validité de l'instance.  Chaque entrée des pondérations doit être un arc qui existe dans le graphe. Et chaque
-        arc doit avoir une pondération.
-        :return: True si l'instance est valide
+        Validité de l'instance pour les sommets donnés.  Chaque arc doit avoir une pondération, rangée comme valeur
+        dans la liste d'adjacence de sa source.
+        :param sommets: Itérable des sommets à vérifier
+        :return: True si l'instance est valide pour ces sommets
         """
-        for s in range(self.num_vertices):
-            for d in self.lists[s]:
-                if (s, d) not in self.ponderations.keys():
+        for s in sommets:
+            if self._numero_de_sommet_est_valide(s):
+                if any(p is None for p in self.lists[s].values()):
                     return False
-        for k in self.ponderations.keys():
-            if not self.arete_existe(k[0], k[1]):
-                return False
-        return super()._invariant()
+        return super()._invariant_des_sommets(sommets)
 
     def __str__(self):
         """
@@ -59,20 +89,8 @@ class DigraphePondere(DigrapheNonPondere):
         :return: Un objet string contenant chaque sommet suivi de sa liste d'adjacence avec les pondérations entre
         parenthèses.
         """
-        resultat = ""
-        for i in range(self.num_vertices):
-            resultat += f"{i} -->"
-            for j in range(len(self.lists[i])):
-                resultat += f" {self.lists[i][j]}"
-                try:
-                    pond = self.lire_ponderation(i, self.lists[i][j])
-                    resultat += f"({pond})"
-                finally:
-                    if j < len(self.lists[i]) - 1:
-                        resultat += " - "
-            if i < self.num_vertices - 1:
-                resultat += "\n"
-        return resultat
+        return "\n".join(f"{i} -->" + " - ".join(f" {voisin}({pond})" for voisin, pond in self._aretes_ponderees_du_sommet(i))
+                         for i in self.sommets())
 
     def ajouter_arete(self, source, dest, pond=1.0):
         """
@@ -82,9 +100,38 @@ class DigraphePondere(DigrapheNonPondere):
         :param pond: Pondération de l'arête
         :return: None
         """
-        super().ajouter_arete(source, dest)
-        self.ponderations[(source, dest)] = pond
-        assert self._invariant()
+        assert not self.arete_existe(source, dest)
+        self._inserer_arete(source, dest, pond)
+        self._verifier_modification(source, dest)
+        self._notifier("ajout_arete", source, dest, pond)
+
+    def modifier_ponderation(self, source, dest, pond):
+        """
+        Change la pondération d'une arête existante.
+        :param source: Sommet de départ
+        :param dest: Sommet d'arrivée
+        :param pond: Nouvelle pondération
+        :return: None
+        """
+        assert self.arete_existe(source, dest)
+        ancienne = self.lists[source][dest]
+        self._liste_modifiable(source)[dest] = pond
+        if self._inverses is not None:
+            self._inverses[dest][source] = pond
+        self._verifier_modification(source, dest)
+        self._notifier("ponderation", source, dest, ancienne, pond)
+
+    def graphe_inverse(self):
+        """
+        Retourne le graphe inverse pondéré, chaque arête inversée conservant sa pondération.  C'est une vue sans copie
+        si l'index des prédécesseurs existe.
+        :return: Le graphe inverse
+        """
+        if self._inverses is not None:
+            return self._vue_inverse()
+        inv = DigraphePondere(self.num_vertices, ((d, s, p) for (s, d, p) in self._aretes_ponderees()))
+        inv._marquer_retires(self._retires)
+        return inv
 
     def lire_ponderation(self, source, dest):
         """
@@ -94,63 +141,250 @@ class DigraphePondere(DigrapheNonPondere):
         :return: Pondération de l'arc
         """
         assert self.arete_existe(source, dest)
-        return self.ponderations[(source, dest)]
+        return self.lists[source][dest]
+
+    def _aretes_ponderees_du_sommet(self, sommet):
+        """
+        Pendant pondéré de _liste_adjacence_pour_le_sommet.
+        :param sommet: Numéro du sommet source
+        :return: Un itérable de paires (voisin, pondération), dans l'ordre de la liste d'adjacence.
+        """
+        return self._liste_adjacence_pour_le_sommet(sommet).items()
 
-    def _relaxer(self, voisin, courant, distances, predecesseurs):
+    def _aretes_ponderees(self):
+        """
+        Énumère toutes les arêtes du graphe.
+        :return: Un itérable de triplets (source, arrivée, pondération).
+        """
+        return ((s, d, p) for s in self.sommets() for d, p in self.lists[s].items())
+
+    def _relaxer(self, voisin, courant, distances, predecesseurs, pond=None):
         """
         Relaxe le voisin à l'aide d'un sommet courant.
         :param voisin: Sommet à relaxer
         :param courant: Sommet prédécesseur servant à la relaxation
         :param distances: Liste des distances
         :param predecesseurs: Liste des prédécesseurs
+        :param pond: Pondération de l'arc (courant, voisin) si l'appelant la connaît déjà, sinon elle est lue.
         :return: (bool, distances, prédécesseurs) un triplet contenant un bool indiquant True si le voisin a effectivement
         changé de prédécesseurs, la liste des distances mise à jour, la liste des prédécesseurs mise à jour.
         """
-        temp = distances[courant] + self.lire_ponderation(courant, voisin)
+        if pond is None:
+            pond = self.lire_ponderation(courant, voisin)
+        temp = distances[courant] + pond
         if temp < distances[voisin]:
             distances[voisin] = temp
             predecesseurs[voisin] = courant
             return False, distances, predecesseurs
         return True, distances, predecesseurs
 
-    def dijkstra(self, depart):
+    def dijkstra(self, depart, cibles=None, distance_max=None, statistiques=None):
         """
-        Algorithme de Dijkstra à partir de départ.  NB: Le comportement de l'algorithme est NON-DÉFINI si une pondération
-        négative est présente.
+        Algorithme de Dijkstra à partir de départ, utilisant un tas binaire avec suppression paresseuse: un sommet peut
+        apparaître plusieurs fois dans le tas, seule sa première extraction est traitée.  NB: Le comportement de
+        l'algorithme est NON-DÉFINI si une pondération négative est présente.
+        Le résultat est mémorisé si le cache est activé (voir activer_cache).
         :param depart: Numéro du sommet de départ
+        :param cibles: Sommets d'arrivée facultatifs.  Si fournis, la recherche s'arrête dès qu'ils sont tous résolus.
+        :param distance_max: Distance facultative au-delà de laquelle la recherche s'arrête.
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
         :return: (pred, dist) = (la liste de prédécesseurs, la liste des distances minimales).  Un sommet inaccessible
-        à partir de départ aura None comme prédécesseurs et math.inf comme distance.
+        à partir de départ aura None comme prédécesseurs et math.inf comme distance.  Si la recherche s'arrête tôt, seuls
+        les sommets résolus ont une distance minimale garantie, les autres conservent une distance provisoire.
+        """
+        if cibles is not None:
+            cibles = frozenset(cibles)
+        return self._mesurer("dijkstra", statistiques, lambda: self._avec_cache(
+            ("dijkstra", depart, cibles, distance_max), lambda: self._dijkstra(depart, cibles, distance_max)))
+
+    def _dijkstra(self, depart, cibles=None, distance_max=None, heuristique=None):
+        """
+        Calcul de dijkstra, sans passer par le cache.  Avec une heuristique, les sommets sont extraits du tas par ordre
+        de distance plus estimation restante (A*).
         """
         assert self._numero_de_sommet_est_valide(depart)
+        statistiques = self._statistiques
         predecesseurs = [None for _ in range(self.num_vertices)]
         distances = [math.inf for _ in range(self.num_vertices)]
         distances[depart] = 0
-        non_solutionnes = [i for i in range(self.num_vertices)]
-        while non_solutionnes:
-            courant = non_solutionnes.pop(_min_index(non_solutionnes, distances))
-            for voisin in self.lists[courant]:
-                _, distances, predecesseurs = self._relaxer(voisin, courant, distances, predecesseurs)
+        resolus = [False for _ in range(self.num_vertices)]
+        restantes = None
+        if cibles is not None:
+            restantes = set(cibles)
+            assert all(self._numero_de_sommet_est_valide(cible) for cible in restantes)
+        en_attente = [(0 if heuristique is None else heuristique(depart), depart)]
+        if statistiques is not None:
+            statistiques.insertions_file += 1
+        while en_attente:
+            _, courant = heapq.heappop(en_attente)
+            if statistiques is not None:
+                statistiques.extractions_file += 1
+            if resolus[courant]:
+                continue
+            if distance_max is not None and distances[courant] > distance_max:
+                break
+            resolus[courant] = True
+            if statistiques is not None:
+                statistiques.sommets_resolus += 1
+                statistiques.aretes_relaxees += len(self._liste_adjacence_pour_le_sommet(courant))
+            if restantes is not None:
+                restantes.discard(courant)
+                if not restantes:
+                    break
+            for voisin, pond in self._aretes_ponderees_du_sommet(courant):
+                if not resolus[voisin]:
+                    stable, distances, predecesseurs = self._relaxer(voisin, courant, distances, predecesseurs, pond)
+                    if not stable:
+                        priorite = distances[voisin] if heuristique is None else distances[voisin] + heuristique(voisin)
+                        heapq.heappush(en_attente, (priorite, voisin))
+                        if statistiques is not None:
+                            statistiques.relaxations_reussies += 1
+                            statistiques.insertions_file += 1
         return predecesseurs, distances
 
-    def bellman_ford(self, depart):
+    def a_etoile(self, depart, arrivee, heuristique=None, statistiques=None):
+        """
+        Recherche A* d'un plus court chemin de départ à arrivée: le Dijkstra de dijkstra, dont le tas est ordonné par
+        la distance parcourue plus une estimation de la distance restante.  L'heuristique doit être admissible et
+        cohérente (h(u) <= w(u, v) + h(v)), sans quoi le chemin trouvé peut ne pas être minimal.  Les repères calculés
+        par reperes() en fournissent une sans coordonnées.  NB: les pondérations doivent être positives ou nulles.
+        :param depart: Numéro du sommet de départ
+        :param arrivee: Numéro du sommet d'arrivée
+        :param heuristique: Fonction heuristique(sommet, arrivee) minorant la distance restante, nulle si None (la
+        recherche est alors un Dijkstra arrêté à l'arrivée).
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
+        :return: (pred, dist) comme dijkstra avec cibles=[arrivee]: seule la distance de l'arrivée et de son chemin sont
+        garanties minimales.
+        """
+        assert self._numero_de_sommet_est_valide(arrivee)
+        estimation = None if heuristique is None else lambda sommet: heuristique(sommet, arrivee)
+        return self._mesurer("a_etoile", statistiques, lambda: self._dijkstra(depart, {arrivee}, None, estimation))
+
+    def reperes(self, nombre=8):
+        """
+        Prétraitement ALT (A*, Landmarks, Triangle inequality) pour a_etoile.  Voir le module Reperes.
+        :param nombre: Nombre de repères à choisir
+        :return: Un objet Reperes, utilisable comme heuristique de a_etoile tant que le graphe n'est pas modifié.
+        """
+        from Reperes import Reperes
+        return Reperes(self, nombre)
+
+    def bellman_ford(self, depart, statistiques=None):
         """
         Algorithme de Bellman-Ford à partir d'un sommet donné.
+        Le résultat est mémorisé si le cache est activé (voir activer_cache).
         :param depart: Numéro du sommet de départ
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
         :return: (pred, dist) la liste des prédécesseurs et la liste des distances minimales.
-        :raises: ValueError si un cycle de poids négatif est présent.
+        :raises: CycleNegatif (une ValueError) si un cycle de poids négatif est présent.
         """
+        return self._mesurer("bellman_ford", statistiques,
+                             lambda: self._avec_cache(("bellman_ford", depart), lambda: self._bellman_ford(depart)))
+
+    def _bellman_ford(self, depart):
+        """Calcul de bellman_ford, sans passer par le cache."""
         assert self._numero_de_sommet_est_valide(depart)
         predecesseurs = [None for _ in range(self.num_vertices)]
         distances = [math.inf for _ in range(self.num_vertices)]
         distances[depart] = 0
         k = 0
         stable = False
+        statistiques = self._statistiques
         while not stable and k < self.num_vertices:
             stable = True
-            for (source, dest) in self.ponderations.keys():
-                demeure_stable, distances, predecesseurs = self._relaxer(dest, source, distances, predecesseurs)
+            for (source, dest, pond) in self._aretes_ponderees():
+                demeure_stable, distances, predecesseurs = self._relaxer(dest, source, distances, predecesseurs, pond)
                 stable = stable and demeure_stable
+                if statistiques is not None:
+                    statistiques.aretes_relaxees += 1
+                    statistiques.relaxations_reussies += not demeure_stable
             k += 1
         if not stable:
-            raise ValueError("Cycle de poids négatif détecté")
+            raise CycleNegatif(_cycle_dans_predecesseurs(predecesseurs))
         return predecesseurs, distances
+
+    def spfa(self, depart, statistiques=None):
+        """
+        Variante de Bellman-Ford pilotée par une file (Shortest Path Faster Algorithm): seules les arêtes sortant d'un
+        sommet dont la distance vient de diminuer sont relaxées de nouveau.  Un cycle négatif est détecté dès qu'un
+        chemin courant compte autant d'arêtes que le graphe a de sommets.
+        Le résultat est mémorisé si le cache est activé (voir activer_cache).
+        :param depart: Numéro du sommet de départ
+        :param statistiques: Collecteur Statistiques facultatif, alimenté par cet appel (voir instrumenter)
+        :return: (pred, dist) la liste des prédécesseurs et la liste des distances minimales.
+        :raises: CycleNegatif (une ValueError) si un cycle de poids négatif est accessible, avec ses sommets.
+        """
+        return self._mesurer("spfa", statistiques,
+                             lambda: self._avec_cache(("spfa", depart), lambda: self._spfa(depart)))
+
+    def _spfa(self, depart):
+        """Calcul de spfa, sans passer par le cache."""
+        assert self._numero_de_sommet_est_valide(depart)
+        predecesseurs = [None for _ in range(self.num_vertices)]
+        distances = [math.inf for _ in range(self.num_vertices)]
+        distances[depart] = 0
+        longueurs = [0 for _ in range(self.num_vertices)]
+        en_file = [False for _ in range(self.num_vertices)]
+        en_file[depart] = True
+        file = deque([depart])
+        limite = self.nombre_de_sommets()
+        statistiques = self._statistiques
+        if statistiques is not None:
+            statistiques.insertions_file += 1
+        while file:
+            courant = file.popleft()
+            en_file[courant] = False
+            if statistiques is not None:
+                statistiques.extractions_file += 1
+                statistiques.aretes_relaxees += len(self._liste_adjacence_pour_le_sommet(courant))
+            for voisin, pond in self._aretes_ponderees_du_sommet(courant):
+                stable, distances, predecesseurs = self._relaxer(voisin, courant, distances, predecesseurs, pond)
+                if not stable:
+                    if statistiques is not None:
+                        statistiques.relaxations_reussies += 1
+                    longueurs[voisin] = longueurs[courant] + 1
+                    if longueurs[voisin] >= limite:
+                        raise CycleNegatif(_cycle_dans_predecesseurs(predecesseurs, voisin))
+                    if not en_file[voisin]:
+                        en_file[voisin] = True
+                        file.append(voisin)
+                        if statistiques is not None:
+                            statistiques.insertions_file += 1
+        return predecesseurs, distances
+
+    def hierarchie_de_contraction(self, limite_temoins=500):
+        """
+        Prétraitement en hiérarchie de contraction, pour des requêtes point à point répétées sur un graphe qui ne change
+        plus.  Voir le module HierarchieDeContraction.  NB: les pondérations doivent être positives ou nulles.
+        :param limite_temoins: Nombre maximal de sommets résolus par recherche de témoins
+        :return: Un objet HierarchieDeContraction, indépendant du graphe et sauvegardable.
+        """
+        from HierarchieDeContraction import HierarchieDeContraction
+        return HierarchieDeContraction.construire(self, limite_temoins)
+
+    def plus_courts_chemins_tous_couples(self, sources=None, processus=None, taille_lot=16):
+        """
+        Plus courts chemins entre tous les couples (algorithme de Johnson): les pondérations négatives sont corrigées
+        une seule fois par des potentiels, puis les Dijkstra par source sont répartis sur un groupe de processus qui
+        lisent le graphe en mémoire partagée.  Voir le module CheminsTousCouples.
+        :param sources: Sommets de départ, par défaut tous les sommets
+        :param processus: Nombre de processus, par défaut le nombre de processeurs.  Avec 1, tout est calculé dans le
+        processus courant.
+        :param taille_lot: Nombre de sources confiées à un processus à la fois
+        :return: Un générateur de paires (source, distances), dans l'ordre des sources, où distances est un array('d')
+        valant math.inf pour les sommets inaccessibles.  Les rangées sont produites au fur et à mesure, la matrice
+        complète n'est jamais conservée.
+        :raises: CycleNegatif si un cycle de poids négatif est présent.
+        """
+        from CheminsTousCouples import plus_courts_chemins_tous_couples
+        return plus_courts_chemins_tous_couples(self, sources, processus, taille_lot)
+
+    def figer(self):
+        """
+        Construit une copie en lecture seule du graphe en format CSR, les pondérations étant rangées dans un tableau
+        parallèle aux destinations.
+        :return: Un DigraphePondereFige offrant la même interface de consultation.
+        """
+        from DigraphePondereFige import DigraphePondereFige
+        offsets, targets, weights = DigraphePondereFige.tableaux_csr(self)
+        return DigraphePondereFige(offsets, targets, weights, bytearray(self._retires))
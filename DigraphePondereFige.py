@@ -0,0 +1,84 @@
+from array import array
+
+from DigrapheFige import DigrapheFige
+from DigraphePondere import DigraphePondere
+
+
+class DigraphePondereFige(DigrapheFige, DigraphePondere):
+    """
+    Digraphe pondéré en lecture seule, en format CSR.  La pondération de l'arête rangée en targets[i] est weights[i],
+    un array('d') parallèle, ce qui remplace le dictionnaire indexé par des tuples (source, arrivée).
+    """
+
+    @staticmethod
+    def tableaux_csr(graphe):
+        """
+        Construit les tableaux CSR d'un digraphe pondéré quelconque.
+        :param graphe: Digraphe pondéré source
+        :return: (offsets, targets, weights) deux array('q') et un array('d').
+        """
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for sommet in range(graphe.num_vertices):
+            if graphe.sommet_existe(sommet):
+                for voisin, pond in graphe._aretes_ponderees_du_sommet(sommet):
+                    targets.append(voisin)
+                    weights.append(pond)
+            offsets.append(len(targets))
+        return offsets, targets, weights
+
+    @staticmethod
+    def depuis_matrice_creuse(matrice):
+        """
+        Construit un digraphe pondéré figé d'après une matrice creuse SciPy carrée: une arête s -> d par élément (s, d)
+        stocké, de pondération la valeur de l'élément.
+        :param matrice: Matrice creuse
+        :return: Le digraphe pondéré figé
+        :raises: ImportError si SciPy n'est pas installé.
+        """
+        from MatriceCreuse import tableaux_depuis_matrice_creuse
+        return DigraphePondereFige(*tableaux_depuis_matrice_creuse(matrice, True))
+
+    def __init__(self, offsets, targets, weights, retires=None):
+        """
+        Construit un digraphe pondéré figé à partir de ses tableaux CSR.
+        :param offsets: Tableau de num_vertices + 1 entiers croissants, débutant à 0 et finissant à len(targets).
+        :param targets: Tableau des destinations, rangées par sommet source.
+        :param weights: Tableau des pondérations, parallèle à targets.
+        :param retires: Marques facultatives (bytearray) des sommets retirés en différé, sans arête.
+        """
+        self.weights = weights
+        self._vue_weights = memoryview(weights)
+        super().__init__(offsets, targets, retires)
+
+    def _invariant(self):
+        """
+        Validité de l'instance: tableaux CSR valides et une pondération par arête.
+        :return: True si l'instance est valide
+        """
+        return len(self.weights) == len(self.targets) and super()._invariant()
+
+    def lire_ponderation(self, source, dest):
+        assert(self._numero_de_sommet_est_valide(source) and self._numero_de_sommet_est_valide(dest))
+        position = self._position_de_l_arete(source, dest)
+        assert(position >= 0)
+        return self.weights[position]
+
+    def _aretes_ponderees_du_sommet(self, sommet):
+        assert(self._numero_de_sommet_est_valide(sommet))
+        debut, fin = self.offsets[sommet], self.offsets[sommet + 1]
+        return zip(self._vue_targets[debut:fin], self._vue_weights[debut:fin])
+
+    def _aretes_ponderees(self):
+        for source in self.sommets():
+            for dest, pond in self._aretes_ponderees_du_sommet(source):
+                yield source, dest, pond
+
+    def graphe_inverse(self):
+        """
+        Retourne le graphe inverse figé, chaque arête inversée conservant sa pondération.
+        :return: Le graphe inverse
+        """
+        offsets, sources, positions = self._sources_inverses()
+        return DigraphePondereFige(offsets, sources, array('d', (self.weights[i] for i in positions)), self._retires)
@@ -0,0 +1,66 @@
+"""
+Lecture au fil de l'eau des fichiers de listes d'arêtes.
+
+Chaque ligne non vide décrit une arête: le numéro de la source, celui de l'arrivée et, pour un digraphe pondéré, la
+pondération facultative.  Les colonnes sont séparées par des espaces, des tabulations ou des virgules (CSV), ou par un
+séparateur imposé.  Les lignes débutant par # ou % sont des commentaires.  Un fichier compressé par gzip est reconnu à
+sa signature, quel que soit son nom.
+
+Le fichier est lu par blocs tamponnés et chaque arête est produite dès sa ligne lue: ni le texte ni la liste des arêtes
+ne sont conservés, la mémoire occupée reste celle du digraphe construit.
+"""
+import gzip
+import io
+
+_SIGNATURE_GZIP = b"\x1f\x8b"
+_TAILLE_DES_BLOCS = 1 << 20
+
+
+def _ouvrir(fichier):
+    """
+    Ouvre le fichier en texte, en le décompressant s'il porte la signature gzip.  Le flux binaire appartient au flux
+    texte retourné, qui le ferme avec lui.
+    """
+    with open(fichier, "rb") as entree:
+        compresse = entree.read(len(_SIGNATURE_GZIP)) == _SIGNATURE_GZIP
+    if compresse:
+        brut = io.BufferedReader(gzip.open(fichier, "rb"), buffer_size=_TAILLE_DES_BLOCS)
+    else:
+        brut = open(fichier, "rb", buffering=_TAILLE_DES_BLOCS)
+    return io.TextIOWrapper(brut, encoding="utf-8")
+
+
+def lire_aretes(fichier, separateur=None, entete=False, ponderee=False):
+    """
+    Énumère les arêtes d'un fichier de liste d'arêtes.
+    :param fichier: Chemin du fichier
+    :param separateur: Séparateur des colonnes; par défaut, espaces, tabulations ou virgules
+    :param entete: True pour sauter la première ligne
+    :param ponderee: True pour lire la troisième colonne comme pondération
+    :return: Un générateur de tuples (source, arrivée) ou, si ponderee et que la ligne en a une, (source, arrivée,
+    pondération).
+    :raises: ValueError si une ligne n'est pas une arête ou porte un numéro de sommet négatif, avec son numéro.
+    """
+    with _ouvrir(fichier) as texte:
+        if entete:
+            next(texte, None)
+        for numero, ligne in enumerate(texte, 2 if entete else 1):
+            if separateur is None:
+                colonnes = ligne.replace(",", " ").split()
+            else:
+                colonnes = [colonne.strip() for colonne in ligne.split(separateur)]
+            if not colonnes or not colonnes[0] or colonnes[0][0] in "#%":
+                continue
+            try:
+                if len(colonnes) not in (2, 3):
+                    raise ValueError(f"{len(colonnes)} colonnes")
+                source, dest = int(colonnes[0]), int(colonnes[1])
+                if source < 0 or dest < 0:
+                    raise ValueError("numéro de sommet négatif")
+                if len(colonnes) == 3 and ponderee:
+                    arete = source, dest, float(colonnes[2])
+                else:
+                    arete = source, dest
+            except ValueError as erreur:
+                raise ValueError(f"{fichier}, ligne {numero}: arête invalide ({erreur}).") from erreur
+            yield arete
@@ -0,0 +1,104 @@
+"""
+Format binaire versionné des digraphes, projetable en mémoire (mmap) sans analyse ni copie.
+
+Disposition, en ordre d'octets petit-boutiste:
+ - entête de 32 octets: signature b"DGRF", version du format (H), drapeaux (H), nombre de sommets (q), nombre d'arêtes
+   (q), somme de contrôle CRC-32 du contenu (I, 0 sans somme), 4 octets de bourrage;
+ - offsets: nombre de sommets + 1 entiers (q);
+ - targets: nombre d'arêtes entiers (q);
+ - weights: nombre d'arêtes flottants (d), pour un digraphe pondéré seulement;
+ - une marque de retrait par sommet (octets).
+Tous les tableaux débutent sur une frontière de 8 octets, ce qui permet de les projeter directement en memoryview typées:
+un digraphe chargé par projection partage les pages du fichier, par le cache de pages du système, avec tous les
+processus qui le chargent aussi.
+"""
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+
+_SIGNATURE = b"DGRF"
+_VERSION = 1
+_ENTETE = struct.Struct("<4sHHqqI4x")
+PONDERE = 1
+SOMME_DE_CONTROLE = 2
+
+
+def _tableaux(fige):
+    """Tableaux du digraphe figé, dans l'ordre du fichier."""
+    tableaux = [fige.offsets, fige.targets]
+    if hasattr(fige, "weights"):
+        tableaux.append(fige.weights)
+    return tableaux
+
+
+def _octets(tableau):
+    """Octets petit-boutistes d'un tableau de 8 octets par élément."""
+    if sys.byteorder == "little":
+        return memoryview(tableau).cast('B')
+    copie = array(memoryview(tableau).format, tableau)
+    copie.byteswap()
+    return memoryview(copie).cast('B')
+
+
+def sauvegarder(graphe, fichier, somme_de_controle=True):
+    """
+    Voir DigrapheNonPondere.sauvegarder.
+    """
+    fige = graphe.figer()
+    morceaux = [_octets(tableau) for tableau in _tableaux(fige)] + [memoryview(bytes(fige._retires))]
+    drapeaux = PONDERE if hasattr(fige, "weights") else 0
+    somme = 0
+    if somme_de_controle:
+        drapeaux |= SOMME_DE_CONTROLE
+        for morceau in morceaux:
+            somme = zlib.crc32(morceau, somme)
+    with open(fichier, "wb") as sortie:
+        sortie.write(_ENTETE.pack(_SIGNATURE, _VERSION, drapeaux, fige.num_vertices, len(fige.targets), somme))
+        for morceau in morceaux:
+            sortie.write(morceau)
+
+
+def charger(fichier, projeter=True, verifier=False):
+    """
+    Voir DigrapheNonPondere.charger.
+    """
+    with open(fichier, "rb") as entree:
+        entete = entree.read(_ENTETE.size)
+        if len(entete) != _ENTETE.size:
+            raise ValueError(f"{fichier} n'est pas un fichier de digraphe.")
+        signature, version, drapeaux, nb_sommets, nb_aretes, somme = _ENTETE.unpack(entete)
+        if signature != _SIGNATURE:
+            raise ValueError(f"{fichier} n'est pas un fichier de digraphe.")
+        if version != _VERSION:
+            raise ValueError(f"{fichier} est en version {version} du format, seule la version {_VERSION} est lue.")
+        formats = ['q', 'q'] + (['d'] if drapeaux & PONDERE else [])
+        longueurs = [nb_sommets + 1, nb_aretes, nb_aretes]
+        taille = _ENTETE.size + 8 * sum(longueurs[:len(formats)]) + nb_sommets
+        if projeter:
+            contenu = memoryview(mmap.mmap(entree.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            entree.seek(0)
+            contenu = memoryview(entree.read())
+    if len(contenu) != taille:
+        raise ValueError(f"{fichier} est tronqué ou corrompu: {len(contenu)} octets au lieu de {taille}.")
+    if verifier and drapeaux & SOMME_DE_CONTROLE and zlib.crc32(contenu[_ENTETE.size:]) != somme:
+        raise ValueError(f"La somme de contrôle de {fichier} ne correspond pas à son contenu.")
+    tableaux = []
+    debut = _ENTETE.size
+    for format_, longueur in zip(formats, longueurs):
+        vue = contenu[debut:debut + 8 * longueur]
+        if sys.byteorder == "little":
+            tableaux.append(vue.cast(format_))
+        else:
+            copie = array(format_, vue.tobytes())
+            copie.byteswap()
+            tableaux.append(copie)
+        debut += 8 * longueur
+    retires = bytearray(contenu[debut:])
+    if drapeaux & PONDERE:
+        from DigraphePondereFige import DigraphePondereFige
+        return DigraphePondereFige(*tableaux, retires)
+    from DigrapheFige import DigrapheFige
+    return DigrapheFige(*tableaux, retires)
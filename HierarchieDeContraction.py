@@ -0,0 +1,319 @@
+"""
+Hiérarchie de contraction (contraction hierarchies) d'un digraphe pondéré à pondérations positives ou nulles, pour
+répondre à de très nombreuses requêtes de distance point à point sur un graphe qui change peu.
+
+Le prétraitement contracte les sommets un à un, du moins important au plus important.  Contracter v le retire du graphe
+restant en ajoutant un raccourci (u, w) de poids w(u, v) + w(v, w) pour chaque chemin u -> v -> w qui n'a pas de
+témoin, c'est-à-dire de chemin au plus aussi court évitant v.  L'ordre de contraction donne le rang de chaque sommet.
+Une requête est alors un Dijkstra bidirectionnel qui ne fait que monter en rang: vers l'avant depuis le départ dans le
+graphe montant, vers l'arrière depuis l'arrivée dans le graphe descendant, ce qui n'explore qu'une petite partie du
+graphe.
+
+Les deux graphes sont rangés en CSR, comme DigrapheFige: le graphe montant donne, pour chaque sommet, ses arêtes vers
+des sommets de rang supérieur; le graphe descendant donne, pour chaque sommet, les arêtes qui y arrivent depuis des
+sommets de rang supérieur.  Chaque arête porte le sommet contracté qu'elle court-circuite, -1 pour une arête du graphe
+d'origine, ce qui permet de déplier les chemins.  L'index se sauvegarde et se recharge tel quel (sauvegarder, charger).
+"""
+import heapq
+import math
+import struct
+from array import array
+
+_ENTETE = b"HDC1"
+_FORMATS = ('q', 'q', 'q', 'd', 'q', 'q', 'q', 'd', 'q')
+
+
+class HierarchieDeContraction:
+    """
+    Index de requêtes point à point construit par construire() ou rechargé par charger().
+    """
+
+    _ARITE_INDEXEE = 64
+
+    def __init__(self, rangs, montant, descendant):
+        """
+        :param rangs: array('q') du rang de contraction de chaque sommet
+        :param montant: (offsets, cibles, ponderations, milieux) du graphe montant en CSR
+        :param descendant: (offsets, sources, ponderations, milieux) du graphe descendant en CSR
+        """
+        self.num_vertices = len(rangs)
+        self.rangs = rangs
+        self.montant = montant
+        self.descendant = descendant
+        self._positions = ({}, {})
+        assert(self._invariant())
+
+    def _invariant(self):
+        """
+        Chaque arête relie un sommet à un sommet de rang supérieur, et les tableaux de chaque graphe sont cohérents.
+        """
+        for offsets, extremites, ponderations, milieux in (self.montant, self.descendant):
+            if len(offsets) != self.num_vertices + 1 or offsets[-1] != len(extremites):
+                return False
+            if len(ponderations) != len(extremites) or len(milieux) != len(extremites):
+                return False
+            for sommet in range(self.num_vertices):
+                for position in range(offsets[sommet], offsets[sommet + 1]):
+                    if self.rangs[extremites[position]] <= self.rangs[sommet]:
+                        return False
+        return True
+
+    @staticmethod
+    def construire(graphe, limite_temoins=500):
+        """
+        Contracte tous les sommets d'un digraphe pondéré.  Les sommets sont contractés par ordre croissant de leur
+        différence d'arêtes (raccourcis ajoutés moins arêtes retirées) plus leur nombre de voisins déjà contractés,
+        priorité réévaluée paresseusement au moment de les contracter.
+        :param graphe: DigraphePondere à pondérations positives ou nulles
+        :param limite_temoins: Nombre maximal de sommets résolus par recherche de témoins.  Au-delà, le raccourci est
+        ajouté sans preuve qu'il est nécessaire, ce qui reste correct mais alourdit l'index.
+        :return: La hiérarchie
+        """
+        assert all(pond >= 0 for _, _, pond in graphe._aretes_ponderees())
+        nb_sommets = graphe.num_vertices
+        sortants = [{} for _ in range(nb_sommets)]
+        entrants = [{} for _ in range(nb_sommets)]
+        for source, dest, pond in graphe._aretes_ponderees():
+            if source == dest:
+                continue
+            sortants[source][dest] = pond
+            entrants[dest][source] = pond
+        milieux = {}
+        contractes_voisins = [0 for _ in range(nb_sommets)]
+
+        def priorite(sommet):
+            raccourcis = _raccourcis(sommet, sortants, entrants, limite_temoins)
+            return len(raccourcis) - len(sortants[sommet]) - len(entrants[sommet]) + contractes_voisins[sommet]
+
+        en_attente = [(priorite(sommet), sommet) for sommet in range(nb_sommets)]
+        heapq.heapify(en_attente)
+        rangs = array('q', bytes(8 * nb_sommets))
+        montants = [None for _ in range(nb_sommets)]
+        descendants = [None for _ in range(nb_sommets)]
+        rang = 0
+        while en_attente:
+            _, sommet = heapq.heappop(en_attente)
+            actuelle = priorite(sommet)
+            if en_attente and actuelle > en_attente[0][0]:
+                heapq.heappush(en_attente, (actuelle, sommet))
+                continue
+            for source, dest, pond in _raccourcis(sommet, sortants, entrants, limite_temoins):
+                if pond < sortants[source].get(dest, math.inf):
+                    sortants[source][dest] = pond
+                    entrants[dest][source] = pond
+                    milieux[source, dest] = sommet
+            rangs[sommet] = rang
+            rang += 1
+            montants[sommet] = [(dest, pond, milieux.get((sommet, dest), -1))
+                                for dest, pond in sortants[sommet].items()]
+            descendants[sommet] = [(source, pond, milieux.get((source, sommet), -1))
+                                   for source, pond in entrants[sommet].items()]
+            for dest in sortants[sommet]:
+                del entrants[dest][sommet]
+                contractes_voisins[dest] += 1
+            for source in entrants[sommet]:
+                del sortants[source][sommet]
+                contractes_voisins[source] += 1
+            sortants[sommet] = {}
+            entrants[sommet] = {}
+        return HierarchieDeContraction(rangs, _en_csr(montants), _en_csr(descendants))
+
+    def _arcs(self, graphe, sommet):
+        offsets, extremites, ponderations, _ = graphe
+        for position in range(offsets[sommet], offsets[sommet + 1]):
+            yield extremites[position], ponderations[position]
+
+    def _recherche(self, depart, arrivee):
+        """
+        Dijkstra bidirectionnel montant.  Chaque direction s'arrête dès que la plus petite distance en attente atteint
+        la meilleure distance trouvée.
+        :return: (distance, sommet de rencontre, prédécesseurs avant, prédécesseurs arrière)
+        """
+        assert 0 <= depart < self.num_vertices and 0 <= arrivee < self.num_vertices
+        distances = ({depart: 0.0}, {arrivee: 0.0})
+        predecesseurs = ({depart: None}, {arrivee: None})
+        tas = ([(0.0, depart)], [(0.0, arrivee)])
+        graphes = (self.montant, self.descendant)
+        meilleure = 0.0 if depart == arrivee else math.inf
+        rencontre = depart if depart == arrivee else None
+        while (tas[0] and tas[0][0][0] < meilleure) or (tas[1] and tas[1][0][0] < meilleure):
+            if not tas[1] or tas[1][0][0] >= meilleure:
+                sens = 0
+            elif not tas[0] or tas[0][0][0] >= meilleure:
+                sens = 1
+            else:
+                sens = 0 if tas[0][0][0] <= tas[1][0][0] else 1
+            distance, courant = heapq.heappop(tas[sens])
+            if distance > distances[sens][courant]:
+                continue
+            for voisin, pond in self._arcs(graphes[sens], courant):
+                candidate = distance + pond
+                if candidate < distances[sens].get(voisin, math.inf):
+                    distances[sens][voisin] = candidate
+                    predecesseurs[sens][voisin] = courant
+                    heapq.heappush(tas[sens], (candidate, voisin))
+                    totale = candidate + distances[1 - sens].get(voisin, math.inf)
+                    if totale < meilleure:
+                        meilleure, rencontre = totale, voisin
+        return meilleure, rencontre, predecesseurs[0], predecesseurs[1]
+
+    def distance(self, depart, arrivee):
+        """
+        :param depart: Numéro du sommet de départ
+        :param arrivee: Numéro du sommet d'arrivée
+        :return: La distance minimale de départ à arrivée, math.inf si l'arrivée est inaccessible.
+        """
+        return self._recherche(depart, arrivee)[0]
+
+    def chemin(self, depart, arrivee):
+        """
+        :param depart: Numéro du sommet de départ
+        :param arrivee: Numéro du sommet d'arrivée
+        :return: (distance, chemin) où chemin est la liste des sommets d'un plus court chemin dans le graphe d'origine,
+        raccourcis dépliés, ou (math.inf, None) si l'arrivée est inaccessible.
+        """
+        meilleure, rencontre, avant, arriere = self._recherche(depart, arrivee)
+        if rencontre is None:
+            return math.inf, None
+        montee = [rencontre]
+        while avant[montee[-1]] is not None:
+            montee.append(avant[montee[-1]])
+        montee.reverse()
+        descente = [rencontre]
+        while arriere[descente[-1]] is not None:
+            descente.append(arriere[descente[-1]])
+        sommets = montee + descente[1:]
+        chemin = [sommets[0]]
+        for source, dest in zip(sommets, sommets[1:]):
+            self._deplier(source, dest, chemin)
+        return meilleure, chemin
+
+    def _milieu(self, source, dest):
+        """
+        Sommet court-circuité par l'arête (source, dest) de la hiérarchie, -1 pour une arête d'origine.  Comme dans
+        DigrapheFige, une ligne de plus de _ARITE_INDEXEE arêtes est consultée par un dictionnaire des positions
+        construit au premier besoin, et une ligne courte par array.index.
+        """
+        sens = 0 if self.rangs[source] < self.rangs[dest] else 1
+        offsets, extremites, _, milieux = self.descendant if sens else self.montant
+        depuis, cherche = (dest, source) if sens else (source, dest)
+        debut, fin = offsets[depuis], offsets[depuis + 1]
+        if fin - debut <= self._ARITE_INDEXEE:
+            return milieux[extremites.index(cherche, debut, fin)]
+        positions = self._positions[sens].get(depuis)
+        if positions is None:
+            positions = {extremite: position for position, extremite in enumerate(extremites[debut:fin], debut)}
+            self._positions[sens][depuis] = positions
+        return milieux[positions[cherche]]
+
+    def _deplier(self, source, dest, chemin):
+        """Ajoute à chemin les sommets de l'arête (source, dest) dépliée, sauf source."""
+        pile = [(source, dest)]
+        while pile:
+            source, dest = pile.pop()
+            milieu = self._milieu(source, dest)
+            if milieu < 0:
+                chemin.append(dest)
+            else:
+                pile.append((milieu, dest))
+                pile.append((source, milieu))
+
+    def _tableaux(self):
+        return (self.rangs,) + tuple(self.montant) + tuple(self.descendant)
+
+    def sauvegarder(self, fichier):
+        """
+        Écrit l'index dans un fichier binaire: une entête, la longueur de chaque tableau, puis les tableaux bruts dans
+        l'ordre d'octets de la machine.
+        :param fichier: Chemin du fichier
+        :return: None
+        """
+        tableaux = self._tableaux()
+        with open(fichier, "wb") as sortie:
+            sortie.write(_ENTETE)
+            sortie.write(struct.pack(f"<{len(tableaux)}q", *(len(tableau) for tableau in tableaux)))
+            for tableau in tableaux:
+                tableau.tofile(sortie)
+
+    @staticmethod
+    def charger(fichier):
+        """
+        Relit un index écrit par sauvegarder.
+        :param fichier: Chemin du fichier
+        :return: La hiérarchie
+        :raises: ValueError si le fichier n'est pas un index de hiérarchie de contraction.
+        """
+        with open(fichier, "rb") as entree:
+            if entree.read(len(_ENTETE)) != _ENTETE:
+                raise ValueError(f"{fichier} n'est pas une hiérarchie de contraction.")
+            try:
+                longueurs = struct.unpack(f"<{len(_FORMATS)}q", entree.read(8 * len(_FORMATS)))
+                tableaux = []
+                for format_, longueur in zip(_FORMATS, longueurs):
+                    tableau = array(format_)
+                    tableau.fromfile(entree, longueur)
+                    tableaux.append(tableau)
+            except (struct.error, EOFError) as erreur:
+                raise ValueError(f"{fichier} est une hiérarchie de contraction tronquée.") from erreur
+        return HierarchieDeContraction(tableaux[0], tuple(tableaux[1:5]), tuple(tableaux[5:9]))
+
+
+def _raccourcis(sommet, sortants, entrants, limite_temoins):
+    """
+    Raccourcis nécessaires à la contraction d'un sommet dans le graphe restant.
+    :return: Liste de triplets (source, arrivée, pondération)
+    """
+    raccourcis = []
+    for source, vers_sommet in entrants[sommet].items():
+        cibles = {dest: vers_sommet + pond for dest, pond in sortants[sommet].items() if dest != source}
+        if not cibles:
+            continue
+        distances = _temoins(source, sommet, max(cibles.values()), cibles, sortants, limite_temoins)
+        raccourcis.extend((source, dest, pond) for dest, pond in cibles.items()
+                          if distances.get(dest, math.inf) > pond)
+    return raccourcis
+
+
+def _temoins(depart, exclu, borne, cibles, sortants, limite_temoins):
+    """
+    Dijkstra depuis départ dans le graphe restant privé du sommet exclu, arrêté à la borne, une fois toutes les cibles
+    résolues ou après limite_temoins sommets résolus.
+    :return: Dictionnaire des distances des sommets résolus
+    """
+    resolues = {}
+    restantes = len(cibles)
+    en_attente = [(0.0, depart)]
+    while en_attente and len(resolues) < limite_temoins:
+        distance, courant = heapq.heappop(en_attente)
+        if courant in resolues:
+            continue
+        if distance > borne:
+            break
+        resolues[courant] = distance
+        if courant in cibles:
+            restantes -= 1
+            if restantes == 0:
+                break
+        for voisin, pond in sortants[courant].items():
+            if voisin != exclu and voisin not in resolues:
+                heapq.heappush(en_attente, (distance + pond, voisin))
+    return resolues
+
+
+def _en_csr(arcs):
+    """
+    Range des listes d'arcs par sommet en CSR.
+    :param arcs: Pour chaque sommet, la liste de ses triplets (extrémité, pondération, milieu)
+    :return: (offsets, extremites, ponderations, milieux)
+    """
+    offsets = array('q', [0])
+    extremites = array('q')
+    ponderations = array('d')
+    milieux = array('q')
+    for liste in arcs:
+        for extremite, pond, milieu in liste:
+            extremites.append(extremite)
+            ponderations.append(pond)
+            milieux.append(milieu)
+        offsets.append(len(extremites))
+    return offsets, extremites, ponderations, milieux
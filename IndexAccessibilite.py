@@ -0,0 +1,171 @@
+"""
+Index d'accessibilité d'un digraphe: répond à « u atteint-il v ? » sans nouvelle exploration par requête.
+
+Le graphe est d'abord condensé en le graphe acyclique de ses composantes fortement connexes (kosaraju): deux sommets
+d'une même composante s'atteignent mutuellement, et u atteint v si et seulement si la composante de u atteint celle de
+v.  Deux représentations sont ensuite possibles:
+ - la fermeture transitive de la condensation, une ligne de bits par composante rangée dans un entier Python: les
+   composantes étant traitées successeurs d'abord, la ligne d'une composante est le OU des lignes de ses successeurs
+   plus son propre bit.  Chaque ligne est ensuite convertie en octets, et chaque requête est un test de bit dans un
+   octet, en O(1);
+ - si la fermeture dépasse la taille permise (C²/8 octets pour C composantes), un étiquetage par intervalles à la
+   GRAIL: quelques parcours en profondeur de la condensation, dans des ordres aléatoires, donnent à chaque composante
+   un intervalle [plus petit rang de postordre atteint, son rang de postordre] par parcours.  Si u atteint v, chaque
+   intervalle de v est inclus dans celui de u: la plupart des réponses négatives sont immédiates, et les autres
+   requêtes explorent la condensation en écartant tout successeur dont les intervalles excluent v.
+Les réponses sont exactes dans les deux cas.
+"""
+import random
+
+MAX_OCTETS = 64 * 1024 * 1024
+
+
+class IndexAccessibilite:
+    """
+    Index construit sur l'état d'un digraphe au moment de sa création: après une modification du graphe, il faut le
+    reconstruire (voir version).
+    """
+
+    def __init__(self, graphe, max_octets=MAX_OCTETS, nombre_d_intervalles=3, graine=0):
+        """
+        :param graphe: Digraphe à indexer
+        :param max_octets: Taille maximale de la fermeture transitive, au-delà de laquelle l'étiquetage par intervalles
+        est utilisé
+        :param nombre_d_intervalles: Nombre de parcours de l'étiquetage par intervalles
+        :param graine: Graine des ordres aléatoires de ces parcours
+        """
+        self.version = graphe.version()
+        self.num_vertices = graphe.num_vertices
+        self.composantes = graphe.kosaraju()
+        self.composante_de = [None for _ in range(graphe.num_vertices)]
+        for numero, composante in enumerate(self.composantes):
+            for sommet in composante:
+                self.composante_de[sommet] = numero
+        self.successeurs = [set() for _ in self.composantes]
+        for numero, composante in enumerate(self.composantes):
+            for sommet in composante:
+                for voisin in graphe._liste_adjacence_pour_le_sommet(sommet):
+                    if self.composante_de[voisin] != numero:
+                        self.successeurs[numero].add(self.composante_de[voisin])
+        self.fermeture = None
+        self.intervalles = None
+        if len(self.composantes) ** 2 // 8 <= max_octets:
+            self._calculer_fermeture()
+        else:
+            self._calculer_intervalles(nombre_d_intervalles, random.Random(graine))
+
+    def _calculer_fermeture(self):
+        """
+        Fermeture transitive en bits.  kosaraju rend chaque composante après celles qu'elle atteint, d'où un seul
+        balayage dans l'ordre des composantes.  Les lignes sont calculées en entiers, pour des OU rapides, puis
+        converties en octets: tester un bit d'un entier en décale toute la ligne, en O(C).
+        """
+        self.fermeture = []
+        for numero, successeurs in enumerate(self.successeurs):
+            ligne = 1 << numero
+            for successeur in successeurs:
+                ligne |= self.fermeture[successeur]
+            self.fermeture.append(ligne)
+        taille = (len(self.composantes) + 7) // 8
+        for numero, ligne in enumerate(self.fermeture):
+            self.fermeture[numero] = ligne.to_bytes(taille, "little")
+
+    def _calculer_intervalles(self, nombre, aleatoire):
+        """
+        Étiquetage par intervalles: pour chaque parcours, bas[c] est le plus petit rang de postordre du sous-graphe
+        atteint depuis c, et rang[c] le rang de postordre de c.
+        """
+        nb_composantes = len(self.composantes)
+        self.intervalles = []
+        for _ in range(nombre):
+            bas = [0 for _ in range(nb_composantes)]
+            rangs = [-1 for _ in range(nb_composantes)]
+            compteur = 0
+            racines = list(range(nb_composantes))
+            aleatoire.shuffle(racines)
+            for racine in racines:
+                if rangs[racine] != -1:
+                    continue
+                rangs[racine] = -2
+                pile = [(racine, self._successeurs_melanges(racine, aleatoire))]
+                while pile:
+                    courante, successeurs = pile[-1]
+                    for successeur in successeurs:
+                        if rangs[successeur] == -1:
+                            rangs[successeur] = -2
+                            pile.append((successeur, self._successeurs_melanges(successeur, aleatoire)))
+                            break
+                    else:
+                        pile.pop()
+                        rangs[courante] = compteur
+                        bas[courante] = min([compteur] + [bas[successeur] for successeur in self.successeurs[courante]])
+                        compteur += 1
+            self.intervalles.append((bas, rangs))
+
+    def _successeurs_melanges(self, composante, aleatoire):
+        successeurs = list(self.successeurs[composante])
+        aleatoire.shuffle(successeurs)
+        return iter(successeurs)
+
+    def _intervalles_contiennent(self, source, dest):
+        """Faux si un intervalle de dest n'est pas inclus dans celui de source, preuve que source n'atteint pas dest."""
+        return all(bas[source] <= bas[dest] and rangs[dest] <= rangs[source] for bas, rangs in self.intervalles)
+
+    def _composante_atteint(self, source, dest):
+        if source == dest:
+            return True
+        if self.fermeture is not None:
+            return bool(self.fermeture[source][dest >> 3] >> (dest & 7) & 1)
+        if not self._intervalles_contiennent(source, dest):
+            return False
+        visitees = {source}
+        pile = [source]
+        while pile:
+            courante = pile.pop()
+            for successeur in self.successeurs[courante]:
+                if successeur == dest:
+                    return True
+                if successeur not in visitees and self._intervalles_contiennent(successeur, dest):
+                    visitees.add(successeur)
+                    pile.append(successeur)
+        return False
+
+    def _composante_du_sommet(self, sommet):
+        """
+        :return: Le numéro de la composante du sommet.
+        :raises: ValueError si le sommet n'existait pas dans le graphe indexé.
+        """
+        composante = self.composante_de[sommet] if 0 <= sommet < self.num_vertices else None
+        if composante is None:
+            raise ValueError(f"{sommet} n'est pas un sommet du graphe indexé.")
+        return composante
+
+    def atteignable(self, source, dest):
+        """
+        :param source: Numéro du sommet de départ
+        :param dest: Numéro du sommet d'arrivée
+        :return: True si un chemin, éventuellement vide, mène de source à dest.
+        :raises: ValueError si source ou dest n'existait pas dans le graphe indexé.
+        """
+        return self._composante_atteint(self._composante_du_sommet(source), self._composante_du_sommet(dest))
+
+    def atteignables_en_lot(self, paires):
+        """
+        :param paires: Itérable de paires (source, dest)
+        :return: La liste des réponses de atteignable, dans l'ordre des paires.
+        :raises: ValueError si une source ou une destination n'existait pas dans le graphe indexé.
+        """
+        composante_de, nb_sommets, fermeture = self.composante_de, self.num_vertices, self.fermeture
+        reponses = []
+        for source, dest in paires:
+            if 0 <= source < nb_sommets and 0 <= dest < nb_sommets:
+                premiere, numero = composante_de[source], composante_de[dest]
+                if premiere is not None and numero is not None:
+                    if fermeture is not None:
+                        reponses.append(bool(fermeture[premiere][numero >> 3] >> (numero & 7) & 1))
+                    else:
+                        reponses.append(self._composante_atteint(premiere, numero))
+                    continue
+            self._composante_du_sommet(source)
+            self._composante_du_sommet(dest)
+        return reponses
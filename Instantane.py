@@ -0,0 +1,73 @@
+from DigrapheFige import DigrapheFige
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+
+
+class Instantane(DigrapheNonPondere):
+    """
+    Instantané en lecture seule d'un digraphe, créé par DigrapheNonPondere.instantane().  Il possède sa propre liste
+    des listes d'adjacence, dont les éléments sont partagés avec le graphe d'origine tant que celui-ci ne les modifie
+    pas: le graphe copie une liste partagée avant de la modifier.  Les listes d'un instantané ne changent donc jamais,
+    et plusieurs fils peuvent y lancer des recherches (dijkstra, explorations, kosaraju, ...) pendant que le graphe
+    d'origine est modifié.  Comme pour un DigrapheFige, les méthodes de modification lèvent TypeError.
+    """
+
+    _modification_interdite = DigrapheFige._modification_interdite
+
+    ajouter_sommet = _modification_interdite
+    ajouter_arete = _modification_interdite
+    retirer_arete = _modification_interdite
+    retirer_sommet = _modification_interdite
+    compacter = _modification_interdite
+    modifier_ponderation = _modification_interdite
+    ajouter_aretes = _modification_interdite
+    retirer_aretes = _modification_interdite
+    modifications = _modification_interdite
+    indexer_predecesseurs = _modification_interdite
+    maintenir_ordre_topologique = _modification_interdite
+
+    def ordre_topologique(self):
+        return self.tri_topologique_kahn()
+
+    def _predecesseurs_pour_requete(self):
+        return self._liste_predecesseurs_du_sommet
+
+    def _liste_predecesseurs_du_sommet(self, sommet):
+        """
+        Les prédécesseurs sont lus dans un graphe inverse construit au premier besoin et propre à l'instantané.  Deux
+        fils qui le construisent en même temps obtiennent deux graphes équivalents, dont un seul est conservé.
+        """
+        assert(self._numero_de_sommet_est_valide(sommet))
+        if self._inverse is None:
+            self._inverse = self.graphe_inverse()
+        return self._inverse._liste_adjacence_pour_le_sommet(sommet)
+
+    def instantane(self):
+        return self
+
+
+class InstantanePondere(Instantane, DigraphePondere):
+    """
+    Instantané en lecture seule d'un digraphe pondéré.  Voir Instantane.
+    """
+
+
+def prendre_instantane(graphe):
+    """
+    Voir DigrapheNonPondere.instantane.
+    """
+    assert(graphe._modifies is None)
+    classe = InstantanePondere if isinstance(graphe, DigraphePondere) else Instantane
+    instantane = classe.__new__(classe)
+    instantane.__dict__.update(graphe.__dict__)
+    instantane.lists = list(graphe.lists)
+    instantane._retires = bytearray(graphe._retires)
+    instantane._inverses = None
+    instantane._inverse = None
+    instantane._ordre = instantane._rangs = None
+    instantane._cache = None
+    instantane._abonnes = []
+    instantane._statistiques = None
+    instantane._partages = None
+    graphe._partages = bytearray(b"\x01" * graphe.num_vertices)
+    return instantane
@@ -0,0 +1,137 @@
+"""
+Passerelle facultative vers NumPy et SciPy.  Un digraphe figé est déjà en format CSR: ses tableaux offsets, targets et
+weights sont projetés sans copie en tableaux NumPy (numpy.frombuffer), puis en scipy.sparse.csr_matrix dont l'élément
+(s, d) est 1, ou la pondération, pour chaque arête s -> d.  Un digraphe modifiable est d'abord figé.
+
+Les calculs en bloc (arités, niveaux d'une exploration en largeur, accessibilité) sont alors vectorisés: une exploration
+en largeur par niveaux fait un produit matrice creuse - vecteur par niveau au lieu d'une boucle Python par sommet.
+Sans NumPy ou sans SciPy, les mêmes fonctions se rabattent sur les algorithmes en Python pur, avec les mêmes résultats.
+"""
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
+
+def _vecteur(tableau, dtype):
+    """Projection sans copie d'un array ou d'une memoryview en tableau NumPy."""
+    return numpy.frombuffer(memoryview(tableau).cast('B'), dtype=dtype)
+
+
+def _depuis_numpy(vecteur):
+    """Copie un vecteur NumPy d'entiers dans un array('q')."""
+    return array('q', numpy.ascontiguousarray(vecteur, dtype=numpy.int64).tobytes())
+
+
+def vers_matrice_creuse(graphe):
+    """
+    Voir DigrapheNonPondere.vers_matrice_creuse.
+    """
+    if numpy is None or scipy is None:
+        raise ImportError("La conversion en matrice creuse demande NumPy et SciPy.")
+    fige = graphe.figer()
+    if hasattr(fige, "weights"):
+        donnees = _vecteur(fige.weights, numpy.float64)
+    else:
+        donnees = numpy.ones(len(fige.targets), dtype=numpy.int8)
+    return scipy.sparse.csr_matrix((donnees, _vecteur(fige.targets, numpy.int64), _vecteur(fige.offsets, numpy.int64)),
+                                   shape=(fige.num_vertices, fige.num_vertices))
+
+
+def tableaux_depuis_matrice_creuse(matrice, ponderee):
+    """
+    Tableaux CSR d'un digraphe d'après une matrice creuse carrée.  Les doublons sont additionnés et les voisins de
+    chaque sommet sont rangés par ordre croissant.
+    :param matrice: Matrice creuse SciPy, dans n'importe quel format
+    :param ponderee: True pour conserver les valeurs comme pondérations
+    :return: (offsets, targets) ou (offsets, targets, weights), des array('q') et array('d').
+    """
+    if scipy is None:
+        raise ImportError("La conversion depuis une matrice creuse demande SciPy.")
+    matrice = scipy.sparse.csr_matrix(matrice)
+    assert matrice.shape[0] == matrice.shape[1]
+    matrice.sum_duplicates()
+    offsets, targets = _depuis_numpy(matrice.indptr), _depuis_numpy(matrice.indices)
+    if not ponderee:
+        return offsets, targets
+    return offsets, targets, array('d', numpy.ascontiguousarray(matrice.data, dtype=numpy.float64).tobytes())
+
+
+def degres_sortants(graphe):
+    """
+    Voir DigrapheNonPondere.degres_sortants.
+    """
+    if numpy is None:
+        degres = array('q', bytes(8 * graphe.num_vertices))
+        for sommet in graphe.sommets():
+            degres[sommet] = graphe.arite_sortie_du_sommet(sommet)
+        return degres
+    fige = graphe.figer()
+    return _depuis_numpy(numpy.diff(_vecteur(fige.offsets, numpy.int64)))
+
+
+def degres_entrants(graphe):
+    """
+    Voir DigrapheNonPondere.degres_entrants.
+    """
+    if numpy is None:
+        degres = array('q', bytes(8 * graphe.num_vertices))
+        for sommet in graphe.sommets():
+            for dest in graphe._liste_adjacence_pour_le_sommet(sommet):
+                degres[dest] += 1
+        return degres
+    fige = graphe.figer()
+    return _depuis_numpy(numpy.bincount(_vecteur(fige.targets, numpy.int64), minlength=fige.num_vertices))
+
+
+def _niveaux_vectorises(fige, departs):
+    """
+    Exploration en largeur par niveaux: la frontière est un vecteur indicateur, et le niveau suivant est le produit de
+    la transposée de la matrice d'adjacence par ce vecteur, privé des sommets déjà atteints.
+    :return: Vecteur NumPy des niveaux, sys.maxsize pour les sommets inaccessibles.
+    """
+    transposee = scipy.sparse.csr_matrix(
+        (numpy.ones(len(fige.targets), dtype=numpy.int32), _vecteur(fige.targets, numpy.int64),
+         _vecteur(fige.offsets, numpy.int64)), shape=(fige.num_vertices, fige.num_vertices)).T.tocsr()
+    niveaux = numpy.full(fige.num_vertices, sys.maxsize, dtype=numpy.int64)
+    frontiere = numpy.zeros(fige.num_vertices, dtype=numpy.int32)
+    frontiere[departs] = 1
+    niveaux[departs] = 0
+    niveau = 0
+    while frontiere.any():
+        niveau += 1
+        atteints = (transposee @ frontiere > 0) & (niveaux == sys.maxsize)
+        niveaux[atteints] = niveau
+        frontiere = atteints.astype(numpy.int32)
+    return niveaux
+
+
+def niveaux_en_largeur(graphe, departs):
+    """
+    Voir DigrapheNonPondere.niveaux_en_largeur.
+    """
+    departs = list(departs)
+    assert all(graphe.sommet_existe(depart) for depart in departs)
+    if numpy is None or scipy is None:
+        return array('q', graphe.explorer_en_largeur_en_partant_des_sommets(departs)[1])
+    return _depuis_numpy(_niveaux_vectorises(graphe.figer(), departs))
+
+
+def atteignables(graphe, departs):
+    """
+    Voir DigrapheNonPondere.atteignables.
+    """
+    departs = list(departs)
+    assert all(graphe.sommet_existe(depart) for depart in departs)
+    if numpy is None or scipy is None:
+        distances = graphe.explorer_en_largeur_en_partant_des_sommets(departs)[1]
+        return bytearray(distance != sys.maxsize for distance in distances)
+    return bytearray((_niveaux_vectorises(graphe.figer(), departs) != sys.maxsize).astype(numpy.uint8).tobytes())
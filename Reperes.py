@@ -0,0 +1,65 @@
+import math
+from array import array
+
+
+class Reperes:
+    """
+    Heuristique ALT (A*, Landmarks, Triangle inequality) pour DigraphePondere.a_etoile.  Pour chaque repère L, les
+    distances d(L, v) et d(v, L) à tous les sommets sont calculées une fois pour toutes, par dijkstra sur le graphe et
+    sur son inverse, et rangées dans des array('d').  L'inégalité triangulaire donne alors, pour tout couple (v, t):
+    d(v, t) >= d(v, L) - d(t, L) et d(v, t) >= d(L, t) - d(L, v), une borne inférieure admissible et cohérente de la
+    distance restante, sans coordonnées.
+    Les repères sont choisis de proche en proche: chaque nouveau repère est le sommet le plus éloigné des repères déjà
+    choisis, ce qui les répartit en périphérie du graphe, là où les bornes sont les meilleures.
+    Les distances sont celles du graphe au moment du calcul: après une modification, il faut recalculer les repères.
+    """
+
+    def __init__(self, graphe, nombre=8):
+        """
+        :param graphe: DigraphePondere à pondérations positives ou nulles
+        :param nombre: Nombre de repères, borné par le nombre de sommets
+        """
+        assert nombre > 0
+        assert all(pond >= 0 for _, _, pond in graphe._aretes_ponderees())
+        self.version = graphe.version()
+        inverse = graphe.graphe_inverse()
+        vivants = list(graphe.sommets())
+        self.reperes = []
+        self.depuis = []
+        self.vers = []
+        eloignements = None
+        candidat = None
+        if vivants:
+            _, distances = graphe.dijkstra(vivants[0])
+            candidat = max(vivants, key=lambda v: (distances[v] != math.inf, distances[v]))
+        while candidat is not None and len(self.reperes) < nombre:
+            self.reperes.append(candidat)
+            depuis = array('d', graphe.dijkstra(candidat)[1])
+            self.depuis.append(depuis)
+            self.vers.append(array('d', inverse.dijkstra(candidat)[1]))
+            if eloignements is None:
+                eloignements = array('d', depuis)
+            else:
+                for v in vivants:
+                    eloignements[v] = min(eloignements[v], depuis[v])
+            restants = [v for v in vivants if v not in self.reperes]
+            candidat = max(restants, key=lambda v: eloignements[v]) if restants else None
+
+    def __len__(self):
+        return len(self.reperes)
+
+    def __call__(self, sommet, arrivee):
+        """
+        Borne inférieure de la distance de sommet à arrivée.  Les repères qui ne relient pas les deux sommets ne
+        fournissent pas de borne.
+        :param sommet: Sommet courant de la recherche
+        :param arrivee: Sommet d'arrivée
+        :return: La meilleure borne des repères, 0 si aucun n'en fournit.
+        """
+        borne = 0.0
+        for depuis, vers in zip(self.depuis, self.vers):
+            if vers[sommet] != math.inf and vers[arrivee] != math.inf:
+                borne = max(borne, vers[sommet] - vers[arrivee])
+            if depuis[sommet] != math.inf and depuis[arrivee] != math.inf:
+                borne = max(borne, depuis[arrivee] - depuis[sommet])
+        return borne
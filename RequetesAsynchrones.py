@@ -0,0 +1,39 @@
+import asyncio
+import functools
+
+
+class RequetesAsynchrones:
+    """
+    Exécution asynchrone (asyncio) de requêtes sur un digraphe modifié par un seul rédacteur.  Les requêtes portent sur
+    le dernier instantané publié et sont confiées à un exécuteur (groupe de fils par défaut), sans bloquer la boucle
+    d'événements.  Le rédacteur applique ses modifications au graphe puis appelle publier(): les requêtes déjà lancées
+    terminent sur l'instantané qu'elles ont reçu, les suivantes voient le nouvel état.
+    Exemple: pred, dist = await requetes.executer("dijkstra", 0)
+    """
+
+    def __init__(self, graphe, executeur=None):
+        """
+        :param graphe: Digraphe à interroger
+        :param executeur: concurrent.futures.Executor facultatif, celui de la boucle d'événements par défaut
+        """
+        self.graphe = graphe
+        self.executeur = executeur
+        self.instantane = graphe.instantane()
+
+    def publier(self):
+        """
+        Rend l'état courant du graphe visible aux requêtes suivantes.  À appeler par le rédacteur, entre deux
+        modifications.
+        :return: Le nouvel instantané
+        """
+        self.instantane = self.graphe.instantane()
+        return self.instantane
+
+    async def executer(self, methode, *args, **kwargs):
+        """
+        Appelle une méthode de consultation sur le dernier instantané publié, dans l'exécuteur.
+        :param methode: Nom de la méthode, par exemple "dijkstra" ou "kosaraju"
+        :return: Le résultat de la méthode
+        """
+        appel = functools.partial(getattr(self.instantane, methode), *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.executeur, appel)
@@ -0,0 +1,83 @@
+import time
+
+
+class Statistiques:
+    """
+    Collecteur des compteurs d'instrumentation des algorithmes d'un digraphe.  Un digraphe n'est instrumenté que
+    pendant un bloc instrumenter(), ou le temps d'un appel recevant statistiques=; le reste du temps, chaque point de
+    mesure se réduit à un test sur None.
+    Compteurs cumulés:
+     - sommets_resolus: sommets extraits définitivement (Dijkstra) ou abandonnés (exploration en profondeur);
+     - aretes_relaxees: arêtes examinées depuis un sommet extrait ou abandonné, ou relaxées par Bellman-Ford;
+     - relaxations_reussies: relaxations ayant amélioré une distance (_relaxer retournant False);
+     - insertions_file, extractions_file: opérations sur le tas, la file ou la pile de l'algorithme;
+     - profondeur_pile_max: plus grande profondeur atteinte par une pile d'exploration en profondeur;
+     - verifications_invariant, temps_invariant: nombre et durée totale (s) des vérifications de l'invariant.
+    Par algorithme: appels, nombre d'appels, et durees, durée totale (s).
+    """
+
+    COMPTEURS = ("sommets_resolus", "aretes_relaxees", "relaxations_reussies", "insertions_file", "extractions_file",
+                 "profondeur_pile_max", "verifications_invariant", "temps_invariant")
+
+    def __init__(self, rappel=None):
+        """
+        :param rappel: Fonction facultative appelée après chaque appel instrumenté avec (nom de l'algorithme,
+        dictionnaire des compteurs de cet appel seulement, plus sa durée en secondes sous la clé "duree").  D'autres
+        rappels peuvent être ajoutés à la liste rappels.
+        """
+        self.rappels = [] if rappel is None else [rappel]
+        self.reinitialiser()
+
+    def reinitialiser(self):
+        """Remet tous les compteurs à zéro, sans toucher aux rappels."""
+        for compteur in self.COMPTEURS:
+            setattr(self, compteur, 0)
+        self.appels = {}
+        self.durees = {}
+
+    def en_dictionnaire(self):
+        """
+        :return: Un dictionnaire des compteurs cumulés, plus appels et durees.
+        """
+        compteurs = {compteur: getattr(self, compteur) for compteur in self.COMPTEURS}
+        compteurs["appels"] = dict(self.appels)
+        compteurs["durees"] = dict(self.durees)
+        return compteurs
+
+    def chronometrer_invariant(self, verification):
+        """
+        Exécute une vérification d'invariant en la comptant et en la chronométrant.
+        :param verification: Fonction sans paramètre retournant le résultat de la vérification
+        :return: Ce résultat
+        """
+        debut = time.perf_counter()
+        resultat = verification()
+        self.temps_invariant += time.perf_counter() - debut
+        self.verifications_invariant += 1
+        return resultat
+
+    def mesurer(self, nom, calcul):
+        """
+        Exécute un appel d'algorithme instrumenté: le compte, le chronomètre et transmet ses propres compteurs aux
+        rappels.
+        :param nom: Nom de l'algorithme
+        :param calcul: Fonction sans paramètre effectuant l'appel
+        :return: Le résultat de calcul
+        """
+        avant = {compteur: getattr(self, compteur) for compteur in self.COMPTEURS}
+        self.profondeur_pile_max = 0
+        debut = time.perf_counter()
+        try:
+            return calcul()
+        finally:
+            duree = time.perf_counter() - debut
+            self.appels[nom] = self.appels.get(nom, 0) + 1
+            self.durees[nom] = self.durees.get(nom, 0.0) + duree
+            profondeur = self.profondeur_pile_max
+            self.profondeur_pile_max = max(profondeur, avant["profondeur_pile_max"])
+            if self.rappels:
+                compteurs = {compteur: getattr(self, compteur) - avant[compteur] for compteur in self.COMPTEURS}
+                compteurs["profondeur_pile_max"] = profondeur
+                compteurs["duree"] = duree
+                for rappel in self.rappels:
+                    rappel(nom, compteurs)
@@ -0,0 +1,65 @@
+from DigrapheFige import DigrapheFige
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+
+
+class VueInverse(DigrapheNonPondere):
+    """
+    Vue en lecture seule du graphe inverse, créée par graphe_inverse() quand l'index des prédécesseurs existe.  Elle
+    partage les listes d'adjacence du graphe d'origine, ses listes de prédécesseurs devenant les listes d'adjacence de
+    la vue et inversement.  Elle est destinée à la consultation et doit être redemandée après toute modification du
+    graphe d'origine.  Comme pour un DigrapheFige, les méthodes de modification lèvent TypeError: modifier la vue
+    modifierait le graphe d'origine sans passer par son invariant, sa version ni ses abonnés.
+    """
+
+    _modification_interdite = DigrapheFige._modification_interdite
+
+    ajouter_sommet = _modification_interdite
+    ajouter_arete = _modification_interdite
+    retirer_arete = _modification_interdite
+    retirer_sommet = _modification_interdite
+    compacter = _modification_interdite
+    modifier_ponderation = _modification_interdite
+    ajouter_aretes = _modification_interdite
+    retirer_aretes = _modification_interdite
+    modifications = _modification_interdite
+    indexer_predecesseurs = _modification_interdite
+    maintenir_ordre_topologique = _modification_interdite
+
+    def ordre_topologique(self):
+        return self.tri_topologique_kahn()
+
+    def instantane(self):
+        """
+        Les listes de la vue appartenant au graphe d'origine, qui les modifie sans savoir qu'un instantané les
+        partage, l'instantané est pris sur une copie de ces listes.
+        """
+        from Instantane import prendre_instantane
+        copie = type(self).__new__(type(self))
+        copie.__dict__.update(self.__dict__)
+        copie.lists = [dict(liste) for liste in self.lists]
+        return prendre_instantane(copie)
+
+
+class VueInversePondere(VueInverse, DigraphePondere):
+    """
+    Vue en lecture seule du graphe inverse d'un digraphe pondéré.  Voir VueInverse.
+    """
+
+
+def vue_inverse(graphe):
+    """
+    Voir DigrapheNonPondere.graphe_inverse.
+    """
+    assert(graphe._inverses is not None)
+    classe = VueInversePondere if isinstance(graphe, DigraphePondere) else VueInverse
+    vue = classe.__new__(classe)
+    vue.__dict__.update(graphe.__dict__)
+    vue.lists, vue._inverses = graphe._inverses, graphe.lists
+    vue._retires = bytearray(graphe._retires)
+    vue._ordre = vue._rangs = None
+    vue._cache = None
+    vue._abonnes = []
+    vue._statistiques = None
+    vue._partages = None
+    return vue
@@ -0,0 +1,10 @@
+"""
+Bancs d'essai des digraphes: générateurs de graphes synthétiques reproductibles (generateurs), scénarios chronométrés
+sur des tailles croissantes (banc), et ligne de commande pour mesurer, enregistrer une référence JSON et s'y comparer:
+
+    python -m benchmarks mesurer --sortie reference.json
+    python -m benchmarks comparer reference.json courant.json --tolerance 0.25
+
+Les modifications vérifient l'invariant complet du digraphe tant que les assertions sont actives: pour mesurer les
+chemins critiques tels qu'en production, lancer les mesures avec python -O.
+"""
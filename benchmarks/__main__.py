@@ -0,0 +1,42 @@
+"""
+Ligne de commande des bancs d'essai.  Voir le module benchmarks.
+"""
+import argparse
+import sys
+
+from benchmarks import banc
+
+
+def main(arguments=None):
+    analyseur = argparse.ArgumentParser(prog="python -m benchmarks", description="Bancs d'essai des digraphes.")
+    commandes = analyseur.add_subparsers(dest="commande", required=True)
+    mesure = commandes.add_parser("mesurer", help="mesure les scénarios et enregistre les résultats en JSON")
+    mesure.add_argument("--sortie", help="fichier JSON des résultats")
+    mesure.add_argument("--scenarios", nargs="+", choices=sorted(banc.SCENARIOS), help="scénarios, tous par défaut")
+    mesure.add_argument("--tailles", nargs="+", type=int, default=list(banc.TAILLES), help="tailles de base")
+    mesure.add_argument("--repetitions", type=int, default=3)
+    mesure.add_argument("--graine", type=int, default=0)
+    comparaison = commandes.add_parser("comparer", help="compare des résultats à une référence")
+    comparaison.add_argument("reference", help="fichier JSON de référence")
+    comparaison.add_argument("courant", help="fichier JSON à comparer")
+    comparaison.add_argument("--tolerance", type=float, default=0.25, help="hausse relative admise (0.25 = 25 %%)")
+    arguments = analyseur.parse_args(arguments)
+
+    if arguments.commande == "mesurer":
+        mesures = banc.mesurer(arguments.scenarios, arguments.tailles, arguments.repetitions, arguments.graine, print)
+        for nom, resultats in mesures["resultats"].items():
+            if resultats["exposant"] is not None:
+                print(f"{nom:40} exposant empirique {resultats['exposant']:.2f}")
+        if arguments.sortie:
+            banc.sauvegarder(mesures, arguments.sortie)
+        return 0
+    lignes, regressions = banc.comparer(banc.charger(arguments.reference), banc.charger(arguments.courant),
+                                        arguments.tolerance)
+    print("\n".join(lignes))
+    for nom, taille, grandeur in regressions:
+        print(f"RÉGRESSION: {nom} n={taille} {grandeur}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Scénarios chronométrés et comparaison à une référence.
+
+Chaque scénario prépare un graphe d'une taille donnée, hors chronométrage, puis mesure une opération.  Pour chaque
+taille sont retenus le meilleur temps sur quelques répétitions, le débit (éléments traités par seconde: arêtes, sommets
+ou opérations selon le scénario) et le pic de mémoire allouée pendant l'opération (tracemalloc, mesuré à part pour ne
+pas fausser les temps).  L'exposant de complexité empirique est la pente de log(temps) selon log(taille), par moindres
+carrés: environ 1 pour un algorithme linéaire, 2 pour un algorithme quadratique.
+"""
+import gc
+import json
+import math
+import platform
+import random
+import time
+import tracemalloc
+
+from benchmarks import generateurs
+
+FORMAT = 1
+TAILLES = (1000, 2000, 4000, 8000)
+
+
+def _nombre_d_aretes(graphe):
+    return sum(graphe.arite_sortie_du_sommet(sommet) for sommet in graphe.sommets())
+
+
+def _construction(taille, graine):
+    return lambda: _nombre_d_aretes(generateurs.erdos_renyi(taille, graine=graine))
+
+
+def _churn(taille, graine):
+    graphe = generateurs.erdos_renyi(taille, graine=graine, ponderee=False)
+    aleatoire = random.Random(graine)
+
+    def operation():
+        operations = 0
+        for _ in range(taille // 10):
+            source, dest = aleatoire.randrange(graphe.num_vertices), aleatoire.randrange(graphe.num_vertices)
+            if source != dest and graphe.sommet_existe(source) and graphe.sommet_existe(dest) and \
+                    not graphe.arete_existe(source, dest):
+                graphe.ajouter_arete(source, dest)
+                operations += 1
+        for _ in range(taille // 100):
+            sommet = aleatoire.randrange(graphe.num_vertices)
+            if graphe.sommet_existe(sommet):
+                graphe.retirer_sommet(sommet, differer=True)
+                operations += 1
+        graphe.compacter()
+        return operations + 1
+    return operation
+
+
+def _sur_graphe(generateur, algorithme):
+    def scenario(taille, graine):
+        graphe = generateur(taille, graine)
+        elements = _nombre_d_aretes(graphe) + graphe.nombre_de_sommets()
+
+        def operation():
+            algorithme(graphe)
+            return elements
+        return operation
+    return scenario
+
+
+SCENARIOS = {
+    "construction_erdos_renyi": (1, _construction),
+    "churn_ajouter_arete_retirer_sommet": (1, _churn),
+    "dijkstra_grille": (1, _sur_graphe(lambda n, graine: generateurs.grille(generateurs.cote_de_grille(n), graine),
+                                       lambda g: g.dijkstra(0))),
+    "dijkstra_sans_echelle": (1, _sur_graphe(lambda n, graine: generateurs.sans_echelle(n, graine=graine),
+                                             lambda g: g.dijkstra(0))),
+    "bellman_ford_negatives": (0.25, _sur_graphe(lambda n, graine: generateurs.avec_negatives(n, graine=graine),
+                                                 lambda g: g.bellman_ford(0))),
+    "kosaraju_erdos_renyi": (1, _sur_graphe(lambda n, graine: generateurs.erdos_renyi(n, graine=graine,
+                                                                                      ponderee=False),
+                                            lambda g: g.kosaraju())),
+    "tri_topologique_dfs_dag_large": (1, _sur_graphe(lambda n, graine: generateurs.dag_large(max(2, n // 100), 100,
+                                                                                             graine=graine),
+                                                     lambda g: g.tri_topologique_dfs())),
+    "tri_topologique_dfs_chaine": (1, _sur_graphe(lambda n, graine: generateurs.chaine(n),
+                                                  lambda g: g.tri_topologique_dfs())),
+    "largeur_erdos_renyi": (1, _sur_graphe(lambda n, graine: generateurs.erdos_renyi(n, graine=graine,
+                                                                                     ponderee=False),
+                                           lambda g: g.explorer_en_largeur_en_partant_du_sommet(0))),
+    "largeur_chaine": (1, _sur_graphe(lambda n, graine: generateurs.chaine(n),
+                                      lambda g: g.explorer_en_largeur_en_partant_du_sommet(0))),
+}
+
+
+def exposant(tailles, temps):
+    """
+    Pente de la droite des moindres carrés de log(temps) selon log(taille).
+    :return: L'exposant, ou None avec moins de deux tailles.
+    """
+    points = [(math.log(taille), math.log(duree)) for taille, duree in zip(tailles, temps) if duree > 0]
+    if len(points) < 2:
+        return None
+    moyenne_x = sum(x for x, _ in points) / len(points)
+    moyenne_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - moyenne_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - moyenne_x) * (y - moyenne_y) for x, y in points) / variance
+
+
+def _chronometrer(scenario, taille, graine, repetitions):
+    """Meilleur temps sur les répétitions, chacune sur un graphe fraîchement préparé."""
+    meilleur, elements = math.inf, 0
+    for _ in range(repetitions):
+        operation = scenario(taille, graine)
+        gc.collect()
+        debut = time.perf_counter()
+        elements = operation()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur, elements
+
+
+def _pic_de_memoire(scenario, taille, graine):
+    """Pic de mémoire allouée par l'opération, préparation exclue."""
+    operation = scenario(taille, graine)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def mesurer(noms=None, tailles=TAILLES, repetitions=3, graine=0, rapport=None):
+    """
+    Exécute les scénarios demandés sur chaque taille.
+    :param noms: Noms des scénarios, tous si None
+    :param tailles: Tailles de base, multipliées par le facteur propre à chaque scénario
+    :param repetitions: Nombre de répétitions chronométrées par taille
+    :param graine: Graine des générateurs
+    :param rapport: Fonction facultative appelée avec une ligne de texte après chaque mesure
+    :return: Un dictionnaire sérialisable en JSON: format, plateforme et, par scénario, les tailles, temps (s),
+    débits (éléments/s), pics de mémoire (octets) et l'exposant empirique.
+    """
+    resultats = {}
+    for nom in (SCENARIOS if noms is None else noms):
+        facteur, scenario = SCENARIOS[nom]
+        mesures = {"tailles": [], "temps": [], "debits": [], "memoire": []}
+        for taille in tailles:
+            taille = max(2, int(taille * facteur))
+            duree, elements = _chronometrer(scenario, taille, graine, repetitions)
+            memoire = _pic_de_memoire(scenario, taille, graine)
+            mesures["tailles"].append(taille)
+            mesures["temps"].append(duree)
+            debit = elements / duree if duree > 0 else math.inf
+            mesures["debits"].append(debit)
+            mesures["memoire"].append(memoire)
+            if rapport is not None:
+                rapport(f"{nom:40} n={taille:<8} {duree * 1000:10.2f} ms {debit:14.0f} /s "
+                        f"{memoire / 1024:10.0f} Kio")
+        mesures["exposant"] = exposant(mesures["tailles"], mesures["temps"])
+        resultats[nom] = mesures
+    return {"format": FORMAT, "python": platform.python_version(), "machine": platform.machine(),
+            "resultats": resultats}
+
+
+def sauvegarder(mesures, fichier):
+    with open(fichier, "w", encoding="utf-8") as sortie:
+        json.dump(mesures, sortie, indent=2)
+
+
+def charger(fichier):
+    """
+    :raises: ValueError si le fichier n'est pas dans le format des mesures.
+    """
+    with open(fichier, encoding="utf-8") as entree:
+        mesures = json.load(entree)
+    if mesures.get("format") != FORMAT:
+        raise ValueError(f"{fichier} n'est pas un fichier de mesures au format {FORMAT}.")
+    return mesures
+
+
+def comparer(reference, courantes, tolerance=0.25):
+    """
+    Compare des mesures à une référence, pour chaque scénario et chaque taille présents des deux côtés.
+    :param reference: Mesures de référence
+    :param courantes: Mesures à comparer
+    :param tolerance: Hausse relative admise du temps et du pic de mémoire
+    :return: (lignes, regressions) le rapport ligne par ligne, et la liste des (scénario, taille, grandeur) dont la
+    hausse dépasse la tolérance.
+    """
+    lignes, regressions = [], []
+    for nom, mesures in courantes["resultats"].items():
+        references = reference["resultats"].get(nom)
+        if references is None:
+            lignes.append(f"{nom:40} absent de la référence")
+            continue
+        for i, taille in enumerate(mesures["tailles"]):
+            if taille not in references["tailles"]:
+                continue
+            j = references["tailles"].index(taille)
+            ecarts = []
+            for grandeur in ("temps", "memoire"):
+                ancienne, nouvelle = references[grandeur][j], mesures[grandeur][i]
+                ratio = nouvelle / ancienne if ancienne else 1.0
+                ecarts.append(f"{grandeur} x{ratio:.2f}")
+                if ratio > 1 + tolerance:
+                    regressions.append((nom, taille, grandeur))
+            lignes.append(f"{nom:40} n={taille:<8} " + "  ".join(ecarts))
+    return lignes, regressions
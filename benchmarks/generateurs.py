@@ -0,0 +1,113 @@
+"""
+Générateurs de digraphes synthétiques.  Chaque générateur est déterministe pour une graine donnée et produit ses arêtes
+au fil de l'eau, directement consommées par le constructeur du digraphe.
+"""
+import math
+import random
+
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+
+
+def _construire(nb_sommets, aretes, ponderee):
+    if ponderee:
+        return DigraphePondere(nb_sommets, aretes)
+    return DigrapheNonPondere(nb_sommets, ((source, dest) for source, dest, _ in aretes))
+
+
+def _poisson(aleatoire, moyenne):
+    """Tirage d'une loi de Poisson (méthode de Knuth), loi limite du degré d'un sommet de G(n, p)."""
+    seuil, tirage, produit = math.exp(-moyenne), 0, aleatoire.random()
+    while produit > seuil:
+        tirage += 1
+        produit *= aleatoire.random()
+    return tirage
+
+
+def aretes_erdos_renyi(nb_sommets, degre_moyen, graine):
+    """Arêtes d'un graphe aléatoire G(n, p) de degré sortant moyen donné, pondérations dans [1, 100]."""
+    aleatoire = random.Random(graine)
+    for source in range(nb_sommets):
+        destinations = set()
+        for _ in range(min(nb_sommets - 1, _poisson(aleatoire, degre_moyen))):
+            dest = aleatoire.randrange(nb_sommets)
+            if dest != source and dest not in destinations:
+                destinations.add(dest)
+                yield source, dest, float(aleatoire.randint(1, 100))
+
+
+def erdos_renyi(nb_sommets, degre_moyen=4, graine=0, ponderee=True):
+    """Graphe aléatoire d'Erdős–Rényi."""
+    return _construire(nb_sommets, aretes_erdos_renyi(nb_sommets, degre_moyen, graine), ponderee)
+
+
+def sans_echelle(nb_sommets, attaches=3, graine=0, ponderee=True):
+    """
+    Graphe sans échelle de Barabási–Albert: chaque nouveau sommet se relie à des sommets existants choisis en
+    proportion de leur degré, ce qui donne une distribution des degrés en loi de puissance.
+    """
+    aleatoire = random.Random(graine)
+    extremites = []
+
+    def aretes():
+        for sommet in range(nb_sommets):
+            cibles = set()
+            while extremites and len(cibles) < min(attaches, sommet):
+                cibles.add(aleatoire.choice(extremites))
+            for cible in cibles:
+                source, dest = (sommet, cible) if aleatoire.random() < 0.5 else (cible, sommet)
+                extremites.extend((sommet, cible))
+                yield source, dest, float(aleatoire.randint(1, 100))
+            extremites.append(sommet)
+
+    return _construire(nb_sommets, aretes(), ponderee)
+
+
+def grille(cote, graine=0, ponderee=True):
+    """Réseau routier simplifié: grille cote x cote, arêtes dans les deux sens entre voisins, pondérations dans [1, 10]."""
+    aleatoire = random.Random(graine)
+
+    def aretes():
+        for ligne in range(cote):
+            for colonne in range(cote):
+                sommet = ligne * cote + colonne
+                for voisin_ligne, voisin_colonne in ((ligne, colonne + 1), (ligne + 1, colonne),
+                                                     (ligne, colonne - 1), (ligne - 1, colonne)):
+                    if 0 <= voisin_ligne < cote and 0 <= voisin_colonne < cote:
+                        yield sommet, voisin_ligne * cote + voisin_colonne, float(aleatoire.randint(1, 10))
+
+    return _construire(cote * cote, aretes(), ponderee)
+
+
+def chaine(nb_sommets, ponderee=False):
+    """Chaîne 0 -> 1 -> ... -> n-1, le pire cas de profondeur des explorations."""
+    return _construire(nb_sommets, ((sommet, sommet + 1, 1.0) for sommet in range(nb_sommets - 1)), ponderee)
+
+
+def dag_large(niveaux, largeur, degre=3, graine=0, ponderee=False):
+    """Graphe acyclique en couches: chaque sommet d'une couche pointe vers quelques sommets de la couche suivante."""
+    aleatoire = random.Random(graine)
+
+    def aretes():
+        for niveau in range(niveaux - 1):
+            for position in range(largeur):
+                for cible in aleatoire.sample(range(largeur), min(degre, largeur)):
+                    yield niveau * largeur + position, (niveau + 1) * largeur + cible, float(aleatoire.randint(1, 100))
+
+    return _construire(niveaux * largeur, aretes(), ponderee)
+
+
+def avec_negatives(nb_sommets, degre_moyen=4, graine=0):
+    """
+    Graphe pondéré aléatoire avec des pondérations négatives mais sans cycle négatif: chaque pondération positive est
+    corrigée par des potentiels aléatoires, w(u, v) + h(u) - h(v), ce qui conserve le poids de tous les cycles.
+    """
+    aleatoire = random.Random(graine)
+    potentiels = [aleatoire.uniform(0, 50) for _ in range(nb_sommets)]
+    return DigraphePondere(nb_sommets, ((source, dest, pond + potentiels[source] - potentiels[dest])
+                                        for source, dest, pond in aretes_erdos_renyi(nb_sommets, degre_moyen, graine)))
+
+
+def cote_de_grille(nb_sommets):
+    """Côté de la grille carrée la plus proche du nombre de sommets demandé."""
+    return max(2, round(math.sqrt(nb_sommets)))
@@ -0,0 +1,65 @@
+import math
+import random
+import unittest
+from ArbreDesPlusCourtsChemins import ArbreDesPlusCourtsChemins
+from DigraphePondere import DigraphePondere
+
+
+class ArbreDesPlusCourtsCheminsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = DigraphePondere(5, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 4.0)])
+        self.arbre = ArbreDesPlusCourtsChemins(self.g, 0)
+
+    def verifier_distances(self):
+        self.assertEqual(self.g.dijkstra(self.arbre.source)[1], self.arbre.distances)
+
+    def test_ajout_et_baisse(self):
+        self.g.ajouter_arete(0, 4, 1.0)
+        self.g.ajouter_arete(4, 3, 1.0)
+        self.assertEqual([0, 4, 3], self.arbre.chemin_vers(3))
+        self.g.modifier_ponderation(1, 2, 0.5)
+        self.assertEqual(2.5, self.arbre.distance(2))
+        self.verifier_distances()
+
+    def test_retrait_et_hausse(self):
+        self.g.retirer_arete(1, 2)
+        self.assertEqual([0, 2], self.arbre.chemin_vers(2))
+        self.g.modifier_ponderation(0, 2, 10.0)
+        self.assertEqual([0, 3], self.arbre.chemin_vers(3))
+        self.g.retirer_arete(0, 2)
+        self.assertEqual(math.inf, self.arbre.distance(2))
+        self.assertIsNone(self.arbre.chemin_vers(4))
+        self.verifier_distances()
+
+    def test_retrait_de_sommet(self):
+        self.g.retirer_sommet(1)
+        self.assertEqual([0, 4.0, 7.0, math.inf], self.arbre.distances)
+        self.verifier_distances()
+        self.g.retirer_sommet(0)
+        self.assertIsNone(self.arbre.source)
+
+    def test_detacher(self):
+        self.arbre.detacher()
+        self.g.ajouter_arete(0, 4, 1.0)
+        self.assertEqual(math.inf, self.arbre.distance(4))
+
+    def test_modifications_aleatoires(self):
+        aleatoire = random.Random(13)
+        g = DigraphePondere(30)
+        arbres = [ArbreDesPlusCourtsChemins(g, source) for source in (0, 7)]
+        for _ in range(400):
+            source, dest = aleatoire.randrange(30), aleatoire.randrange(30)
+            if source == dest:
+                continue
+            if not g.arete_existe(source, dest):
+                g.ajouter_arete(source, dest, float(aleatoire.randint(1, 9)))
+            elif aleatoire.random() < 0.5:
+                g.retirer_arete(source, dest)
+            else:
+                g.modifier_ponderation(source, dest, float(aleatoire.randint(1, 9)))
+            for arbre in arbres:
+                self.assertEqual(g.dijkstra(arbre.source)[1], arbre.distances)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from benchmarks import banc, generateurs
+
+
+class GenerateursTest(unittest.TestCase):
+    def test_reproductibles(self):
+        self.assertEqual(generateurs.erdos_renyi(50, graine=3).__str__(),
+                         generateurs.erdos_renyi(50, graine=3).__str__())
+        self.assertNotEqual(generateurs.sans_echelle(50, graine=3).__str__(),
+                            generateurs.sans_echelle(50, graine=4).__str__())
+
+    def test_formes(self):
+        self.assertEqual(2 * 2 * 3 * 4, sum(1 for _ in generateurs.grille(4)._aretes_ponderees()))
+        self.assertEqual(list(range(10)), generateurs.chaine(10).tri_topologique_kahn())
+        self.assertEqual(50, len(generateurs.dag_large(5, 10).tri_topologique_dfs()))
+
+    def test_negatives_sans_cycle_negatif(self):
+        g = generateurs.avec_negatives(60, graine=1)
+        self.assertTrue(any(pond < 0 for _, _, pond in g._aretes_ponderees()))
+        self.assertEqual(g.bellman_ford(0), g.spfa(0))
+
+
+class BancTest(unittest.TestCase):
+    def test_exposant(self):
+        self.assertAlmostEqual(2.0, banc.exposant([10, 100, 1000], [1.0, 100.0, 10000.0]))
+        self.assertIsNone(banc.exposant([10], [1.0]))
+
+    def test_resultat_faux_de_l_algorithme(self):
+        scenario = banc._sur_graphe(lambda n, graine: generateurs.chaine(n), lambda g: [])
+        self.assertEqual(2 * 10 - 1, scenario(10, 0)())
+
+    def test_mesurer_et_comparer(self):
+        mesures = banc.mesurer(["largeur_chaine"], tailles=[50, 100], repetitions=1)
+        self.assertEqual([50, 100], mesures["resultats"]["largeur_chaine"]["tailles"])
+        lignes, regressions = banc.comparer(mesures, mesures)
+        self.assertEqual(2, len(lignes))
+        self.assertEqual([], regressions)
+        plus_lentes = {"resultats": {"largeur_chaine": dict(mesures["resultats"]["largeur_chaine"],
+                                                            temps=[10.0, 10.0])}}
+        self.assertEqual([("largeur_chaine", 50, "temps"), ("largeur_chaine", 100, "temps")],
+                         banc.comparer(mesures, plus_lentes)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from DigraphePondere import DigraphePondere
+
+
+class CacheCheminsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 1.0)])
+        self.cache = self.g.activer_cache(max_entrees=2)
+
+    def test_succes_et_echecs(self):
+        premier = self.g.dijkstra(0)
+        self.assertIs(premier, self.g.dijkstra(0))
+        self.assertEqual({"succes": 1, "echecs": 1, "evictions": 0, "entrees": 1},
+                         {k: v for k, v in self.cache.statistiques().items() if k != "octets"})
+
+    def test_invalidation_par_modification(self):
+        self.assertEqual(4.0, self.g.dijkstra(0)[1][3])
+        self.g.ajouter_arete(1, 3, 0.5)
+        self.assertEqual(2.5, self.g.dijkstra(0)[1][3])
+        self.assertEqual(0, self.cache.succes)
+
+    def test_eviction_lru(self):
+        self.g.rechauffer_cache([0, 1], "dijkstra")
+        self.g.dijkstra(0)
+        self.g.explorer_en_largeur_en_partant_du_sommet(2)
+        self.assertEqual(1, self.cache.evictions)
+        self.g.dijkstra(0)
+        self.assertEqual(2, self.cache.succes)
+
+    def test_limite_en_octets(self):
+        cache = self.g.activer_cache(max_octets=1)
+        self.g.dijkstra(0)
+        self.assertEqual(0, len(cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
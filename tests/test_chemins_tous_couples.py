@@ -0,0 +1,29 @@
+import math
+import unittest
+from DigraphePondere import DigraphePondere, CycleNegatif
+
+
+class CheminsTousCouplesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 1.0)])
+        self.g_neg = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (2, 0, -1.0)])
+        self.g_neg_cycle = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (2, 0, -18.0)])
+
+    def test_sequentiel(self):
+        rangees = dict(self.g.plus_courts_chemins_tous_couples(processus=1))
+        self.assertEqual([0.0, 2.0, 1.0, 4.0], list(rangees[0]))
+        self.assertEqual([math.inf, math.inf, math.inf, 0.0], list(rangees[3]))
+
+    def test_parallele_ponderations_negatives(self):
+        rangees = list(self.g_neg.plus_courts_chemins_tous_couples(processus=2, taille_lot=1))
+        self.assertEqual([0, 1, 2, 3], [source for source, _ in rangees])
+        for source, distances in rangees:
+            self.assertEqual(self.g_neg.bellman_ford(source)[1], list(distances))
+
+    def test_cycle_negatif(self):
+        with self.assertRaises(CycleNegatif):
+            list(self.g_neg_cycle.plus_courts_chemins_tous_couples(processus=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
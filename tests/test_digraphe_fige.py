@@ -0,0 +1,65 @@
+import unittest
+from DigrapheFige import DigrapheFige
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+
+
+class DigrapheFigeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g68c = DigrapheNonPondere(6, [(0, 1), (0, 3), (1, 2), (5, 1), (1, 4), (2, 5), (3, 4), (4, 5)])
+        self.f68c = self.g68c.figer()
+
+    def test_str(self):
+        self.assertEqual(self.g68c.__str__(), self.f68c.__str__())
+
+    def test_consultation(self):
+        self.assertTrue(self.f68c.arete_existe(5, 1))
+        self.assertFalse(self.f68c.arete_existe(1, 5))
+        self.assertEqual(2, self.f68c.arite_entree_du_sommet(5))
+        self.assertEqual(2, self.f68c.arite_sortie_du_sommet(1))
+        self.assertIsNone(self.f68c._inverse)
+        self.assertEqual(2, DigrapheFige(self.f68c.offsets, memoryview(self.f68c.targets)).arite_entree_du_sommet(5))
+        self.f68c.plus_court_chemin_en_largeur(0, 5)
+        self.assertEqual([0, 2, 1, 1, 2, 2], [self.f68c.arite_entree_du_sommet(sommet) for sommet in range(6)])
+
+    def test_arete_existe_sommet_de_forte_arite(self):
+        n = 200
+        g = DigrapheNonPondere(n, [(0, i) for i in range(1, n)] + [(1, 0), (1, 2)])
+        for targets in (g.figer().targets, memoryview(g.figer().targets)):
+            f = DigrapheFige(g.figer().offsets, targets)
+            self.assertTrue(all(f.arete_existe(0, i) for i in range(1, n)))
+            self.assertFalse(f.arete_existe(0, 0))
+            self.assertTrue(f.arete_existe(1, 2))
+            self.assertFalse(f.arete_existe(1, 3))
+
+    def test_algorithmes(self):
+        self.assertEqual(self.g68c.kosaraju(), self.f68c.kosaraju())
+        self.assertEqual(self.g68c.explorer_en_profondeur_le_graphe(), self.f68c.explorer_en_profondeur_le_graphe())
+        self.assertEqual(self.g68c.explorer_en_largeur_en_partant_du_sommet(0),
+                         self.f68c.explorer_en_largeur_en_partant_du_sommet(0))
+
+    def test_modification_interdite(self):
+        with self.assertRaises(TypeError):
+            self.f68c.ajouter_arete(1, 5)
+
+
+class DigraphePondereFigeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 1.0)])
+        self.f = self.g.figer()
+
+    def test_str(self):
+        self.assertEqual(self.g.__str__(), self.f.__str__())
+        self.assertEqual(7.0, self.f.lire_ponderation(0, 3))
+
+    def test_dijkstra_bellman_ford(self):
+        self.assertEqual(self.g.dijkstra(0), self.f.dijkstra(0))
+        self.assertEqual(self.g.bellman_ford(0), self.f.bellman_ford(0))
+
+    def test_graphe_inverse(self):
+        self.assertEqual("0 -->\n1 --> 0(2.0)\n2 --> 0(1.0) -  1(1.0)\n3 --> 0(7.0) -  2(3.0)",
+                         self.f.graphe_inverse().__str__())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import sys
 import unittest
 from DigrapheNonPondere import DigrapheNonPondere
 
@@ -49,10 +50,48 @@ class DigrapheNonPondereInterfaceTest(unittest.TestCase):
         self.g22.retirer_sommet(0)
         self.assertEqual("0 -->", self.g22.__str__())
 
+    def test_retirer_sommet_renumerote(self):
+        self.g68a.retirer_sommet(2)
+        self.assertEqual("0 --> 1 -  2\n1 --> 4 -  3\n2 --> 3\n3 --> 4\n4 -->", self.g68a.__str__())
+
+    def test_retirer_sommet_differe(self):
+        self.g68c.indexer_predecesseurs()
+        self.g68c.retirer_sommet(1, differer=True)
+        self.assertFalse(self.g68c.sommet_existe(1))
+        self.assertEqual(5, self.g68c.nombre_de_sommets())
+        self.assertEqual("0 --> 3\n2 --> 5\n3 --> 4\n4 --> 5\n5 -->", self.g68c.__str__())
+        self.assertEqual([[5], [4], [3], [2], [0]], self.g68c.kosaraju())
+        self.assertEqual([0, 2, 3, 4, 5], sorted(self.g68c.explorer_en_profondeur_le_graphe()))
+        self.assertEqual([0, None, 1, 2, 3, 4], self.g68c.compacter())
+        self.assertEqual("0 --> 2\n1 --> 4\n2 --> 3\n3 --> 4\n4 -->", self.g68c.__str__())
+        self.assertEqual(2, self.g68c.arite_entree_du_sommet(4))
+
     def test_arite_entree(self):
         self.assertEqual(1, self.g22.arite_entree_du_sommet(0))
         self.assertEqual(1, self.g22.arite_sortie_du_sommet(0))
 
+    def test_index_predecesseurs(self):
+        self.g68c.indexer_predecesseurs()
+        self.assertEqual(2, self.g68c.arite_entree_du_sommet(5))
+        self.g68c.ajouter_arete(3, 5)
+        self.g68c.retirer_arete(2, 5)
+        self.assertEqual(2, self.g68c.arite_entree_du_sommet(5))
+        self.assertEqual("0 -->\n1 --> 0 -  5\n2 --> 1\n3 --> 0\n4 --> 1 -  3\n5 --> 4 -  3",
+                         self.g68c.graphe_inverse().__str__())
+
+    def test_ajouter_retirer_aretes(self):
+        self.g21.ajouter_aretes([(1, 0)])
+        self.assertEqual(self.g22str, self.g21.__str__())
+        self.g21.retirer_aretes([(0, 1), (1, 0)])
+        self.assertEqual("0 -->\n1 -->", self.g21.__str__())
+
+    def test_modifications(self):
+        with self.g21.modifications():
+            self.g21.ajouter_sommet()
+            self.g21.ajouter_arete(1, 2)
+            self.g21.ajouter_arete(2, 0)
+        self.assertEqual("0 --> 1\n1 --> 2\n2 --> 0", self.g21.__str__())
+
 
 class DigrapheNonPondereAlgorithmesTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -80,15 +119,60 @@ class DigrapheNonPondereAlgorithmesTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.g68c.tri_topologique_dfs()
 
+    def test_tri_topologique_kahn_68a(self):
+        self.assertEqual([0, 1, 3, 2, 4, 5], self.g68a.tri_topologique_kahn())
+
+    def test_tri_topologique_kahn_68c(self):
+        with self.assertRaises(ValueError):
+            self.g68c.tri_topologique_kahn()
+
+    def test_ordre_topologique_incremental(self):
+        self.g65.maintenir_ordre_topologique()
+        self.g65.ajouter_sommet()
+        self.g65.ajouter_arete(6, 0)
+        self.assertEqual([6, 0, 1, 2, 3, 4, 5], self.g65.ordre_topologique())
+        with self.assertRaises(ValueError):
+            self.g65.ajouter_arete(5, 6)
+        self.assertFalse(self.g65.arete_existe(5, 6))
+
     def test_graphe_inverse(self):
         self.assertEqual("0 -->\n1 --> 0", self.g21.graphe_inverse().__str__())
 
+    def test_vue_inverse_en_lecture_seule(self):
+        g = DigrapheNonPondere(3, [(0, 1), (1, 2)]).indexer_predecesseurs().maintenir_ordre_topologique()
+        version = g.version()
+        inverse = g.graphe_inverse()
+        self.assertEqual([2, 1, 0], inverse.tri_topologique_kahn())
+        with self.assertRaises(TypeError):
+            inverse.ajouter_arete(0, 2)
+        self.assertFalse(g.arete_existe(2, 0))
+        self.assertEqual(version, g.version())
+        self.assertEqual([0, 1, 2], g.ordre_topologique())
+        instantane = inverse.instantane()
+        g.ajouter_arete(0, 2)
+        self.assertTrue(inverse.arete_existe(2, 0))
+        self.assertFalse(instantane.arete_existe(2, 0))
+
     def test_kosaraju_21(self):
         self.assertEqual([[1], [0]], self.g21.kosaraju())
 
     def test_kosaraju_68c(self):
         self.assertEqual([[5, 2, 4, 1], [3], [0]], self.g68c.kosaraju())
 
+    def test_kosaraju_68c_index_predecesseurs(self):
+        self.assertEqual([[5, 2, 4, 1], [3], [0]], self.g68c.indexer_predecesseurs().kosaraju())
+
+    def test_tarjan_68c(self):
+        self.assertEqual([[4, 5, 2, 1], [3], [0]], self.g68c.tarjan())
+
+    def test_chaine_profonde_sans_recursion(self):
+        n = 5000
+        chaine = DigrapheNonPondere(n, [(i, i + 1) for i in range(n - 1)])
+        self.assertEqual(list(range(n - 1, -1, -1)), chaine.tri_topologique_dfs())
+        chaine.ajouter_arete(n - 1, 0)
+        self.assertEqual(1, len(chaine.kosaraju()))
+        self.assertEqual(1, len(chaine.tarjan()))
+
     def test_explorer_en_largeur_le_graphe_21(self):
         self.assertEqual(([None, 0], [0, 1]), self.g21.explorer_en_largeur_en_partant_du_sommet(0))
 
@@ -101,5 +185,49 @@ class DigrapheNonPondereAlgorithmesTest(unittest.TestCase):
                          self.g68c.explorer_en_largeur_en_partant_du_sommet(0))
 
 
+    def test_explorer_en_largeur_cible(self):
+        pred, dist = self.g65.explorer_en_largeur_en_partant_du_sommet(0, cible=2)
+        self.assertEqual([0, 1, 2], dist[:3])
+        self.assertEqual(sys.maxsize, dist[4])
+
+    def test_explorer_en_largeur_multi_sources(self):
+        self.assertEqual(([None, 0, 1, None, 3, 4], [0, 1, 2, 0, 1, 2]),
+                         self.g65.explorer_en_largeur_en_partant_des_sommets([0, 3]))
+
+    def test_plus_court_chemin_en_largeur(self):
+        self.assertEqual([0, 1, 5], self.g68a.plus_court_chemin_en_largeur(0, 5))
+        self.assertEqual([3], self.g68a.plus_court_chemin_en_largeur(3, 3))
+        self.assertIsNone(self.g68a.plus_court_chemin_en_largeur(5, 0))
+        self.assertIsNone(self.g68a._inverses)
+        self.assertEqual([0, 1, 5], self.g68a.indexer_predecesseurs().plus_court_chemin_en_largeur(0, 5))
+        self.assertEqual([0, 1, 5], self.g68a.figer().plus_court_chemin_en_largeur(0, 5))
+
+    def test_iter_largeur(self):
+        pred, dist = self.g68a.explorer_en_largeur_en_partant_du_sommet(0)
+        parcours = list(self.g68a.iter_largeur(0))
+        self.assertEqual((0, None, 0), parcours[0])
+        self.assertEqual([1, 3, 2, 5, 4], [sommet for sommet, _, _ in parcours[1:]])
+        self.assertTrue(all(pred[sommet] == p and dist[sommet] == d for sommet, p, d in parcours[1:]))
+        self.assertEqual([0, 1, 3], [sommet for sommet, _, _ in self.g68a.iter_largeur(0, profondeur_max=1)])
+
+    def test_iter_largeur_interrompu(self):
+        for sommet, predecesseur, profondeur in self.g65.iter_largeur(0):
+            if sommet == 2:
+                break
+        self.assertEqual((2, 1, 2), (sommet, predecesseur, profondeur))
+
+    def test_iter_profondeur(self):
+        self.assertEqual([(0, None, 0), (1, 0, 1), (2, 1, 2), (5, 2, 3), (4, 1, 2), (3, 0, 1)],
+                         list(self.g68a.iter_profondeur(0)))
+        self.assertEqual([3, 4, 5], [sommet for sommet, _, _ in self.g68a.iter_profondeur(3)])
+
+    def test_iter_postordre(self):
+        self.assertEqual(self.g68a.explorer_en_profondeur_le_graphe(),
+                         [sommet for sommet, _, _ in self.g68a.iter_postordre()])
+        self.assertEqual([(5, 2, 3), (2, 1, 2)], list(self.g68c.iter_postordre(0))[:2])
+        self.assertEqual(self.g68c.explorer_le_graphe_en_profondeur_en_partant_du_sommet(1, [False] * 6),
+                         [sommet for sommet, _, _ in self.g68c.iter_postordre(1)])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
+import random
 import unittest
-from DigraphePondere import DigraphePondere
+from DigraphePondere import DigraphePondere, CycleNegatif
 
 
 class DigraphePondereConstructionTest(unittest.TestCase):
@@ -8,6 +9,14 @@ class DigraphePondereConstructionTest(unittest.TestCase):
         self.assertEqual("0 --> 1(23.4)\n1 -->", self.g.__str__())
         self.assertEqual(23.4, self.g.lire_ponderation(0, 1))
 
+    def test_construction_incrementale(self):
+        self.g = DigraphePondere(3)
+        self.g.ajouter_arete(0, 1, 2.5)
+        self.g.ajouter_aretes([(1, 2, 1.0), (2, 0)])
+        self.assertEqual("0 --> 1(2.5)\n1 --> 2(1.0)\n2 --> 0(1.0)", self.g.__str__())
+        self.g.retirer_aretes([(1, 2)])
+        self.assertEqual("0 --> 1(2.5)\n1 -->\n2 --> 0(1.0)", self.g.__str__())
+
 
 class DigraphePondereDijkstraTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -33,3 +42,74 @@ class DigraphePondereDijkstraTest(unittest.TestCase):
     def test_bellmann_ford_4_neg_cycle(self):
         with self.assertRaises(ValueError):
             self.g_neg_cycle.bellman_ford(0)
+
+    def test_graphe_inverse(self):
+        inverse = self.g.graphe_inverse()
+        self.assertEqual(inverse.__str__(), self.g.indexer_predecesseurs().graphe_inverse().__str__())
+        self.assertEqual(3.0, inverse.lire_ponderation(3, 2))
+
+    def test_retirer_sommet(self):
+        self.g.retirer_sommet(1)
+        self.assertEqual("0 --> 2(7.0) -  1(1.0)\n1 --> 2(3.0)\n2 -->", self.g.__str__())
+        pred, dist = self.g.dijkstra(0)
+        self.assertEqual([0.0, 1.0, 4.0], dist)
+
+    def test_bellman_ford_cycle_negatif_rapporte(self):
+        with self.assertRaises(CycleNegatif) as contexte:
+            self.g_neg_cycle.bellman_ford(0)
+        self.assertEqual({0, 1, 2}, set(contexte.exception.cycle))
+
+    def test_spfa(self):
+        self.assertEqual(self.g.bellman_ford(0), self.g.spfa(0))
+        self.assertEqual(([None, 0, 1, 2], [0.0, 2.0, 3.0, 6.0]), self.g_neg.spfa(0))
+
+    def test_spfa_cycle_negatif(self):
+        with self.assertRaises(CycleNegatif) as contexte:
+            self.g_neg_cycle.spfa(0)
+        cycle = contexte.exception.cycle
+        self.assertEqual({0, 1, 2}, set(cycle))
+        self.assertTrue(all(self.g_neg_cycle.arete_existe(cycle[i - 1], cycle[i]) for i in range(len(cycle))))
+
+    def test_dijkstra_cibles(self):
+        pred, dist = self.g.dijkstra(0, cibles=[2])
+        self.assertEqual(1.0, dist[2])
+        self.assertEqual(0, pred[2])
+
+    def test_dijkstra_distance_max(self):
+        pred, dist = self.g.dijkstra(0, distance_max=2.0)
+        self.assertEqual([0.0, 2.0, 1.0], dist[:3])
+        self.assertGreater(dist[3], 2.0)
+
+
+class DigraphePondereAEtoileTest(unittest.TestCase):
+    def setUp(self) -> None:
+        aleatoire = random.Random(14)
+        self.g = DigraphePondere(60)
+        for source in range(60):
+            for dest in aleatoire.sample(range(60), 3):
+                if dest != source and not self.g.arete_existe(source, dest):
+                    self.g.ajouter_arete(source, dest, float(aleatoire.randint(1, 20)))
+
+    def test_a_etoile_sans_heuristique(self):
+        pred, dist = self.g.a_etoile(0, 1)
+        self.assertEqual(self.g.dijkstra(0)[1][1], dist[1])
+
+    def test_reperes_admissibles(self):
+        reperes = self.g.reperes(4)
+        self.assertEqual(4, len(reperes))
+        for arrivee in range(0, 60, 7):
+            distances = self.g.graphe_inverse().dijkstra(arrivee)[1]
+            for sommet in range(60):
+                self.assertLessEqual(reperes(sommet, arrivee), distances[sommet])
+
+    def test_a_etoile_avec_reperes(self):
+        reperes = self.g.reperes(4)
+        for depart, arrivee in [(0, 59), (3, 17), (42, 5), (8, 8)]:
+            attendues = self.g.dijkstra(depart)[1]
+            pred, dist = self.g.a_etoile(depart, arrivee, reperes)
+            self.assertEqual(attendues[arrivee], dist[arrivee])
+            sommet = arrivee
+            while sommet != depart:
+                pond = self.g.lire_ponderation(pred[sommet], sommet)
+                self.assertEqual(attendues[sommet], attendues[pred[sommet]] + pond)
+                sommet = pred[sommet]
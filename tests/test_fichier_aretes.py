@@ -0,0 +1,57 @@
+import gzip
+import os
+import tempfile
+import unittest
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+
+
+class FichierAretesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def ecrire(self, nom, texte, compresser=False):
+        fichier = os.path.join(self.dossier.name, nom)
+        with (gzip.open if compresser else open)(fichier, "wt") as sortie:
+            sortie.write(texte)
+        return fichier
+
+    def test_espaces_et_commentaires(self):
+        fichier = self.ecrire("aretes.txt", "# liste\n0 1\n0\t3\n\n1 2\n% fin\n")
+        g = DigrapheNonPondere.depuis_fichier_aretes(fichier)
+        self.assertEqual("0 --> 1 -  3\n1 --> 2\n2 -->\n3 -->", g.__str__())
+
+    def test_csv_avec_entete_compresse(self):
+        fichier = self.ecrire("aretes.csv.gz", "source,arrivee,poids\n0,1,2.5\n1,2,1.0\n2,0\n", compresser=True)
+        g = DigraphePondere.depuis_fichier_aretes(fichier, entete=True)
+        self.assertEqual("0 --> 1(2.5)\n1 --> 2(1.0)\n2 --> 0(1.0)", g.__str__())
+
+    def test_nombre_de_sommets_impose(self):
+        fichier = self.ecrire("aretes.txt", "0;1\n1;2\n", compresser=True)
+        g = DigrapheNonPondere.depuis_fichier_aretes(fichier, vertices=5, separateur=";")
+        self.assertEqual(5, g.num_vertices)
+
+    def test_ligne_invalide(self):
+        fichier = self.ecrire("aretes.txt", "0 1\n1 x\n")
+        with self.assertRaisesRegex(ValueError, "ligne 2"):
+            DigrapheNonPondere.depuis_fichier_aretes(fichier)
+
+    def test_sommet_negatif(self):
+        fichier = self.ecrire("aretes.txt", "0 1\n-1 0\n2 1\n")
+        with self.assertRaisesRegex(ValueError, "ligne 2"):
+            DigrapheNonPondere.depuis_fichier_aretes(fichier)
+        self.assertFalse(DigrapheNonPondere(3).sommet_existe(-1))
+
+    def test_constructeur_par_generateur(self):
+        g = DigraphePondere(aretes_generalisees=((i, i + 1, float(i)) for i in range(4)))
+        self.assertEqual(5, g.num_vertices)
+        self.assertEqual(3.0, g.lire_ponderation(3, 4))
+        g = DigrapheNonPondere(edges=iter([(3, 0)]))
+        self.assertEqual("0 -->\n1 -->\n2 -->\n3 --> 0", g.__str__())
+
+
+if __name__ == '__main__':
+    unittest.main()
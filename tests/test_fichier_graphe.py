@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from DigrapheFige import DigrapheFige
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+from DigraphePondereFige import DigraphePondereFige
+
+
+class FichierGrapheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        self.fichier = os.path.join(self.dossier.name, "graphe.dgr")
+        self.g68c = DigrapheNonPondere(6, [(0, 1), (0, 3), (1, 2), (5, 1), (1, 4), (2, 5), (3, 4), (4, 5)])
+        self.p = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 1.0)])
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def test_aller_retour_projete(self):
+        self.g68c.sauvegarder(self.fichier)
+        charge = DigrapheNonPondere.charger(self.fichier, verifier=True)
+        self.assertIsInstance(charge, DigrapheFige)
+        self.assertIsInstance(charge.targets, memoryview)
+        self.assertEqual(self.g68c.__str__(), charge.__str__())
+        self.assertEqual(self.g68c.kosaraju(), charge.kosaraju())
+
+    def test_aller_retour_pondere(self):
+        self.p.sauvegarder(self.fichier)
+        for projeter in (True, False):
+            charge = DigrapheNonPondere.charger(self.fichier, projeter)
+            self.assertIsInstance(charge, DigraphePondereFige)
+            self.assertEqual(self.p.__str__(), charge.__str__())
+            self.assertEqual(self.p.dijkstra(0), charge.dijkstra(0))
+
+    def test_sommet_retire(self):
+        self.g68c.retirer_sommet(3, differer=True)
+        self.g68c.sauvegarder(self.fichier, somme_de_controle=False)
+        charge = DigrapheNonPondere.charger(self.fichier, verifier=True)
+        self.assertFalse(charge.sommet_existe(3))
+        self.assertEqual(self.g68c.__str__(), charge.__str__())
+
+    def test_fichier_corrompu(self):
+        self.p.sauvegarder(self.fichier)
+        with open(self.fichier, "r+b") as fichier:
+            fichier.seek(32 + 8 * 5 + 8 * 5)
+            fichier.write(b"\x01")
+        DigrapheNonPondere.charger(self.fichier, projeter=False)
+        with self.assertRaises(ValueError):
+            DigrapheNonPondere.charger(self.fichier, verifier=True)
+        with open(self.fichier, "ab") as fichier:
+            fichier.write(b"\x00")
+        with self.assertRaises(ValueError):
+            DigrapheNonPondere.charger(self.fichier)
+
+    def test_pas_un_digraphe(self):
+        with open(self.fichier, "wb") as fichier:
+            fichier.write(b"rien")
+        with self.assertRaises(ValueError):
+            DigrapheNonPondere.charger(self.fichier)
+
+
+if __name__ == '__main__':
+    unittest.main()
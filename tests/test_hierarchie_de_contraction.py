@@ -0,0 +1,80 @@
+import math
+import os
+import random
+import tempfile
+import unittest
+from DigraphePondere import DigraphePondere
+from HierarchieDeContraction import HierarchieDeContraction
+
+
+class HierarchieDeContractionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        aleatoire = random.Random(15)
+        self.g = DigraphePondere(80)
+        for source in range(80):
+            for dest in aleatoire.sample(range(80), 3):
+                if dest != source and not self.g.arete_existe(source, dest):
+                    self.g.ajouter_arete(source, dest, float(aleatoire.randint(1, 20)))
+        self.hierarchie = self.g.hierarchie_de_contraction()
+
+    def test_distances(self):
+        for depart in range(0, 80, 9):
+            attendues = self.g.dijkstra(depart)[1]
+            for arrivee in range(80):
+                self.assertEqual(attendues[arrivee], self.hierarchie.distance(depart, arrivee))
+
+    def test_chemin_deplie(self):
+        distance, chemin = self.hierarchie.chemin(4, 61)
+        self.assertEqual((4, 61), (chemin[0], chemin[-1]))
+        self.assertEqual(distance, sum(self.g.lire_ponderation(s, d) for s, d in zip(chemin, chemin[1:])))
+        self.assertEqual((0.0, [7]), self.hierarchie.chemin(7, 7))
+
+    def test_inaccessible(self):
+        g = DigraphePondere(3, [(0, 1, 1.0)])
+        hierarchie = g.hierarchie_de_contraction()
+        self.assertEqual((math.inf, None), hierarchie.chemin(1, 0))
+        self.assertEqual(math.inf, hierarchie.distance(0, 2))
+
+    def test_chemin_par_lignes_indexees(self):
+        paires = [(depart, arrivee) for depart in range(0, 80, 9) for arrivee in range(80)]
+        indexee = HierarchieDeContraction(self.hierarchie.rangs, self.hierarchie.montant, self.hierarchie.descendant)
+        indexee._ARITE_INDEXEE = 0
+        self.assertEqual([self.hierarchie.chemin(*paire) for paire in paires],
+                         [indexee.chemin(*paire) for paire in paires])
+        self.assertTrue(indexee._positions[0] and indexee._positions[1])
+
+    def test_boucle(self):
+        g = DigraphePondere(3, [(0, 1, 1.0), (1, 1, 2.0), (1, 2, 1.0)])
+        hierarchie = g.hierarchie_de_contraction()
+        self.assertEqual((2.0, [0, 1, 2]), hierarchie.chemin(0, 2))
+        self.assertEqual(0.0, hierarchie.distance(1, 1))
+
+    def test_sauvegarder_charger(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            fichier = os.path.join(dossier, "index.hdc")
+            self.hierarchie.sauvegarder(fichier)
+            rechargee = HierarchieDeContraction.charger(fichier)
+        self.assertEqual(self.hierarchie._tableaux(), rechargee._tableaux())
+        self.assertEqual(self.hierarchie.chemin(4, 61), rechargee.chemin(4, 61))
+
+    def test_charger_fichier_invalide(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            fichier = os.path.join(dossier, "invalide")
+            with open(fichier, "wb") as sortie:
+                sortie.write(b"rien")
+            self.assertRaises(ValueError, HierarchieDeContraction.charger, fichier)
+
+    def test_charger_fichier_tronque(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            fichier = os.path.join(dossier, "index.hdc")
+            self.hierarchie.sauvegarder(fichier)
+            with open(fichier, "rb") as entree:
+                contenu = entree.read()
+            for longueur in (len(contenu) - 8, 12):
+                with open(fichier, "wb") as sortie:
+                    sortie.write(contenu[:longueur])
+                self.assertRaises(ValueError, HierarchieDeContraction.charger, fichier)
+
+
+if __name__ == '__main__':
+    unittest.main()
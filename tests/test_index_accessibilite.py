@@ -0,0 +1,59 @@
+import random
+import sys
+import unittest
+from DigrapheNonPondere import DigrapheNonPondere
+
+
+class IndexAccessibiliteTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g68c = DigrapheNonPondere(6, [(0, 1), (0, 3), (1, 2), (5, 1), (1, 4), (2, 5), (3, 4), (4, 5)])
+        aleatoire = random.Random(23)
+        self.g = DigrapheNonPondere(80)
+        for source in range(80):
+            for dest in aleatoire.sample(range(80), 2):
+                if dest != source and not self.g.arete_existe(source, dest):
+                    self.g.ajouter_arete(source, dest)
+        self.dag = DigrapheNonPondere(120, {(source, source + aleatoire.randint(1, 30))
+                                            for source in range(119) for _ in range(2) if source + 30 < 120} |
+                                      {(source, 119) for source in range(90, 119)})
+
+    def verifier(self, graphe, index):
+        for source in graphe.sommets():
+            distances = graphe.explorer_en_largeur_en_partant_du_sommet(source)[1]
+            attendues = [distance != sys.maxsize for distance in distances]
+            paires = ((source, dest) for dest in range(graphe.num_vertices))
+            self.assertEqual(attendues, index.atteignables_en_lot(paires))
+
+    def test_fermeture(self):
+        index = self.g68c.index_accessibilite()
+        self.assertIsNotNone(index.fermeture)
+        self.assertTrue(index.atteignable(4, 2))
+        self.assertFalse(index.atteignable(4, 3))
+        self.assertTrue(index.atteignable(3, 3))
+        self.verifier(self.g68c, index)
+        self.verifier(self.g, self.g.index_accessibilite())
+
+    def test_intervalles(self):
+        for graphe in (self.g68c, self.g, self.dag):
+            index = graphe.index_accessibilite(max_octets=0)
+            self.assertIsNone(index.fermeture)
+            self.verifier(graphe, index)
+
+    def test_sommet_retire(self):
+        self.g68c.retirer_sommet(3, differer=True)
+        index = self.g68c.index_accessibilite()
+        self.assertTrue(index.atteignable(0, 4))
+        self.assertEqual([True, False], index.atteignables_en_lot([(0, 5), (5, 0)]))
+        for index in (index, self.g68c.index_accessibilite(max_octets=0)):
+            self.assertRaises(ValueError, index.atteignable, 0, 3)
+            self.assertRaises(ValueError, index.atteignables_en_lot, [(0, 5), (3, 0)])
+            self.assertRaises(ValueError, index.atteignables_en_lot, [(0, -1)])
+
+    def test_parametres_des_intervalles(self):
+        index = self.dag.index_accessibilite(max_octets=0, nombre_d_intervalles=5, graine=7)
+        self.assertEqual(5, len(index.intervalles))
+        self.verifier(self.dag, index)
+
+
+if __name__ == '__main__':
+    unittest.main()
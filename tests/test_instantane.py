@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+from Instantane import Instantane, InstantanePondere
+from RequetesAsynchrones import RequetesAsynchrones
+
+
+class InstantaneTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g68c = DigrapheNonPondere(6, [(0, 1), (0, 3), (1, 2), (5, 1), (1, 4), (2, 5), (3, 4), (4, 5)])
+        self.p = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 1.0)])
+
+    def test_isolation(self):
+        avant = self.g68c.__str__()
+        composantes = self.g68c.kosaraju()
+        instantane = self.g68c.instantane()
+        self.assertIsInstance(instantane, Instantane)
+        self.g68c.ajouter_arete(3, 0)
+        self.g68c.retirer_arete(1, 2)
+        self.g68c.ajouter_sommet()
+        self.assertEqual(avant, instantane.__str__())
+        self.g68c.retirer_sommet(0)
+        self.assertEqual(avant, instantane.__str__())
+        self.assertEqual(composantes, instantane.kosaraju())
+
+    def test_partage_des_listes_intactes(self):
+        instantane = self.g68c.instantane()
+        self.g68c.ajouter_arete(3, 0)
+        self.assertIs(instantane.lists[4], self.g68c.lists[4])
+        self.assertIsNot(instantane.lists[3], self.g68c.lists[3])
+
+    def test_pondere(self):
+        instantane = self.p.instantane()
+        self.assertIsInstance(instantane, InstantanePondere)
+        attendu = self.p.dijkstra(0)
+        self.p.modifier_ponderation(0, 2, 9.0)
+        self.p.indexer_predecesseurs()
+        self.p.retirer_sommet(1, differer=True)
+        self.assertEqual(attendu, instantane.dijkstra(0))
+        self.assertEqual(1, instantane.arite_entree_du_sommet(1))
+        self.assertEqual(2.0, instantane.lire_ponderation(0, 1))
+
+    def test_lecture_seule(self):
+        instantane = self.g68c.instantane()
+        self.assertIs(instantane, instantane.instantane())
+        with self.assertRaises(TypeError):
+            instantane.ajouter_arete(3, 0)
+        with self.assertRaises(TypeError):
+            instantane.retirer_sommet(0)
+
+    def test_lectures_pendant_les_modifications(self):
+        g = DigraphePondere(200, [(i, i + 1, 1.0) for i in range(199)])
+        requetes = RequetesAsynchrones(g)
+        erreurs = []
+
+        def lecteur():
+            for _ in range(50):
+                instantane = requetes.instantane
+                distances = instantane.dijkstra(0)[1]
+                if distances[:instantane.num_vertices] != instantane.dijkstra(0)[1]:
+                    erreurs.append(distances)
+
+        lecteurs = [threading.Thread(target=lecteur) for _ in range(4)]
+        for fil in lecteurs:
+            fil.start()
+        for i in range(150):
+            g.modifier_ponderation(i, i + 1, 2.0)
+            g.ajouter_sommet()
+            requetes.publier()
+        for fil in lecteurs:
+            fil.join()
+        self.assertEqual([], erreurs)
+
+    def test_requetes_asynchrones(self):
+        requetes = RequetesAsynchrones(self.p, ThreadPoolExecutor(2))
+
+        async def interroger():
+            premieres = await requetes.executer("dijkstra", 0)
+            self.p.modifier_ponderation(0, 3, 0.5)
+            encore = await requetes.executer("dijkstra", 0)
+            requetes.publier()
+            nouvelles = await requetes.executer("dijkstra", 0, cibles=[3])
+            return premieres, encore, nouvelles
+
+        premieres, encore, nouvelles = asyncio.run(interroger())
+        self.assertEqual(premieres, encore)
+        self.assertEqual(0.5, nouvelles[1][3])
+        requetes.executeur.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import sys
+import unittest
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+import MatriceCreuse
+
+
+class MatriceCreuseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g68c = DigrapheNonPondere(6, [(0, 1), (0, 3), (1, 2), (5, 1), (1, 4), (2, 5), (3, 4), (4, 5)])
+        self.p = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 1.0)])
+
+    def test_degres(self):
+        self.assertEqual([2, 2, 1, 1, 1, 1], list(self.g68c.degres_sortants()))
+        self.assertEqual([0, 2, 1, 1, 2, 2], list(self.g68c.degres_entrants()))
+        self.assertEqual(list(self.g68c.degres_entrants()), list(self.g68c.figer().degres_entrants()))
+
+    def test_niveaux_en_largeur(self):
+        self.assertEqual(list(self.g68c.explorer_en_largeur_en_partant_du_sommet(0)[1]),
+                         list(self.g68c.niveaux_en_largeur([0])))
+        self.assertEqual([sys.maxsize, 0, 1, sys.maxsize, 1, 2], list(self.g68c.niveaux_en_largeur([1])))
+
+    def test_atteignables(self):
+        self.assertEqual(bytearray([0, 1, 1, 0, 1, 1]), self.g68c.atteignables([4]))
+        self.assertEqual(bytearray([1, 1, 1, 1, 1, 1]), self.g68c.atteignables([0, 4]))
+
+    def test_sommet_retire(self):
+        self.g68c.retirer_sommet(3, differer=True)
+        self.assertEqual([1, 2, 1, 0, 1, 1], list(self.g68c.degres_sortants()))
+        self.assertEqual([0, 2, 1, 0, 1, 2], list(self.g68c.degres_entrants()))
+        self.assertEqual(0, self.g68c.atteignables([0])[3])
+
+    @unittest.skipIf(MatriceCreuse.scipy is not None, "SciPy est installé")
+    def test_sans_scipy(self):
+        with self.assertRaises(ImportError):
+            self.g68c.vers_matrice_creuse()
+
+    @unittest.skipIf(MatriceCreuse.numpy is None or MatriceCreuse.scipy is None, "NumPy et SciPy requis")
+    def test_aller_retour(self):
+        from DigrapheFige import DigrapheFige
+        from DigraphePondereFige import DigraphePondereFige
+        matrice = self.g68c.vers_matrice_creuse()
+        self.assertEqual((6, 6), matrice.shape)
+        self.assertEqual(1, matrice[5, 1])
+        self.assertEqual(self.g68c.__str__(),
+                         DigrapheFige.depuis_matrice_creuse(matrice).__str__())
+        matrice = self.p.vers_matrice_creuse()
+        self.assertEqual(7.0, matrice[0, 3])
+        self.assertEqual(self.p.dijkstra(0), DigraphePondereFige.depuis_matrice_creuse(matrice).dijkstra(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
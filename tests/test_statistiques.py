@@ -0,0 +1,73 @@
+import unittest
+from DigrapheNonPondere import DigrapheNonPondere
+from DigraphePondere import DigraphePondere
+from Statistiques import Statistiques
+
+
+class StatistiquesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = DigraphePondere(4, [(0, 1, 2.0), (1, 2, 1.0), (2, 3, 3.0), (0, 3, 7.0), (0, 2, 1.0)])
+        self.g68c = DigrapheNonPondere(6, [(0, 1), (0, 3), (1, 2), (5, 1), (1, 4), (2, 5), (3, 4), (4, 5)])
+
+    def test_dijkstra(self):
+        statistiques = Statistiques()
+        self.g.dijkstra(0, statistiques=statistiques)
+        self.assertEqual(4, statistiques.sommets_resolus)
+        self.assertEqual(5, statistiques.aretes_relaxees)
+        self.assertEqual(4, statistiques.relaxations_reussies)
+        self.assertEqual(statistiques.relaxations_reussies + 1, statistiques.insertions_file)
+        self.assertEqual(5, statistiques.extractions_file)
+        self.assertEqual(statistiques.insertions_file, statistiques.extractions_file)
+        self.assertEqual({"dijkstra": 1}, statistiques.appels)
+        self.assertIsNone(self.g._statistiques)
+
+    def test_insertions_et_extractions_equilibrees(self):
+        dag = DigrapheNonPondere(5, [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)])
+        for graphe, algorithme in ((self.g, lambda: self.g.spfa(0)), (self.g68c, self.g68c.kosaraju),
+                                   (self.g68c, self.g68c.tarjan), (dag, dag.tri_topologique_dfs),
+                                   (dag, dag.tri_topologique_kahn),
+                                   (self.g68c, lambda: self.g68c.explorer_en_largeur_en_partant_des_sommets([0, 3]))):
+            with graphe.instrumenter() as statistiques:
+                algorithme()
+            self.assertGreater(statistiques.insertions_file, 0)
+            self.assertEqual(statistiques.insertions_file, statistiques.extractions_file)
+
+    def test_desactive_par_defaut(self):
+        statistiques = Statistiques()
+        self.g.dijkstra(0)
+        self.assertEqual(0, statistiques.sommets_resolus)
+
+    def test_gestionnaire_de_contexte(self):
+        with self.g68c.instrumenter() as statistiques:
+            self.g68c.kosaraju()
+            self.g68c.tarjan()
+            self.g68c.explorer_en_largeur_en_partant_du_sommet(0)
+        self.assertEqual({"kosaraju": 1, "tarjan": 1, "explorer_en_largeur": 1}, statistiques.appels)
+        self.assertEqual(4 * 6, statistiques.sommets_resolus)
+        self.assertEqual(4, statistiques.profondeur_pile_max)
+        self.g68c.kosaraju()
+        self.assertEqual(1, statistiques.appels["kosaraju"])
+
+    def test_rappels_par_appel(self):
+        appels = []
+        statistiques = Statistiques(lambda nom, compteurs: appels.append((nom, compteurs)))
+        with self.g.instrumenter(statistiques):
+            self.g.bellman_ford(0)
+            self.g.spfa(0)
+        self.assertEqual(["bellman_ford", "spfa"], [nom for nom, _ in appels])
+        self.assertEqual(statistiques.aretes_relaxees,
+                         appels[0][1]["aretes_relaxees"] + appels[1][1]["aretes_relaxees"])
+        self.assertGreaterEqual(appels[0][1]["duree"], 0.0)
+
+    def test_invariant(self):
+        with self.g68c.instrumenter() as statistiques:
+            self.g68c.ajouter_arete(3, 0)
+            with self.g68c.modifications():
+                self.g68c.ajouter_arete(5, 0)
+                self.g68c.retirer_arete(5, 0)
+        self.assertEqual(2 if __debug__ else 0, statistiques.verifications_invariant)
+        self.assertGreaterEqual(statistiques.temps_invariant, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()